@@ -0,0 +1,26 @@
+"""
+FunDI benchmark suite.
+
+Times hot paths of the library (``scan``, ``resolve``, ``inject``, ``ainject``,
+``debug.tree`` and ``configurable_dependency``) on generated dependency graphs
+and reports time per operation, time per dependency node and memory allocated
+per operation.
+
+Usage::
+
+    # Run all benchmarks
+    python -m benchmarks
+
+    # Run benchmarks whose name contains "inject/"
+    python -m benchmarks -k inject/
+
+    # Store results as baseline (before making changes)
+    python -m benchmarks --save
+
+    # Compare results with stored baseline, exits with status 1 on regressions
+    python -m benchmarks --compare
+
+Baseline is stored in ``benchmarks/baseline.json`` by default.
+Timings depend on machine and interpreter, so baseline is not tracked by git -
+make it on the same machine you compare on.
+"""
@@ -0,0 +1,79 @@
+import os
+import sys
+import argparse
+
+from benchmarks import runner
+from benchmarks.cases import cases
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="FunDI benchmarks")
+    parser.add_argument("-k", dest="pattern", help="run only benchmarks containing pattern")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing samples")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="minimal duration of one sample in seconds"
+    )
+    parser.add_argument(
+        "--save", nargs="?", const=BASELINE, metavar="PATH", help="store results as baseline"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=BASELINE, metavar="PATH", help="compare with baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown before it is reported as regression",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [case for case in cases() if not args.pattern or args.pattern in case.name]
+    if not selected:
+        parser.error(f"no benchmarks match {args.pattern!r}")
+
+    width = max(len(case.name) for case in selected)
+    print(f"{'benchmark':<{width}}  {'median':>10}  {'best':>10}  {'per node':>10}  {'memory':>10}")
+
+    results: list[runner.Result] = []
+    for case in selected:
+        result = runner.measure(case, args.repeat, args.min_time)
+        results.append(result)
+
+        print(
+            f"{result.name:<{width}}  {_format_time(result.median):>10}  "
+            f"{_format_time(result.best):>10}  {_format_time(result.per_node):>10}  "
+            f"{result.memory / 1024:>7.1f} KB"
+        )
+
+    if args.save:
+        runner.save(results, args.save)
+        print(f"\nBaseline stored in {args.save}")
+
+    if args.compare:
+        regressions = runner.compare(results, args.compare, args.tolerance)
+        if regressions:
+            print(f"\nRegressions against {args.compare}:")
+            for regression in regressions:
+                print(
+                    f"  {regression.name} {regression.metric}: "
+                    f"{regression.ratio:.2f}x of baseline"
+                )
+            return 1
+
+        print(f"\nNo regressions against {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
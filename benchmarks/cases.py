@@ -0,0 +1,191 @@
+"""
+Benchmark cases.
+
+Case setup prepares everything operation needs and returns function that
+performs operation given number of times. Operation is always run once
+before measuring, so plans and other lazily built data are already in place.
+"""
+
+import typing
+import asyncio
+import itertools
+import dataclasses
+import contextlib
+import collections.abc
+
+from fundi import (
+    scan,
+    from_,
+    tree,
+    inject,
+    ainject,
+    resolve,
+    specialize,
+    configurable_dependency,
+)
+
+from benchmarks import graphs
+
+Run: typing.TypeAlias = typing.Callable[[int], None]
+
+
+@dataclasses.dataclass
+class Case:
+    name: str
+    # Number of dependency nodes one operation handles, used to report per-node overhead
+    nodes: int
+    setup: typing.Callable[[], Run]
+
+
+def _scan_cases() -> collections.abc.Iterator[Case]:
+    def make(cold: bool) -> Run:
+        def dep(): ...
+
+        def call(
+            a: int,
+            b: str,
+            c: float,
+            d: bytes,
+            e: bool,
+            f: int = 0,
+            g: str = "",
+            *args: typing.Any,
+            h: None = from_(dep),
+            **kwargs: typing.Any,
+        ): ...
+
+        def run(loops: int) -> None:
+            for _ in range(loops):
+                scan(call)
+
+                if cold:
+                    del call.__fundi_info__  # pyright: ignore[reportFunctionMemberAccess]
+
+        return run
+
+    yield Case("scan/cold", 1, lambda: make(True))
+    yield Case("scan/warm", 1, lambda: make(False))
+
+
+def _resolve_cases() -> collections.abc.Iterator[Case]:
+    def make() -> Run:
+        graph = graphs.wide()
+
+        def run(loops: int) -> None:
+            for _ in range(loops):
+                for _ in resolve(graph.scope, graph.info, {}):
+                    pass
+
+        return run
+
+    yield Case("resolve/wide", len(graphs.wide().info.parameters), make)
+
+
+def _inject_cases() -> collections.abc.Iterator[Case]:
+    for make_graph in graphs.GRAPHS:
+
+        def make(make_graph: typing.Callable[..., graphs.Graph] = make_graph) -> Run:
+            graph = make_graph()
+
+            def run(loops: int) -> None:
+                for _ in range(loops):
+                    with contextlib.ExitStack() as stack:
+                        inject(graph.scope, graph.info, stack, override=graph.override)
+
+            return run
+
+        yield Case(f"inject/{make_graph.__name__}", make_graph().nodes, make)
+
+
+def _specialize_cases() -> collections.abc.Iterator[Case]:
+    for make_graph in graphs.GRAPHS:
+
+        def make(make_graph: typing.Callable[..., graphs.Graph] = make_graph) -> Run:
+            graph = make_graph()
+            injector = specialize(graph.info, override=graph.override)
+
+            def run(loops: int) -> None:
+                for _ in range(loops):
+                    with contextlib.ExitStack() as stack:
+                        injector(graph.scope, stack)
+
+            return run
+
+        yield Case(f"specialize/{make_graph.__name__}", make_graph().nodes, make)
+
+
+def _ainject_cases() -> collections.abc.Iterator[Case]:
+    for make_graph, concurrency in itertools.product(graphs.GRAPHS, (False, True)):
+
+        def make(
+            make_graph: typing.Callable[..., graphs.Graph] = make_graph,
+            concurrency: bool = concurrency,
+        ) -> Run:
+            graph = make_graph(async_=True)
+
+            async def run_async(loops: int) -> None:
+                for _ in range(loops):
+                    async with contextlib.AsyncExitStack() as stack:
+                        await ainject(
+                            graph.scope,
+                            graph.info,
+                            stack,
+                            override=graph.override,
+                            concurrency=concurrency,
+                        )
+
+            loop = asyncio.new_event_loop()
+
+            def run(loops: int) -> None:
+                loop.run_until_complete(run_async(loops))
+
+            return run
+
+        prefix = "ainject-concurrent" if concurrency else "ainject"
+        yield Case(f"{prefix}/{make_graph.__name__}", make_graph().nodes, make)
+
+
+def _debug_cases() -> collections.abc.Iterator[Case]:
+    def make() -> Run:
+        graph = graphs.diamond()
+
+        def run(loops: int) -> None:
+            for _ in range(loops):
+                tree(graph.scope, graph.info)
+
+        return run
+
+    yield Case("debug/tree-diamond", graphs.diamond().nodes, make)
+
+
+def _configurable_cases() -> collections.abc.Iterator[Case]:
+    def make(hit: bool) -> Run:
+        @configurable_dependency
+        def configure(value: int, name: str = "name"):
+            def dependency():
+                return value, name
+
+            return dependency
+
+        counter = itertools.count()
+
+        def run(loops: int) -> None:
+            for _ in range(loops):
+                configure(0 if hit else next(counter), name="value")
+
+        return run
+
+    yield Case("configurable/hit", 1, lambda: make(True))
+    yield Case("configurable/miss", 1, lambda: make(False))
+
+
+def cases() -> list[Case]:
+    return [
+        *_scan_cases(),
+        *_resolve_cases(),
+        *_inject_cases(),
+        *_specialize_cases(),
+        *_ainject_cases(),
+        *_debug_cases(),
+        *_configurable_cases(),
+    ]
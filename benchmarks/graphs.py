@@ -0,0 +1,227 @@
+"""
+Dependency graph generators.
+
+Every generator builds fresh callables, so graphs never share scan results
+with each other, and returns ``Graph`` with scanned root callable, scope
+and overrides injection needs, and number of callables one injection calls.
+"""
+
+import typing
+import inspect
+import itertools
+import dataclasses
+import collections.abc
+
+from fundi import scan, from_, Scope, Overrides, CallableInfo
+
+_counter = itertools.count()
+
+
+@dataclasses.dataclass
+class Graph:
+    name: str
+    info: CallableInfo[typing.Any]
+    scope: collections.abc.Mapping[str, typing.Any]
+    # Number of callables called by one injection, including root
+    nodes: int
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None
+
+
+def _signature(parameters: collections.abc.Mapping[str, typing.Any]) -> inspect.Signature:
+    return inspect.Signature(
+        [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=annotation,
+                default=default,
+            )
+            for name, (annotation, default) in parameters.items()
+        ]
+    )
+
+
+def _node(
+    parameters: collections.abc.Mapping[str, typing.Any] | None = None,
+    async_: bool = False,
+    kind: typing.Literal["function", "generator", "context"] = "function",
+) -> typing.Callable[..., typing.Any]:
+    """
+    Create dependency with provided parameters.
+
+    :param parameters: mapping of parameter name to its annotation and default value
+    :param async_: whether dependency should be asynchronous
+    :param kind: whether dependency returns value, yields it or is context manager
+    """
+    signature = _signature(parameters or {})
+    name = f"node_{next(_counter)}"
+
+    if kind == "context":
+
+        class Context:
+            def __init__(self, **kwargs: typing.Any):
+                self.value: int = len(kwargs)
+
+            def __enter__(self) -> int:
+                return self.value
+
+            def __exit__(self, *args: typing.Any) -> None:
+                pass
+
+        class AsyncContext(Context):
+            async def __aenter__(self) -> int:
+                return self.value
+
+            async def __aexit__(self, *args: typing.Any) -> None:
+                pass
+
+        base: type = AsyncContext if async_ else Context
+        return type(name, (base,), {"__signature__": signature})
+
+    call: typing.Callable[..., typing.Any]
+
+    if kind == "generator":
+        if async_:
+
+            async def call(**kwargs: typing.Any) -> typing.Any:
+                yield len(kwargs)
+
+        else:
+
+            def call(**kwargs: typing.Any) -> typing.Any:
+                yield len(kwargs)
+
+    else:
+        if async_:
+
+            async def call(**kwargs: typing.Any) -> typing.Any:
+                return len(kwargs)
+
+        else:
+
+            def call(**kwargs: typing.Any) -> typing.Any:
+                return len(kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    setattr(call, "__signature__", signature)
+    return call
+
+
+def _root(
+    dependencies: collections.abc.Sequence[typing.Callable[..., typing.Any]], async_: bool
+) -> CallableInfo[typing.Any]:
+    return scan(
+        _node(
+            {f"dep_{i}": (int, from_(dep)) for i, dep in enumerate(dependencies)},
+            async_,
+        )
+    )
+
+
+def wide(width: int = 50, async_: bool = False) -> Graph:
+    """
+    Root with ``width`` independent dependencies, each taking value from scope
+    """
+    leaves = [_node({"value": (int, inspect.Parameter.empty)}, async_) for _ in range(width)]
+    return Graph("wide", _root(leaves, async_), {"value": 1}, width + 1)
+
+
+def deep(depth: int = 100, async_: bool = False) -> Graph:
+    """
+    Chain of ``depth`` dependencies, each depending on previous one
+    """
+    dependency = _node({"value": (int, inspect.Parameter.empty)}, async_)
+    for _ in range(depth - 1):
+        dependency = _node({"value": (int, from_(dependency))}, async_)
+
+    return Graph("deep", _root([dependency], async_), {"value": 1}, depth + 1)
+
+
+def diamond(layers: int = 6, width: int = 6, async_: bool = False) -> Graph:
+    """
+    ``layers`` layers of ``width`` dependencies, each depending on every dependency of next layer.
+
+    Every dependency is called once, the rest of its uses are cache hits
+    """
+    layer = [_node({"value": (int, inspect.Parameter.empty)}, async_) for _ in range(width)]
+    for _ in range(layers - 1):
+        parameters = {f"dep_{i}": (int, from_(dep)) for i, dep in enumerate(layer)}
+        layer = [_node(parameters, async_) for _ in range(width)]
+
+    return Graph("diamond", _root(layer, async_), {"value": 1}, layers * width + 1)
+
+
+def cached(fanout: int = 50, async_: bool = False) -> Graph:
+    """
+    Root with ``fanout`` parameters, all depending on the same dependency
+    """
+    dependency = _node({"value": (int, inspect.Parameter.empty)}, async_)
+    return Graph("cached", _root([dependency] * fanout, async_), {"value": 1}, 2)
+
+
+def overridden(width: int = 50, async_: bool = False) -> Graph:
+    """
+    Root with ``width`` dependencies, half of them overridden by values
+    and the other half overridden by other dependencies
+    """
+    leaves = [_node({"value": (int, inspect.Parameter.empty)}, async_) for _ in range(width)]
+
+    override: dict[typing.Callable[..., typing.Any], typing.Any] = {}
+    for i, leaf in enumerate(leaves):
+        if i % 2:
+            override[leaf] = scan(_node({"value": (int, inspect.Parameter.empty)}, async_))
+        else:
+            override[leaf] = i
+
+    return Graph("overridden", _root(leaves, async_), {"value": 1}, width // 2 + 1, override)
+
+
+def frozen_overridden(width: int = 50, async_: bool = False) -> Graph:
+    """
+    The same graph as ``overridden``, with overrides passed as ``Overrides``
+    """
+    graph = overridden(width, async_)
+    graph.name = "frozen_overridden"
+    graph.override = Overrides(graph.override)
+    return graph
+
+
+def typed(width: int = 50, types: int = 50, async_: bool = False) -> Graph:
+    """
+    Root with ``width`` dependencies taking values by type from scope with ``types`` values
+    """
+    classes = [type(f"Type{i}", (), {}) for i in range(types)]
+    scope = Scope({f"value_{i}": class_() for i, class_ in enumerate(classes)})
+
+    leaves = [
+        _node({"value": (classes[i % types], from_(classes[i % types]))}, async_)
+        for i in range(width)
+    ]
+    return Graph("typed", _root(leaves, async_), scope, width + 1)
+
+
+def lifespan(width: int = 50, async_: bool = False) -> Graph:
+    """
+    Root with ``width`` dependencies, alternating generators and context managers
+    """
+    leaves = [
+        _node(
+            {"value": (int, inspect.Parameter.empty)},
+            async_,
+            "generator" if i % 2 else "context",
+        )
+        for i in range(width)
+    ]
+    return Graph("lifespan", _root(leaves, async_), {"value": 1}, width + 1)
+
+
+GRAPHS: list[typing.Callable[..., Graph]] = [
+    wide,
+    deep,
+    diamond,
+    cached,
+    overridden,
+    frozen_overridden,
+    typed,
+    lifespan,
+]
@@ -0,0 +1,152 @@
+"""
+Benchmark runner.
+
+Each case is timed in several samples, every sample runs operation
+enough times to take at least ``min_time`` seconds. Median time of samples
+is used for comparison with baseline, as it is less affected by noise than mean.
+
+Memory is measured separately using ``tracemalloc`` - peak amount of memory
+allocated while performing one operation.
+"""
+
+import gc
+import sys
+import json
+import time
+import platform
+import statistics
+import tracemalloc
+import dataclasses
+import collections.abc
+
+from benchmarks.cases import Case, Run
+
+
+@dataclasses.dataclass
+class Result:
+    name: str
+    nodes: int
+    loops: int
+    # Seconds per operation
+    best: float
+    median: float
+    # Bytes allocated per operation at peak
+    memory: int
+
+    @property
+    def per_node(self) -> float:
+        return self.median / self.nodes
+
+
+@dataclasses.dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def _time(run: Run, loops: int) -> float:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run(loops)
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _calibrate(run: Run, min_time: float) -> int:
+    loops = 1
+    while True:
+        if _time(run, loops) >= min_time:
+            return loops
+
+        loops *= 2
+
+
+def _memory(run: Run) -> int:
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run(1)
+        _, peak = tracemalloc.get_traced_memory()
+        return peak - start
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case: Case, repeat: int = 5, min_time: float = 0.05) -> Result:
+    """
+    Measure time and memory case's operation takes
+
+    :param case: benchmark case
+    :param repeat: number of timing samples
+    :param min_time: minimal duration of one sample in seconds
+    :return: measurement result
+    """
+    run = case.setup()
+    run(1)
+
+    loops = _calibrate(run, min_time)
+    samples = [_time(run, loops) / loops for _ in range(repeat)]
+
+    return Result(
+        name=case.name,
+        nodes=case.nodes,
+        loops=loops,
+        best=min(samples),
+        median=statistics.median(samples),
+        memory=_memory(run),
+    )
+
+
+def save(results: collections.abc.Iterable[Result], path: str) -> None:
+    """
+    Store results as baseline
+    """
+    data = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": {result.name: dataclasses.asdict(result) for result in results},
+    }
+
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def compare(
+    results: collections.abc.Iterable[Result], path: str, tolerance: float
+) -> list[Regression]:
+    """
+    Compare results with baseline stored at path
+
+    :param results: current results
+    :param path: baseline path
+    :param tolerance: allowed relative slowdown (or memory growth) before it is reported as regression
+    :return: regressions found
+    """
+    with open(path) as file:
+        baseline = json.load(file)["results"]
+
+    regressions: list[Regression] = []
+
+    for result in results:
+        if result.name not in baseline:
+            continue
+
+        for metric in ("median", "memory"):
+            expected = baseline[result.name][metric]
+            current = getattr(result, metric)
+
+            if expected and current > expected * (1 + tolerance):
+                regressions.append(Regression(result.name, metric, expected, current))
+
+    return regressions
@@ -0,0 +1,24 @@
+from typing import Generator
+from contextlib import ExitStack
+
+from fundi import from_, inject, scan, lifetime, Container
+
+
+@lifetime("singleton")
+def require_engine() -> Generator[str, None, None]:
+    print("Engine set-up")
+    yield "engine"
+    print("Engine clean-up")
+
+
+def application(engine: str = from_(require_engine)):
+    print(f"Application started with {engine = }")
+
+
+with Container() as container:
+    for _ in range(3):
+        with ExitStack() as stack:
+            # Engine is set up once, on first injection
+            inject({}, scan(application), stack, container=container)
+
+# Engine is cleaned up when container is closed
@@ -1,15 +1,42 @@
 import typing as _typing
 
 from .scan import scan
+from .lazy import Lazy
+from .scope import Scope
 from .from_ import from_
 from . import exceptions
 from .resolve import resolve
-from .debug import tree, order
+from .compile import compile
+from .validate import validate, warmup
+from .overrides import Overrides
+from .memoize import memoize
+from .lifetime import lifetime
+from .blocking import blocking
+from .container import Container
 from .inject import inject, ainject
+from .pool import inject_in_pool
+from .specialize import specialize
+from .batch import inject_many, ainject_many
+from .debug import tree, order, profile, Profile, Timeline
+from .hooks import Hooks, register_hooks, unregister_hooks
 from .configurable import configurable_dependency, MutableConfigurationWarning
 from .util import injection_trace, is_configured, get_configuration, normalize_annotation
 from .virtual_context import virtual_context, VirtualContextProvider, AsyncVirtualContextProvider
-from .types import CallableInfo, TypeResolver, InjectionTrace, R, Parameter, DependencyConfiguration
+from .types import (
+    R,
+    Lifetime,
+    CacheInfo,
+    Parameter,
+    PlanStep,
+    CallableInfo,
+    TypeResolver,
+    LazyResolver,
+    InjectionPlan,
+    InjectionTrace,
+    DependencyStats,
+    CallableReference,
+    DependencyConfiguration,
+)
 
 
 FromType: _typing.TypeAlias = _typing.Annotated[R, TypeResolver]
@@ -17,16 +44,43 @@ FromType: _typing.TypeAlias = _typing.Annotated[R, TypeResolver]
 
 __all__ = [
     "scan",
+    "Scope",
+    "Lazy",
     "tree",
     "order",
+    "profile",
+    "Profile",
+    "Timeline",
     "from_",
     "inject",
+    "compile",
+    "validate",
+    "warmup",
+    "Overrides",
+    "memoize",
+    "blocking",
+    "lifetime",
+    "Container",
+    "Hooks",
+    "register_hooks",
+    "unregister_hooks",
     "resolve",
     "ainject",
+    "inject_many",
+    "ainject_many",
+    "inject_in_pool",
+    "specialize",
+    "PlanStep",
+    "Lifetime",
+    "CacheInfo",
+    "DependencyStats",
+    "CallableReference",
     "Parameter",
     "exceptions",
     "CallableInfo",
     "TypeResolver",
+    "LazyResolver",
+    "InjectionPlan",
     "is_configured",
     "InjectionTrace",
     "virtual_context",
@@ -0,0 +1,315 @@
+"""
+Batch injection.
+
+Dependencies that do not use scope (directly or through their own dependencies)
+have the same result for every scope, so batch injection resolves them once
+per batch and reuses their results for every item. Everything else is resolved
+per item, using item's own exit stack.
+
+Lifespan dependencies (and dependencies that depend on them) are resolved per item
+unless sharing them is requested: a session or transaction usually belongs to one item.
+"""
+
+import typing
+import asyncio
+import contextlib
+import collections
+import collections.abc
+import concurrent.futures
+
+from fundi.compile import compile
+from fundi.inject import inject, ainject
+from fundi.overrides import Overrides, as_overrides
+from fundi.types import CacheKey, CallableInfo, InjectionPlan, PlanStep
+
+if typing.TYPE_CHECKING:
+    from fundi.hooks import Hooks
+    from fundi.container import Container
+
+__all__ = ["inject_many", "ainject_many"]
+
+
+def _shareable(plan: InjectionPlan, known: dict[int, bool], lifespan: bool) -> bool:
+    """
+    Check whether neither callable of plan, nor its dependencies use scope
+    (or are lifespan dependencies, if ``lifespan`` is False).
+
+    :param plan: injection plan
+    :param known: results of already checked plans, by plan id
+    :param lifespan: whether lifespan dependencies can be shared
+    :return: whether result of plan can be shared
+    """
+    pending = [plan]
+
+    while pending:
+        current = pending[-1]
+        if id(current) in known:
+            pending.pop()
+            continue
+
+        unchecked = [
+            step.plan
+            for step in current.steps
+            if step.plan is not None and id(step.plan) not in known
+        ]
+        if unchecked:
+            pending.extend(unchecked)
+            continue
+
+        pending.pop()
+        info = current.info
+        known[id(current)] = (lifespan or not (info.generator or info.context)) and all(
+            step.op != PlanStep.SCOPE
+            and step.op != PlanStep.LAZY
+            and (step.plan is None or known[id(step.plan)])
+            for step in current.steps
+        )
+
+    return known[id(plan)]
+
+
+def _shared_dependencies(
+    info: CallableInfo[typing.Any],
+    overrides: Overrides | None = None,
+    container: "Container | None" = None,
+    lifespan: bool = False,
+) -> list[CallableInfo[typing.Any]]:
+    """
+    Find dependencies of callable that can be resolved once for any scope.
+
+    These are cached dependencies that neither they, nor their dependencies use scope
+    (or are lifespan dependencies, unless ``lifespan`` is True).
+    Only outermost such dependencies are returned - their dependencies are resolved with them.
+
+    :param info: callable information
+    :param overrides: dependency overrides
+    :param container: container singleton dependencies are resolved by
+    :param lifespan: whether lifespan dependencies can be shared
+    :return: dependencies in resolution order
+    """
+    shared: list[CallableInfo[typing.Any]] = []
+    known: dict[int, bool] = {}
+
+    # Plans whose dependencies are searched, and their remaining steps
+    root = compile(info, overrides)
+    path: list[collections.abc.Iterator[PlanStep]] = [iter(root.steps)]
+    visited = {id(root)}
+
+    while path:
+        for step in path[-1]:
+            if step.op != PlanStep.ENTER:
+                continue
+
+            dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+            plan = typing.cast(InjectionPlan, step.plan)
+
+            if dependency.lifetime == "singleton" and container is not None:
+                # Container resolves it once anyway
+                continue
+
+            if dependency.use_cache and _shareable(plan, known, lifespan):
+                shared.append(dependency)
+                continue
+
+            if id(plan) not in visited:
+                visited.add(id(plan))
+                path.append(iter(plan.steps))
+                break
+        else:
+            path.pop()
+
+    return shared
+
+
+def inject_many(
+    scopes: collections.abc.Iterable[collections.abc.Mapping[str, typing.Any]],
+    info: CallableInfo[typing.Any],
+    stack: contextlib.ExitStack,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    container: "Container | None" = None,
+    hooks: "Hooks | None" = None,
+    share_lifespan: bool = False,
+) -> collections.abc.Iterator[typing.Any]:
+    """
+    Synchronously inject dependencies into callable for every scope.
+
+    Dependencies that do not use scope are resolved once, on the first item.
+    Lifespan dependencies are resolved per item, unless ``share_lifespan`` is True -
+    then shared ones are torn down with ``stack``. Every item gets its own exit stack,
+    that is closed when the next result is requested (or iteration stops).
+
+    :param scopes: containers with contextual values, one per item
+    :param info: callable information
+    :param stack: exit stack of batch, to handle lifespan dependencies shared by items
+    :param override: override dependencies
+    :param container: application-level container of singleton dependencies
+    :param hooks: hooks to call in addition to registered ones
+    :param share_lifespan: whether to resolve lifespan dependencies that do not use scope
+        once per batch too
+    :return: iterator of callable results, in order of scopes
+    """
+    if info.async_:
+        raise RuntimeError("Cannot process async functions in synchronous injection")
+
+    overrides = as_overrides(override)
+    shared: dict[CacheKey, typing.Any] | None = None
+
+    for scope in scopes:
+        if shared is None:
+            shared = {}
+
+            for dependency in _shared_dependencies(info, overrides, container, share_lifespan):
+                if dependency.key not in shared:
+                    shared[dependency.key] = inject(
+                        scope, dependency, stack, shared, overrides, container, hooks
+                    )
+
+        with contextlib.ExitStack() as item_stack:
+            result = inject(scope, info, item_stack, dict(shared), overrides, container, hooks)
+            # Item is done - its teardown runs without exception, even if iteration stops here
+            item_stack = item_stack.pop_all()
+
+        try:
+            yield result
+        finally:
+            item_stack.close()
+
+
+async def _iterate(
+    scopes: (
+        collections.abc.Iterable[collections.abc.Mapping[str, typing.Any]]
+        | collections.abc.AsyncIterable[collections.abc.Mapping[str, typing.Any]]
+    ),
+) -> collections.abc.AsyncIterator[collections.abc.Mapping[str, typing.Any]]:
+    if isinstance(scopes, collections.abc.AsyncIterable):
+        async for scope in scopes:
+            yield scope
+    else:
+        for scope in scopes:
+            yield scope
+
+
+async def _finish(
+    item_stack: contextlib.AsyncExitStack, task: asyncio.Future[typing.Any]
+) -> tuple[contextlib.AsyncExitStack, typing.Any]:
+    """
+    Wait for item injection result.
+
+    If injection failed - item teardown runs with its exception,
+    otherwise exit stack with item teardown is returned along with result
+    """
+    async with item_stack:
+        result = await task
+        return item_stack.pop_all(), result
+
+
+async def ainject_many(
+    scopes: (
+        collections.abc.Iterable[collections.abc.Mapping[str, typing.Any]]
+        | collections.abc.AsyncIterable[collections.abc.Mapping[str, typing.Any]]
+    ),
+    info: CallableInfo[typing.Any],
+    stack: contextlib.AsyncExitStack,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    limit: int = 1,
+    concurrency: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+    offload: bool = False,
+    container: "Container | None" = None,
+    hooks: "Hooks | None" = None,
+    share_lifespan: bool = False,
+) -> collections.abc.AsyncIterator[typing.Any]:
+    """
+    Asynchronously inject dependencies into callable for every scope.
+
+    Dependencies that do not use scope are resolved once, on the first item.
+    Lifespan dependencies are resolved per item, unless ``share_lifespan`` is True -
+    then shared ones are torn down with ``stack``. Up to ``limit`` items are injected
+    at the same time, results are yielded in order of scopes. Every item gets
+    its own exit stack, that is closed when the next result is requested (or iteration stops).
+
+    :param scopes: containers with contextual values, one per item
+    :param info: callable information
+    :param stack: exit stack of batch, to handle lifespan dependencies shared by items
+    :param override: override dependencies
+    :param limit: maximal number of items injected at the same time
+    :param concurrency: whether to run independent dependencies of item concurrently
+    :param executor: executor to run blocking synchronous dependencies in
+    :param offload: whether to run all synchronous dependencies in executor
+    :param container: application-level container of singleton dependencies
+    :param hooks: hooks to call in addition to registered ones
+    :param share_lifespan: whether to resolve lifespan dependencies that do not use scope
+        once per batch too
+    :return: asynchronous iterator of callable results, in order of scopes
+    """
+    if limit < 1:
+        raise ValueError("Limit must be positive")
+
+    overrides = as_overrides(override)
+    shared: dict[CacheKey, typing.Any] | None = None
+
+    # Items being injected, in order of scopes
+    pending: collections.deque[tuple[contextlib.AsyncExitStack, asyncio.Future[typing.Any]]] = (
+        collections.deque()
+    )
+
+    try:
+        async for scope in _iterate(scopes):
+            if shared is None:
+                shared = {}
+
+                for dependency in _shared_dependencies(info, overrides, container, share_lifespan):
+                    if dependency.key not in shared:
+                        shared[dependency.key] = await ainject(
+                            scope,
+                            dependency,
+                            stack,
+                            shared,
+                            overrides,
+                            executor=executor,
+                            offload=offload,
+                            container=container,
+                            hooks=hooks,
+                        )
+
+            item_stack = contextlib.AsyncExitStack()
+            task = asyncio.ensure_future(
+                ainject(
+                    scope,
+                    info,
+                    item_stack,
+                    dict(shared),
+                    overrides,
+                    concurrency=concurrency,
+                    executor=executor,
+                    offload=offload,
+                    container=container,
+                    hooks=hooks,
+                )
+            )
+            pending.append((item_stack, task))
+
+            if len(pending) >= limit:
+                item_stack, result = await _finish(*pending.popleft())
+
+                try:
+                    yield result
+                finally:
+                    await item_stack.aclose()
+
+        while pending:
+            item_stack, result = await _finish(*pending.popleft())
+
+            try:
+                yield result
+            finally:
+                await item_stack.aclose()
+
+    finally:
+        # Iteration stopped early - stop items that are still being injected
+        for item_stack, task in pending:
+            task.cancel()
+
+        for item_stack, task in pending:
+            await asyncio.gather(task, return_exceptions=True)
+            await item_stack.aclose()
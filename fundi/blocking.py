@@ -0,0 +1,31 @@
+import typing
+from dataclasses import replace
+
+from fundi.scan import scan
+from fundi.types import CallableInfo
+
+C = typing.TypeVar("C", bound=typing.Callable[..., typing.Any])
+
+
+def blocking(call: C) -> C:
+    """
+    Mark synchronous dependency as blocking.
+
+    ``ainject`` runs blocking dependencies (including entering and exiting
+    their context if they are generators or context managers) in executor,
+    so they do not block event loop. Synchronous injection is not affected.
+
+    :param call: synchronous dependency
+    :return: the same dependency
+    """
+    info = scan(call)
+
+    if info.async_:
+        raise ValueError("Only synchronous dependencies can be marked as blocking")
+
+    setattr(call, "__fundi_blocking__", True)
+
+    if hasattr(call, "__fundi_info__"):
+        setattr(call, "__fundi_info__", replace(info, blocking=True))
+
+    return call
@@ -0,0 +1,212 @@
+import sys
+import time
+import typing
+import weakref
+import threading
+import collections
+
+from fundi.types import CacheInfo
+
+__all__ = ["BoundedCache"]
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class BoundedCache(typing.Generic[K, V]):
+    """
+    Thread-safe cache with optional size limit, time to live and weak values.
+
+    - ``max_size`` - least recently used entries are evicted when cache grows over it;
+    - ``ttl`` - entries are evicted once they are older than this amount of seconds;
+    - ``weak`` - values are not kept alive by cache, entries disappear with their values;
+    - ``max_cost`` - least recently used entries are evicted when total cost of entries grows over it,
+      cost of entry is computed using ``cost`` function (``sys.getsizeof`` by default).
+
+    Evicted values that are still referenced elsewhere are remembered weakly,
+    so looking them up again returns the very same object, instead of reporting
+    a miss and letting caller create new one. ``reuse_evicted=False`` disables this -
+    evicted values are never returned again.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        weak: bool = False,
+        timer: typing.Callable[[], float] = time.monotonic,
+        max_cost: int | None = None,
+        cost: typing.Callable[[V], int] | None = None,
+        reuse_evicted: bool = True,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size should be positive")
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl should be positive")
+
+        if max_cost is not None and max_cost < 1:
+            raise ValueError("max_cost should be positive")
+
+        if weak and (max_size is not None or ttl is not None or max_cost is not None):
+            raise ValueError("Weak cache can not be limited by size, time to live or cost")
+
+        self.max_size: int | None = max_size
+        self.ttl: float | None = ttl
+        self.weak: bool = weak
+        self.timer: typing.Callable[[], float] = timer
+        self.max_cost: int | None = max_cost
+        self.cost: typing.Callable[[V], int] = cost or sys.getsizeof
+        self.reuse_evicted: bool = reuse_evicted
+
+        self._lock: threading.Lock = threading.Lock()
+        # Value, the time it expires at and its cost
+        self._entries: collections.OrderedDict[K, tuple[V, float | None, int]] = (
+            collections.OrderedDict()
+        )
+        self._total_cost: int = 0
+        self._weak_entries: weakref.WeakValueDictionary[K, typing.Any] = (
+            weakref.WeakValueDictionary()
+        )
+        self._evicted: weakref.WeakValueDictionary[K, typing.Any] = weakref.WeakValueDictionary()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._weak_entries) if self.weak else len(self._entries)
+
+    def _expires(self) -> float | None:
+        return None if self.ttl is None else self.timer() + self.ttl
+
+    def _evict(self, key: K, value: V) -> None:
+        self.evictions += 1
+
+        if not self.reuse_evicted:
+            return
+
+        try:
+            self._evicted[key] = value
+        except TypeError:  # Value can not be weakly referenced
+            pass
+
+    def _lookup(self, key: K) -> tuple[bool, V | None]:
+        if self.weak:
+            value = self._weak_entries.get(key)
+            return value is not None, value
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires, cost = entry
+
+            if expires is None or expires > self.timer():
+                self._entries.move_to_end(key)
+                return True, value
+
+            del self._entries[key]
+            self._total_cost -= cost
+            self._evict(key, value)
+            # Only values still referenced outside of cache are brought back below
+            del entry, value
+
+        value = self._evicted.pop(key, None)
+        if value is not None:
+            # Value is still in use - bring it back, so it keeps its identity
+            self._store(key, value)
+            return True, value
+
+        return False, None
+
+    def _store(self, key: K, value: V) -> None:
+        if self.weak:
+            self._weak_entries[key] = value
+            return
+
+        cost = 0
+        if self.max_cost is not None:
+            cost = self.cost(value)
+
+            if cost > self.max_cost:
+                # Would evict everything else and still not fit
+                return
+
+        self._entries[key] = (value, self._expires(), cost)
+        self._entries.move_to_end(key)
+        self._total_cost += cost
+
+        while (self.max_size is not None and len(self._entries) > self.max_size) or (
+            self.max_cost is not None and self._total_cost > self.max_cost
+        ):
+            evicted_key, (evicted, _, evicted_cost) = self._entries.popitem(last=False)
+            self._total_cost -= evicted_cost
+            self._evict(evicted_key, evicted)
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        """
+        Get value from cache.
+
+        :param key: cache key
+        :return: whether value was found and value itself
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+            return found, value
+
+    def peek(self, key: K) -> tuple[bool, V | None]:
+        """
+        Get value from cache without affecting statistics.
+
+        :param key: cache key
+        :return: whether value was found and value itself
+        """
+        with self._lock:
+            return self._lookup(key)
+
+    def get_or_set(self, key: K, value: V) -> V:
+        """
+        Store value in cache, unless other value was stored under the same key already.
+
+        :param key: cache key
+        :param value: value to store
+        :return: value stored in cache
+        """
+        with self._lock:
+            found, existing = self._lookup(key)
+            if found:
+                return typing.cast(V, existing)
+
+            self._store(key, value)
+            return value
+
+    def clear(self) -> None:
+        """
+        Remove all values and reset statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._weak_entries.clear()
+            self._evicted.clear()
+            self._total_cost = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get cache statistics
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self),
+                max_size=self.max_size,
+                cost=self._total_cost,
+                max_cost=self.max_cost,
+            )
@@ -0,0 +1,140 @@
+import typing
+import collections.abc
+
+from fundi.overrides import Overrides
+from fundi.exceptions import CyclicDependencyError
+from fundi.types import CallableInfo, InjectionPlan, OverrideShape, Parameter, PlanStep
+
+_MISSING = object()
+
+# Plans kept per callable for distinct override shapes. Shapes of overrides made per call
+# (e.g. by overriding with freshly scanned dependency every time) never repeat,
+# so oldest plans are dropped instead of piling up
+_MAX_PLANS = 64
+
+
+def compile(info: CallableInfo[typing.Any], overrides: Overrides | None = None) -> InjectionPlan:
+    """
+    Compile dependency graph of callable into injection plan.
+
+    Plan is a topologically ordered list of steps: dependency is entered
+    before the step that calls it. Dependencies are entered by their own plans,
+    so every callable in graph is compiled once. Plan is stored in ``CallableInfo.plan``,
+    already built plans of dependencies are reused when building plans of their dependants.
+
+    If overrides are provided - they are applied to plan: overriding dependencies are
+    placed instead of overridden ones, and dependencies overridden by values are
+    not resolved at all. Such plans are stored in ``CallableInfo.plans`` by override shape,
+    up to 64 plans per callable - the oldest ones are dropped first.
+
+    :param info: callable information
+    :param overrides: dependency overrides
+    :return: injection plan
+    """
+    plan = _compiled(info, overrides)
+    if plan is None:
+        plan = _compile(info, overrides)
+
+    return plan
+
+
+def _compiled(info: CallableInfo[typing.Any], overrides: Overrides | None) -> InjectionPlan | None:
+    if not overrides:
+        return info.plan
+
+    return info.plans.get(overrides.shape)
+
+
+def _store(info: CallableInfo[typing.Any], shape: OverrideShape, plan: InjectionPlan) -> None:
+    # Shape refers to overriding dependencies by id. Plan the overriding dependency
+    # is applied in refers to it, so its id can not be reused while plan is stored.
+    # Plans it is not applied in do not depend on it at all
+    plans = info.plans
+    for oldest in list(plans)[: len(plans) - _MAX_PLANS + 1]:
+        plans.pop(oldest, None)
+
+    plans[shape] = plan
+
+
+def _compile(info: CallableInfo[typing.Any], overrides: Overrides | None) -> InjectionPlan:
+    # Callables being compiled: callable information, its remaining parameters,
+    # its steps so far and step that enters it
+    path: list[
+        tuple[
+            CallableInfo[typing.Any],
+            collections.abc.Iterator[Parameter],
+            list[PlanStep],
+            PlanStep | None,
+        ]
+    ] = [(info, iter(info.parameters), [], None)]
+    calls_in_path = {id(info.call)}
+
+    while True:
+        current, parameters, steps, enter = path[-1]
+
+        for parameter in parameters:
+            dependency = parameter.from_
+
+            if dependency is None:
+                steps.append(PlanStep(PlanStep.SCOPE, parameter))
+                continue
+
+            # Lazy dependency is resolved by its handle, overrides are applied by it too
+            if parameter.lazy:
+                steps.append(
+                    PlanStep(
+                        PlanStep.LAZY,
+                        parameter,
+                        dependency,
+                        scoped=any(p.from_ is None for p in dependency.parameters),
+                    )
+                )
+                continue
+
+            if overrides is not None:
+                overriding = overrides.get(dependency.call, _MISSING)
+
+                if overriding is not _MISSING:
+                    if not isinstance(overriding, CallableInfo):
+                        steps.append(PlanStep(PlanStep.VALUE, parameter, dependency))
+                        continue
+
+                    dependency = typing.cast(CallableInfo[typing.Any], overriding)
+
+            step = PlanStep(
+                PlanStep.ENTER,
+                parameter,
+                dependency,
+                _compiled(dependency, overrides),
+                scoped=any(p.from_ is None for p in dependency.parameters),
+            )
+            steps.append(step)
+
+            if step.plan is not None:
+                continue
+
+            if id(dependency.call) in calls_in_path:
+                infos = [entry[0] for entry in path]
+                start = next(i for i, entry in enumerate(infos) if entry.call is dependency.call)
+                raise CyclicDependencyError(infos[start:] + [dependency])
+
+            path.append((dependency, iter(dependency.parameters), [], step))
+            calls_in_path.add(id(dependency.call))
+            break
+
+        else:
+            steps.append(PlanStep(PlanStep.CALL))
+            plan = InjectionPlan(current, steps)
+
+            if not overrides:
+                current.plan = plan
+            else:
+                _store(current, overrides.shape, plan)
+
+            path.pop()
+            calls_in_path.discard(id(current.call))
+
+            if enter is None:
+                return plan
+
+            enter.plan = plan
@@ -0,0 +1,340 @@
+"""
+Concurrent asynchronous injection.
+
+Dependency graph is first walked in the same order ``ainject`` would use,
+without calling anything. This decides which dependencies will actually
+run (cache hits and overrides are taken into account), and what they
+depend on. Then every dependency is run in its own task as soon as its
+own dependencies are ready.
+"""
+
+import sys
+import typing
+import asyncio
+import functools
+import contextlib
+import contextvars
+import collections.abc
+import concurrent.futures
+from types import TracebackType
+
+from fundi.lazy import Lazy
+from fundi.compile import compile
+from fundi.scope import bind_parameter
+from fundi.resolve import resolve_from_scope
+from fundi.overrides import Overrides, as_overrides
+from fundi.hooks import Hooks, active_hooks, call_hooked
+from fundi.teardown import Teardown, as_teardown
+from fundi.util import call_sync, call_async, call_in_executor, add_injection_trace
+from fundi.types import CacheKey, CallableInfo, InjectionPlan, Parameter, PlanStep
+
+if typing.TYPE_CHECKING:
+    from fundi.container import Container
+
+__all__ = ["ainject_concurrently"]
+
+
+class _Node:
+    """
+    Dependency call scheduled by ``_schedule``
+    """
+
+    __slots__: tuple[str, ...] = (
+        "info",
+        "parent",
+        "values",
+        "parameter",
+        "dependencies",
+        "stack",
+        "task",
+        "scope",
+        "context",
+    )
+
+    def __init__(
+        self,
+        info: CallableInfo[typing.Any],
+        parent: "_Node | None",
+        parameter: Parameter | None,
+    ):
+        self.info: CallableInfo[typing.Any] = info
+        self.parent: _Node | None = parent
+        self.parameter: Parameter | None = parameter
+        self.values: dict[str, typing.Any] = {}
+        self.dependencies: list[tuple[str, _Node]] = []
+        self.stack: Teardown | None = None
+        self.task: asyncio.Future[typing.Any] | None = None
+        # Scope to resolve singleton dependency with
+        self.scope: collections.abc.Mapping[str, typing.Any] | None = None
+        # Context lifespan dependency is set up and torn down in
+        self.context: contextvars.Context | None = None
+
+    def add_trace(self, exception: Exception) -> None:
+        node: _Node | None = self
+        while node is not None:
+            add_injection_trace(exception, node.info, node.values)
+            node = node.parent
+
+
+def _schedule(
+    scope: collections.abc.Mapping[str, typing.Any],
+    info: CallableInfo[typing.Any],
+    stack: Teardown,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    overrides: Overrides | None,
+    container: "Container | None",
+    hooks: Hooks | None,
+    executor: concurrent.futures.Executor | None,
+    offload: bool,
+) -> tuple[_Node, list[_Node]]:
+    """
+    Walk injection plan of callable in sequential injection order.
+
+    Scope values, cached values and overriding values are resolved immediately,
+    dependencies that need to be called are returned as nodes in the order
+    sequential injection would call them.
+
+    :return: root node and dependency nodes
+    """
+    root = node = _Node(info, None, None)
+    nodes: list[_Node] = []
+    claimed: dict[CacheKey, _Node] = {}
+
+    node_scope = scope
+    steps = compile(info, overrides).steps
+    index = 0
+
+    # Dependants waiting for their dependencies, along with their scope, plan steps
+    # and the plan position to continue from once dependency is scheduled
+    frames: list[tuple[_Node, collections.abc.Mapping[str, typing.Any], list[PlanStep], int]] = []
+
+    try:
+        while True:
+            step = steps[index]
+            index += 1
+
+            if step.op == PlanStep.SCOPE:
+                param = typing.cast(Parameter, step.parameter)
+                node.values[param.name] = resolve_from_scope(node_scope, param, node.info)
+                continue
+
+            if step.op == PlanStep.ENTER:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+
+                if dependency.lifetime == "singleton" and container is not None:
+                    # Singleton is resolved by container, together with its dependencies
+                    child = _Node(dependency, node, param)
+                    child.scope = bind_parameter(scope, param) if step.scoped else scope
+                    nodes.append(child)
+                    node.dependencies.append((param.name, child))
+                    continue
+
+                if dependency.use_cache:
+                    if dependency.key in claimed:
+                        node.dependencies.append((param.name, claimed[dependency.key]))
+
+                        if hooks is not None:
+                            hooks.on_cache_hit(dependency)
+                        continue
+
+                    if dependency.key in cache:
+                        node.values[param.name] = cache[dependency.key]
+
+                        if hooks is not None:
+                            hooks.on_cache_hit(dependency)
+                        continue
+
+                frames.append((node, node_scope, steps, index))
+                node = _Node(dependency, node, param)
+                node_scope = bind_parameter(scope, param) if step.scoped else scope
+                steps = typing.cast(InjectionPlan, step.plan).steps
+                index = 0
+
+                if hooks is not None:
+                    hooks.on_resolve_start(dependency)
+                continue
+
+            if step.op == PlanStep.VALUE:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+                node.values[param.name] = typing.cast(Overrides, overrides)[dependency.call]
+                continue
+
+            if step.op == PlanStep.LAZY:
+                param = typing.cast(Parameter, step.parameter)
+                node.values[param.name] = Lazy(
+                    typing.cast(CallableInfo[typing.Any], step.dependency),
+                    bind_parameter(scope, param) if step.scoped else scope,
+                    stack,
+                    cache,
+                    overrides,
+                    container,
+                    hooks,
+                    executor,
+                    offload,
+                )
+                continue
+
+            if node is root:
+                return root, nodes
+
+            nodes.append(node)
+
+            if node.info.use_cache:
+                claimed[node.info.key] = node
+
+            child = node
+            node, node_scope, steps, index = frames.pop()
+            node.dependencies.append((typing.cast(Parameter, child.parameter).name, child))
+
+    except Exception as exc:
+        if hooks is not None:
+            hooks.on_error(node.info, exc)
+
+        node.add_trace(exc)
+        raise
+
+
+async def _call(
+    node: _Node,
+    stack: Teardown,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    overrides: Overrides | None,
+    executor: concurrent.futures.Executor | None,
+    offload: bool,
+    container: "Container | None",
+    hooks: Hooks | None,
+) -> typing.Any:
+    for name, dependency in node.dependencies:
+        node.values[name] = await typing.cast(asyncio.Future[typing.Any], dependency.task)
+
+    info = node.info
+
+    if node.scope is not None:
+        container = typing.cast("Container", container)
+
+        try:
+            return await container.aresolve(node.scope, info, overrides, executor, offload, hooks)
+        except Exception as exc:
+            # Singleton's own trace is added by container
+            if node.parent is not None:
+                node.parent.add_trace(exc)
+            raise
+
+    try:
+        if hooks is not None:
+            value = await call_hooked(hooks, stack, info, node.values, executor, offload)
+        elif info.async_:
+            value = await call_async(stack, info, node.values)
+        elif offload or info.blocking:
+            value = await call_in_executor(stack, info, node.values, executor)
+        else:
+            value = call_sync(stack, info, node.values)
+    except Exception as exc:
+        if hooks is not None:
+            hooks.on_error(info, exc)
+
+        node.add_trace(exc)
+        raise
+
+    if node.parent is not None and info.use_cache:
+        cache[info.key] = value
+
+    return value
+
+
+def _start(
+    coroutine: collections.abc.Coroutine[typing.Any, typing.Any, typing.Any],
+    context: contextvars.Context | None,
+) -> asyncio.Future[typing.Any]:
+    if context is None or sys.version_info < (3, 11):
+        return asyncio.ensure_future(coroutine)
+
+    return asyncio.get_running_loop().create_task(coroutine, context=context)
+
+
+async def _exit_in_context(
+    stack: Teardown,
+    context: contextvars.Context | None,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    tb: TracebackType | None,
+) -> bool:
+    """
+    Tear down lifespan dependency in the context it was set up in
+    """
+    return await _start(stack.__aexit__(exc_type, exc_value, tb), context)
+
+
+async def ainject_concurrently(
+    scope: collections.abc.Mapping[str, typing.Any],
+    info: CallableInfo[typing.Any],
+    stack: contextlib.AsyncExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    executor: concurrent.futures.Executor | None = None,
+    offload: bool = False,
+    container: "Container | None" = None,
+    hooks: Hooks | None = None,
+) -> typing.Any:
+    """
+    Asynchronously inject dependencies into callable,
+    running independent dependencies concurrently.
+
+    Every dependency still runs at most once per injection (unless caching is disabled for it).
+    Lifespan dependencies are registered in exit stack in the same order
+    sequential injection would register them, regardless of the order they finished in.
+
+    :param scope: container with contextual values
+    :param info: callable information
+    :param stack: exit stack to properly handle generator dependencies
+    :param cache: dependency cache
+    :param override: override dependencies
+    :param executor: executor to run blocking synchronous dependencies in
+    :param offload: whether to run all synchronous dependencies in executor
+    :param container: application-level container of singleton dependencies
+    :param hooks: hooks to call in addition to registered ones
+    :return: result of callable
+    """
+    overrides = as_overrides(override)
+    hooks = active_hooks(hooks, info)
+
+    if hooks is not None:
+        hooks.on_resolve_start(info)
+
+    teardown = as_teardown(stack)
+
+    root, nodes = _schedule(
+        scope, info, teardown, cache, overrides, container, hooks, executor, offload
+    )
+
+    for node in nodes:
+        node_stack = teardown
+        if node.info.context or node.info.generator:
+            node_stack = node.stack = Teardown(async_=True)
+            node.context = contextvars.copy_context()
+
+        node.task = _start(
+            _call(node, node_stack, cache, overrides, executor, offload, container, hooks),
+            node.context,
+        )
+
+    tasks = [typing.cast(asyncio.Future[typing.Any], node.task) for node in nodes]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        for node in nodes:
+            if node.stack is not None:
+                teardown.push_async_exit(
+                    functools.partial(_exit_in_context, node.stack, node.context)
+                )
+
+    return await _call(root, teardown, cache, overrides, executor, offload, container, hooks)
@@ -4,6 +4,7 @@ import functools
 
 from fundi.scan import scan
 from fundi.util import callable_str
+from fundi.cache import BoundedCache
 from fundi.types import R, DependencyConfiguration
 
 P = typing.ParamSpec("P")
@@ -13,17 +14,62 @@ class MutableConfigurationWarning(UserWarning):
     pass
 
 
-def configurable_dependency(configurator: typing.Callable[P, R]) -> typing.Callable[P, R]:
+@typing.overload
+def configurable_dependency(
+    configurator: typing.Callable[P, R],
+    /,
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    weak: bool = False,
+) -> typing.Callable[P, R]: ...
+
+
+@typing.overload
+def configurable_dependency(
+    *, max_size: int | None = None, ttl: float | None = None, weak: bool = False
+) -> typing.Callable[[typing.Callable[P, R]], typing.Callable[P, R]]: ...
+
+
+def configurable_dependency(
+    configurator: typing.Callable[P, R] | None = None,
+    /,
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    weak: bool = False,
+) -> typing.Callable[P, R] | typing.Callable[[typing.Callable[P, R]], typing.Callable[P, R]]:
     """
     Create dependency configurator that caches configured dependencies.
     This helps FunDI cache resolver understand that dependency already executed, if it was.
 
+    Can be used as ``@configurable_dependency`` or with cache options
+    ``@configurable_dependency(max_size=128)``. Cache is unbounded by default.
+
+    Configurator gets ``cache_info()`` method, that returns cache statistics,
+    and ``cache_clear()`` method, that clears cache.
+
     Note: Calls with mutable arguments will not be stored in cache and warning would be shown
 
     :param configurator: Original dependency configurator
+    :param max_size: maximal number of configured dependencies to keep,
+        least recently used ones are evicted first
+    :param ttl: number of seconds configured dependencies are kept for
+    :param weak: do not keep configured dependencies alive,
+        they are removed from cache once nothing else references them
     :return: cache aware dependency configurator
     """
-    dependencies: dict[frozenset[tuple[str, typing.Any]], R] = {}
+    if configurator is None:
+        BoundedCache(max_size, ttl, weak)  # Validate options as soon as possible
+
+        def decorator(configurator: typing.Callable[P, R]) -> typing.Callable[P, R]:
+            return configurable_dependency(configurator, max_size=max_size, ttl=ttl, weak=weak)
+
+        return decorator
+
+    dependencies: BoundedCache[frozenset[tuple[str, typing.Any]], R] = BoundedCache(
+        max_size, ttl, weak
+    )
     info = scan(configurator)
 
     if info.async_:
@@ -31,21 +77,21 @@ def configurable_dependency(configurator: typing.Callable[P, R]) -> typing.Calla
 
     @functools.wraps(configurator)
     def cached_dependency_generator(*args: typing.Any, **kwargs: typing.Any) -> R:
-        use_cache = True
         values = info.build_values(*args, **kwargs)
         key: frozenset[tuple[str, typing.Any]] | None = None
 
         try:
             key = frozenset(values.items())
 
-            if key in dependencies:
-                return dependencies[key]
+            found, dependency = dependencies.get(key)
+            if found:
+                return typing.cast(R, dependency)
         except TypeError:
             warnings.warn(
                 f"Can't cache dependency created via {callable_str(configurator)}: configured with unhashable arguments",
                 MutableConfigurationWarning,
             )
-            use_cache = False
+            key = None
 
         dependency = configurator(*args, **kwargs)
         setattr(
@@ -54,9 +100,13 @@ def configurable_dependency(configurator: typing.Callable[P, R]) -> typing.Calla
             DependencyConfiguration(configurator=info, values=values),
         )
 
-        if use_cache and key is not None:
-            dependencies[key] = dependency
+        if key is not None:
+            # Other thread may have configured the same dependency meanwhile
+            dependency = dependencies.get_or_set(key, dependency)
 
         return dependency
 
+    setattr(cached_dependency_generator, "cache_info", dependencies.info)
+    setattr(cached_dependency_generator, "cache_clear", dependencies.clear)
+
     return cached_dependency_generator
@@ -0,0 +1,202 @@
+import typing
+import asyncio
+import threading
+import contextlib
+import collections.abc
+import concurrent.futures
+
+from fundi.hooks import Hooks
+from fundi.inject import inject, ainject
+from fundi.types import CacheKey, CallableInfo
+
+__all__ = ["Container"]
+
+_MISSING = object()
+
+
+class Container:
+    """
+    Application-level storage of singleton dependencies.
+
+    Singleton dependency (see ``fundi.lifetime``) runs once per container,
+    no matter how many injections, threads or tasks require it at the same time.
+    Its result is reused by every injection that gets this container,
+    and its teardown (if it is generator or context manager) runs when container is closed.
+
+    Singletons are resolved using scope of injection that required them first,
+    so they should depend only on other singletons and values that are the same for every injection.
+    Without container singleton dependencies behave like ``request`` ones.
+
+    Usage::
+
+        async with Container() as container:
+            ...
+            await ainject(scope, info, stack, container=container)
+    """
+
+    def __init__(self):
+        self.stack: contextlib.ExitStack = contextlib.ExitStack()
+        self.async_stack: contextlib.AsyncExitStack = contextlib.AsyncExitStack()
+
+        self._lock: threading.Lock = threading.Lock()
+        self._values: dict[CacheKey, typing.Any] = {}
+        self._futures: dict[CacheKey, concurrent.futures.Future[typing.Any]] = {}
+        self._async_used: bool = False
+
+    def __contains__(self, call: typing.Callable[..., typing.Any]) -> bool:
+        return CacheKey(call) in self._values
+
+    def _claim(self, key: CacheKey) -> tuple[bool, concurrent.futures.Future[typing.Any]]:
+        """
+        Get future of singleton value, and whether caller should resolve it
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return False, future
+
+            future = self._futures[key] = concurrent.futures.Future()
+            return True, future
+
+    def _resolved(
+        self, key: CacheKey, future: concurrent.futures.Future[typing.Any], value: typing.Any
+    ) -> None:
+        with self._lock:
+            self._values[key] = value
+
+        future.set_result(value)
+
+    def _failed(
+        self, key: CacheKey, future: concurrent.futures.Future[typing.Any], exc: BaseException
+    ) -> None:
+        # Let next injection try again
+        with self._lock:
+            del self._futures[key]
+
+        future.set_exception(exc)
+
+    def resolve(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any],
+        info: CallableInfo[typing.Any],
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+        hooks: Hooks | None = None,
+    ) -> typing.Any:
+        """
+        Get singleton value, synchronously injecting it if it was not yet resolved.
+
+        :param scope: container with contextual values
+        :param info: singleton dependency information
+        :param override: override dependencies
+        :param hooks: hooks to call in addition to registered ones
+        :return: singleton value
+        """
+        value = self._values.get(info.key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        owner, future = self._claim(info.key)
+        if not owner:
+            return future.result()
+
+        try:
+            value = inject(scope, info, self.stack, override=override, container=self, hooks=hooks)
+        except BaseException as exc:
+            self._failed(info.key, future, exc)
+            raise
+
+        self._resolved(info.key, future, value)
+        return value
+
+    async def aresolve(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any],
+        info: CallableInfo[typing.Any],
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+        executor: concurrent.futures.Executor | None = None,
+        offload: bool = False,
+        hooks: Hooks | None = None,
+    ) -> typing.Any:
+        """
+        Get singleton value, asynchronously injecting it if it was not yet resolved.
+
+        :param scope: container with contextual values
+        :param info: singleton dependency information
+        :param override: override dependencies
+        :param executor: executor to run blocking synchronous dependencies in
+        :param offload: whether to run all synchronous dependencies in executor
+        :param hooks: hooks to call in addition to registered ones
+        :return: singleton value
+        """
+        value = self._values.get(info.key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        owner, future = self._claim(info.key)
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        self._async_used = True
+
+        try:
+            value = await ainject(
+                scope,
+                info,
+                self.async_stack,
+                override=override,
+                executor=executor,
+                offload=offload,
+                container=self,
+                hooks=hooks,
+            )
+        except BaseException as exc:
+            self._failed(info.key, future, exc)
+            raise
+
+        self._resolved(info.key, future, value)
+        return value
+
+    def _reset(self) -> None:
+        self._values.clear()
+        self._futures.clear()
+        self._async_used = False
+        self.stack = contextlib.ExitStack()
+        self.async_stack = contextlib.AsyncExitStack()
+
+    def close(self) -> None:
+        """
+        Run teardown of singleton dependencies and forget their values
+        """
+        if self._async_used:
+            raise RuntimeError(
+                "Container has asynchronously resolved singletons, use aclose() to close it"
+            )
+
+        try:
+            self.stack.close()
+        finally:
+            self._reset()
+
+    async def aclose(self) -> None:
+        """
+        Run teardown of singleton dependencies and forget their values
+        """
+        try:
+            await self.async_stack.aclose()
+        finally:
+            try:
+                self.stack.close()
+            finally:
+                self._reset()
+
+    def __enter__(self) -> "Container":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Container":
+        return self
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.aclose()
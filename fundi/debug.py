@@ -1,8 +1,18 @@
+import os
+import json
+import time
+import random
 import typing
+import operator
+import threading
+import contextlib
+import dataclasses
 import collections.abc
 
+from fundi.util import callable_str
 from fundi.inject import injection_impl
-from fundi.types import CacheKey, CallableInfo
+from fundi.hooks import Hooks, register_hooks, unregister_hooks
+from fundi.types import CacheKey, CallableInfo, DependencyStats
 
 
 def tree(
@@ -23,16 +33,24 @@ def tree(
     if cache is None:
         cache = {}
 
-    gen = injection_impl(scope, info, cache, None)
+    # Dependants waiting for their dependencies' trees
+    generators = [injection_impl(scope, info, cache, None)]
 
     value = None
 
     while True:
-        inner_scope, inner_info, more = gen.send(value)
-        if not more:
-            return {"call": inner_info.call, "values": inner_scope}
+        inner_scope, inner_info, more = generators[-1].send(value)
 
-        value = tree(inner_scope, inner_info, cache)
+        if more:
+            generators.append(injection_impl(inner_scope, inner_info, cache, None))
+            value = None
+            continue
+
+        value = {"call": inner_info.call, "values": inner_scope}
+
+        generators.pop()
+        if not generators:
+            return value
 
 
 def order(
@@ -53,15 +71,352 @@ def order(
     if cache is None:
         cache = {}
 
-    gen = injection_impl(scope, info, cache, None)
-
-    order_: list[typing.Callable[..., typing.Any]] = []
+    # Dependants waiting for their dependencies, with order of their own dependencies
+    levels: list[
+        tuple[
+            collections.abc.Generator[typing.Any, typing.Any, None],
+            list[typing.Callable[..., typing.Any]],
+        ]
+    ] = [(injection_impl(scope, info, cache, None), [])]
 
-    value = None
     while True:
-        inner_scope, inner_info, more = gen.send(value)
-        if not more:
+        gen, order_ = levels[-1]
+        inner_scope, inner_info, more = gen.send(None)
+
+        if more:
+            levels.append((injection_impl(inner_scope, inner_info, cache, None), []))
+            continue
+
+        levels.pop()
+        if not levels:
             return order_
 
-        order_.extend(order(inner_scope, inner_info, cache))
-        order_.append(inner_info.call)
+        dependant_order = levels[-1][1]
+        dependant_order.extend(order_)
+        dependant_order.append(inner_info.call)
+
+
+class Profile(Hooks):
+    """
+    Aggregated cost of dependencies over many injections.
+
+    Collects ``DependencyStats`` of every dependency callable (including injected callable itself)
+    of sampled injections. Use it as hooks for single injection (``inject(..., hooks=profile)``)
+    or register it for every injection using ``profile()``.
+
+    :param sample_rate: share of injections to profile, from 0 to 1
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+
+        self.sample_rate: float = sample_rate
+        # Number of profiled injections
+        self.injections: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._stats: dict[typing.Callable[..., typing.Any], DependencyStats] = {}
+
+    def on_injection_start(self, info: CallableInfo[typing.Any]) -> Hooks | None:
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return None
+
+        with self._lock:
+            self.injections += 1
+
+        return _ProfileSession(self)
+
+    def record(
+        self,
+        call: typing.Callable[..., typing.Any],
+        calls: int = 0,
+        hits: int = 0,
+        cumulative_time: float = 0.0,
+        self_time: float = 0.0,
+        teardown_time: float = 0.0,
+    ) -> None:
+        """
+        Add measurements to statistics of dependency callable
+        """
+        with self._lock:
+            stats = self._stats.get(call)
+            if stats is None:
+                stats = self._stats[call] = DependencyStats(call)
+
+            stats.calls += calls
+            stats.hits += hits
+            stats.cumulative_time += cumulative_time
+            stats.self_time += self_time
+            stats.teardown_time += teardown_time
+
+    def stats(self, sort_by: str = "cumulative_time") -> list[DependencyStats]:
+        """
+        Get statistics of profiled dependencies.
+
+        :param sort_by: ``DependencyStats`` attribute to sort statistics by, in descending order
+        :return: copies of dependency statistics
+        """
+        with self._lock:
+            stats = [dataclasses.replace(stats) for stats in self._stats.values()]
+
+        return sorted(stats, key=operator.attrgetter(sort_by), reverse=True)
+
+    def report(self, sort_by: str = "cumulative_time", limit: int | None = None) -> str:
+        """
+        Format statistics of profiled dependencies as a table.
+
+        :param sort_by: ``DependencyStats`` attribute to sort statistics by, in descending order
+        :param limit: maximal number of dependencies to include
+        :return: report text
+        """
+        lines = [
+            f"{self.injections} profiled injections",
+            f"{'calls':>8} {'hits':>8} {'hit ratio':>9} {'cumulative':>12} "
+            f"{'self':>12} {'teardown':>12}  dependency",
+        ]
+
+        for stats in self.stats(sort_by)[:limit]:
+            lines.append(
+                f"{stats.calls:>8} {stats.hits:>8} {stats.hit_ratio:>9.1%} "
+                f"{stats.cumulative_time:>12.6f} {stats.self_time:>12.6f} "
+                f"{stats.teardown_time:>12.6f}  {callable_str(stats.call)}"
+            )
+
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """
+        Forget collected statistics
+        """
+        with self._lock:
+            self._stats.clear()
+            self.injections = 0
+
+
+class _ProfileSession(Hooks):
+    """
+    Measures one injection for ``Profile``
+    """
+
+    def __init__(self, profile: Profile):
+        self.profile: Profile = profile
+        # Start times of callables being resolved, called and torn down.
+        # The same callable can be in progress multiple times if it is not cached
+        self.resolving: dict[typing.Callable[..., typing.Any], list[float]] = {}
+        self.calling: dict[typing.Callable[..., typing.Any], list[float]] = {}
+        self.tearing: dict[typing.Callable[..., typing.Any], list[float]] = {}
+
+    def on_resolve_start(self, info: CallableInfo[typing.Any]) -> None:
+        self.resolving.setdefault(info.call, []).append(time.perf_counter())
+
+    def on_call_start(
+        self, info: CallableInfo[typing.Any], values: collections.abc.Mapping[str, typing.Any]
+    ) -> None:
+        self.calling.setdefault(info.call, []).append(time.perf_counter())
+
+    def on_call_end(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        now = time.perf_counter()
+        self.profile.record(
+            info.call,
+            calls=1,
+            cumulative_time=now - self.resolving[info.call].pop(),
+            self_time=now - self.calling[info.call].pop(),
+        )
+
+    def on_cache_hit(self, info: CallableInfo[typing.Any]) -> None:
+        self.profile.record(info.call, hits=1)
+
+    def on_teardown_start(self, info: CallableInfo[typing.Any]) -> None:
+        self.tearing.setdefault(info.call, []).append(time.perf_counter())
+
+    def on_teardown_end(self, info: CallableInfo[typing.Any]) -> None:
+        self.profile.record(
+            info.call, teardown_time=time.perf_counter() - self.tearing[info.call].pop()
+        )
+
+
+@contextlib.contextmanager
+def profile(sample_rate: float = 1.0) -> collections.abc.Generator[Profile, None, None]:
+    """
+    Profile injections made inside context.
+
+    Usage::
+
+        with profile(sample_rate=0.01) as profiler:
+            serve()
+
+        print(profiler.report())
+
+    :param sample_rate: share of injections to profile, from 0 to 1
+    :return: profile that collects statistics
+    """
+    profiler = Profile(sample_rate)
+    register_hooks(profiler)
+
+    try:
+        yield profiler
+    finally:
+        unregister_hooks(profiler)
+
+
+class Timeline(Hooks):
+    """
+    Timeline of injection in Chrome trace event format.
+
+    Records span of every dependency resolution (from start of resolving its dependencies
+    until it returned), span of its call and span of its teardown, and cache hits as instant events.
+    Spans that overlap without nesting (dependencies run concurrently) are put on separate tracks.
+
+    Timeline can be opened in ``chrome://tracing``, `Perfetto <https://ui.perfetto.dev>`_
+    or `speedscope <https://www.speedscope.app>`_.
+
+    Usage::
+
+        timeline = Timeline()
+        await ainject(scope, info, stack, hooks=timeline, concurrency=True)
+        ...
+        timeline.dump("injection.json")
+    """
+
+    def __init__(self):
+        self.origin: int = time.perf_counter_ns()
+        # Recorded spans: name, category, start and end times in nanoseconds and arguments
+        self.spans: list[tuple[str, str, int, int, dict[str, typing.Any]]] = []
+        # Recorded cache hits: name and time in nanoseconds
+        self.hits: list[tuple[str, int]] = []
+
+        # Start times of callables being resolved, called and torn down.
+        # The same callable can be in progress multiple times if it is not cached
+        self._open: dict[tuple[str, typing.Callable[..., typing.Any]], list[int]] = {}
+
+    @staticmethod
+    def _name(call: typing.Callable[..., typing.Any]) -> str:
+        # Partials and callable instances have no qualified name
+        return getattr(call, "__qualname__", None) or repr(call)
+
+    def _start(self, category: str, info: CallableInfo[typing.Any]) -> None:
+        self._open.setdefault((category, info.call), []).append(time.perf_counter_ns())
+
+    def _end(self, category: str, info: CallableInfo[typing.Any], **args: typing.Any) -> None:
+        started = self._open.get((category, info.call))
+        if not started:
+            return
+
+        self.spans.append(
+            (self._name(info.call), category, started.pop(), time.perf_counter_ns(), args)
+        )
+
+    def on_resolve_start(self, info: CallableInfo[typing.Any]) -> None:
+        self._start("resolve", info)
+
+    def on_call_start(
+        self, info: CallableInfo[typing.Any], values: collections.abc.Mapping[str, typing.Any]
+    ) -> None:
+        self._start("call", info)
+
+    def on_call_end(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        self._end("call", info)
+        self._end("resolve", info)
+
+    def on_cache_hit(self, info: CallableInfo[typing.Any]) -> None:
+        self.hits.append((self._name(info.call), time.perf_counter_ns()))
+
+    def on_teardown_start(self, info: CallableInfo[typing.Any]) -> None:
+        self._start("teardown", info)
+
+    def on_teardown_end(self, info: CallableInfo[typing.Any]) -> None:
+        self._end("teardown", info)
+
+    def on_error(self, info: CallableInfo[typing.Any], exception: Exception) -> None:
+        self._end("call", info, error=repr(exception))
+        self._end("resolve", info, error=repr(exception))
+
+    def _tracks(self) -> list[int]:
+        """
+        Assign spans to tracks, so spans of each track nest into each other
+        """
+        tracks: list[int] = [0] * len(self.spans)
+        # End times of spans open on each track, innermost last
+        open_: list[list[int]] = []
+
+        for index in sorted(
+            range(len(self.spans)), key=lambda i: (self.spans[i][2], -self.spans[i][3])
+        ):
+            _, _, start, end, _ = self.spans[index]
+
+            for track, ends in enumerate(open_):
+                while ends and ends[-1] <= start:
+                    ends.pop()
+
+                if not ends or ends[-1] >= end:
+                    break
+            else:
+                track, ends = len(open_), []
+                open_.append(ends)
+
+            ends.append(end)
+            tracks[index] = track
+
+        return tracks
+
+    def chrome_trace(self) -> dict[str, typing.Any]:
+        """
+        Get timeline in Chrome trace event format.
+
+        :return: JSON-serializable trace
+        """
+        pid = os.getpid()
+        tracks = self._tracks()
+
+        events: list[dict[str, typing.Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": track,
+                "args": {"name": f"track {track}"},
+            }
+            for track in sorted(set(tracks) | {0})
+        ]
+
+        for (name, category, start, end, args), track in zip(self.spans, tracks):
+            events.append(
+                {
+                    "name": name if category == "resolve" else f"{category} {name}",
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": pid,
+                    "tid": track,
+                    "args": args,
+                }
+            )
+
+        for name, timestamp in self.hits:
+            events.append(
+                {
+                    "name": f"cache hit {name}",
+                    "cat": "cache",
+                    "ph": "i",
+                    "s": "t",
+                    "ts": (timestamp - self.origin) / 1000,
+                    "pid": pid,
+                    "tid": 0,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, file: str | os.PathLike[str] | typing.IO[str]) -> None:
+        """
+        Write timeline in Chrome trace event format.
+
+        :param file: path or text file to write timeline to
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w") as stream:
+                json.dump(self.chrome_trace(), stream)
+        else:
+            json.dump(self.chrome_trace(), file)
@@ -24,3 +24,28 @@ class GeneratorExitedTooEarly(Exception):
         super().__init__(f"Generator exited too early")
         self.function: FunctionType = function
         self.generator: AsyncGenerator[typing.Any] | Generator[typing.Any, None, None] = generator
+
+
+class CyclicDependencyError(RecursionError):
+    def __init__(self, cycle: list[CallableInfo[typing.Any]]):
+        super().__init__(
+            "Dependency cycle detected: " + " -> ".join(callable_str(info.call) for info in cycle)
+        )
+        self.cycle: list[CallableInfo[typing.Any]] = cycle
+
+
+class AsyncDependencyError(RuntimeError):
+    def __init__(self, info: CallableInfo[typing.Any]):
+        super().__init__(
+            f"Cannot process async function {callable_str(info.call)} in synchronous injection"
+        )
+        self.info: CallableInfo[typing.Any] = info
+
+
+class GraphValidationError(ValueError):
+    def __init__(self, problems: list[Exception]):
+        super().__init__(
+            f"Dependency graph has {len(problems)} problem(s):\n"
+            + "\n".join(f"- {problem}" for problem in problems)
+        )
+        self.problems: list[Exception] = problems
@@ -2,12 +2,15 @@ import typing
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
 from fundi.scan import scan
-from fundi.types import CallableInfo, TypeResolver
+from fundi.types import CallableInfo, Lifetime, LazyResolver, TypeResolver
 
 
 def from_(
-    dependency: type | typing.Callable[..., typing.Any], caching: bool = True
-) -> TypeResolver | CallableInfo[typing.Any]:
+    dependency: type | typing.Callable[..., typing.Any],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: bool = False,
+) -> TypeResolver | LazyResolver | CallableInfo[typing.Any]:
     """
     Use callable or type as dependency for parameter of function
 
@@ -17,6 +20,10 @@ def from_(
 
     :param dependency: function dependency
     :param caching: Whether to use cached result of this callable or not
+    :param lifetime: lifetime of dependency result for this usage,
+        overrides lifetime declared using ``fundi.lifetime``
+    :param lazy: whether to inject ``fundi.lazy.Lazy`` handle that resolves dependency
+        on first use instead of its value
     :return: callable information
     """
     if isinstance(dependency, type) and not issubclass(
@@ -24,4 +31,12 @@ def from_(
     ):
         return TypeResolver(dependency)
 
-    return scan(dependency, caching=caching)
+    info = scan(dependency)
+    if lifetime is not None:
+        info = info.with_lifetime(lifetime)
+
+    info = info.with_caching(caching)
+    if lazy:
+        return LazyResolver(info)
+
+    return info
@@ -3,26 +3,106 @@ from typing import overload
 from collections.abc import Generator, AsyncGenerator, Awaitable
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
+from fundi.lazy import Lazy
+from fundi.types import Lifetime
+
 T = typing.TypeVar("T", bound=type)
 R = typing.TypeVar("R")
 
 @overload
 def from_(
-    dependency: typing.Callable[..., AbstractContextManager[R]], caching: bool = True
+    dependency: typing.Callable[..., AbstractContextManager[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
+) -> R: ...
+@overload
+def from_(
+    dependency: typing.Callable[..., AbstractAsyncContextManager[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
+) -> R: ...
+@overload
+def from_(
+    dependency: T,
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
+) -> T: ...
+@overload
+def from_(
+    dependency: typing.Callable[..., Generator[R, None, None]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
 ) -> R: ...
 @overload
 def from_(
-    dependency: typing.Callable[..., AbstractAsyncContextManager[R]], caching: bool = True
+    dependency: typing.Callable[..., AsyncGenerator[R, None]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
 ) -> R: ...
 @overload
-def from_(dependency: T, caching: bool = True) -> T: ...
+def from_(
+    dependency: typing.Callable[..., Awaitable[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
+) -> R: ...
 @overload
 def from_(
-    dependency: typing.Callable[..., Generator[R, None, None]], caching: bool = True
+    dependency: typing.Callable[..., R],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    lazy: typing.Literal[False] = False,
 ) -> R: ...
 @overload
-def from_(dependency: typing.Callable[..., AsyncGenerator[R, None]], caching: bool = True) -> R: ...
+def from_(
+    dependency: typing.Callable[..., AbstractContextManager[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
+@overload
+def from_(
+    dependency: typing.Callable[..., AbstractAsyncContextManager[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
+@overload
+def from_(
+    dependency: typing.Callable[..., Generator[R, None, None]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
 @overload
-def from_(dependency: typing.Callable[..., Awaitable[R]], caching: bool = True) -> R: ...
+def from_(
+    dependency: typing.Callable[..., AsyncGenerator[R, None]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
 @overload
-def from_(dependency: typing.Callable[..., R], caching: bool = True) -> R: ...
+def from_(
+    dependency: typing.Callable[..., Awaitable[R]],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
+@overload
+def from_(
+    dependency: typing.Callable[..., R],
+    caching: bool = True,
+    lifetime: Lifetime | None = None,
+    *,
+    lazy: typing.Literal[True],
+) -> Lazy[R]: ...
@@ -0,0 +1,277 @@
+"""
+Injection hooks.
+
+Hooks observe injection without changing it: what is resolved, called,
+taken from cache, torn down and what fails. Hooks are registered globally
+with ``register_hooks`` or passed to a single injection as ``hooks``.
+
+Injection picks hooks once, before it starts. When there are none,
+injection runs exactly as it would without hooks support.
+"""
+
+import typing
+import threading
+import contextlib
+import collections.abc
+import concurrent.futures
+
+from fundi.types import CallableInfo
+from fundi.teardown import Teardown
+from fundi.util import call_sync, call_async, call_in_executor
+
+__all__ = ["Hooks", "register_hooks", "unregister_hooks", "active_hooks"]
+
+
+class Hooks:
+    """
+    Injection hooks.
+
+    Subclass it and override methods of events you are interested in,
+    the rest do nothing. Hooks are called synchronously, in the thread
+    (or event loop) injection runs in, so they should be fast.
+    """
+
+    def on_injection_start(self, info: CallableInfo[typing.Any]) -> "Hooks | None":
+        """
+        Called when injection starts, before any other hook.
+
+        Returns hooks to call during this injection: these hooks (default),
+        other hooks to keep per-injection state in, or ``None`` to skip this injection.
+        Injections of singleton dependencies run by ``Container`` are part of injection
+        that required them, so this hook is not called for them.
+
+        :param info: information of callable being injected
+        :return: hooks to call during injection
+        """
+        return self
+
+    def on_resolve_start(self, info: CallableInfo[typing.Any]) -> None:
+        """
+        Called when injection starts resolving callable (its parameters are not yet resolved)
+
+        :param info: callable information
+        """
+
+    def on_call_start(
+        self, info: CallableInfo[typing.Any], values: collections.abc.Mapping[str, typing.Any]
+    ) -> None:
+        """
+        Called right before callable is called
+
+        :param info: callable information
+        :param values: callable arguments
+        """
+
+    def on_call_end(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        """
+        Called after callable returned (awaited, entered) its result
+
+        :param info: callable information
+        :param value: callable result
+        """
+
+    def on_cache_hit(self, info: CallableInfo[typing.Any]) -> None:
+        """
+        Called when dependency is not called, because its result is already cached
+
+        :param info: dependency information
+        """
+
+    def on_teardown_start(self, info: CallableInfo[typing.Any]) -> None:
+        """
+        Called before teardown of lifespan dependency (generator or context manager) starts
+
+        :param info: dependency information
+        """
+
+    def on_teardown_end(self, info: CallableInfo[typing.Any]) -> None:
+        """
+        Called after teardown of lifespan dependency finished, even if it failed
+
+        :param info: dependency information
+        """
+
+    def on_error(self, info: CallableInfo[typing.Any], exception: Exception) -> None:
+        """
+        Called when resolving or calling callable fails
+
+        :param info: information of callable being resolved when exception was raised
+        :param exception: raised exception
+        """
+
+
+class _Chain(Hooks):
+    """
+    Calls multiple hooks, in order they were registered.
+
+    Hooks selected for injection are always chained, so nested injections
+    (of singleton dependencies) reuse them as they are.
+    """
+
+    def __init__(self, hooks: collections.abc.Sequence[Hooks]):
+        self.hooks: tuple[Hooks, ...] = tuple(hooks)
+
+    def on_resolve_start(self, info: CallableInfo[typing.Any]) -> None:
+        for hooks in self.hooks:
+            hooks.on_resolve_start(info)
+
+    def on_call_start(
+        self, info: CallableInfo[typing.Any], values: collections.abc.Mapping[str, typing.Any]
+    ) -> None:
+        for hooks in self.hooks:
+            hooks.on_call_start(info, values)
+
+    def on_call_end(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        for hooks in self.hooks:
+            hooks.on_call_end(info, value)
+
+    def on_cache_hit(self, info: CallableInfo[typing.Any]) -> None:
+        for hooks in self.hooks:
+            hooks.on_cache_hit(info)
+
+    def on_teardown_start(self, info: CallableInfo[typing.Any]) -> None:
+        for hooks in self.hooks:
+            hooks.on_teardown_start(info)
+
+    def on_teardown_end(self, info: CallableInfo[typing.Any]) -> None:
+        for hooks in self.hooks:
+            hooks.on_teardown_end(info)
+
+    def on_error(self, info: CallableInfo[typing.Any], exception: Exception) -> None:
+        for hooks in self.hooks:
+            hooks.on_error(info, exception)
+
+
+_lock = threading.Lock()
+_registered: tuple[Hooks, ...] = ()
+
+
+def register_hooks(hooks: Hooks) -> None:
+    """
+    Register hooks for every injection
+
+    :param hooks: hooks to register
+    """
+    global _registered
+
+    with _lock:
+        if hooks not in _registered:
+            _registered = (*_registered, hooks)
+
+
+def unregister_hooks(hooks: Hooks) -> None:
+    """
+    Unregister hooks registered by ``register_hooks``
+
+    :param hooks: hooks to unregister
+    """
+    global _registered
+
+    with _lock:
+        _registered = tuple(registered for registered in _registered if registered is not hooks)
+
+
+def active_hooks(hooks: Hooks | None, info: CallableInfo[typing.Any]) -> Hooks | None:
+    """
+    Get hooks injection should call: registered hooks followed by hooks passed to injection.
+
+    :param hooks: hooks passed to injection
+    :param info: information of callable being injected
+    :return: hooks to call or ``None`` if there are none
+    """
+    registered = _registered
+
+    if isinstance(hooks, _Chain):
+        return hooks
+
+    if hooks is None:
+        if not registered:
+            return None
+    elif hooks not in registered:
+        registered = (*registered, hooks)
+
+    selected = [
+        session
+        for session in (candidate.on_injection_start(info) for candidate in registered)
+        if session is not None
+    ]
+    if not selected:
+        return None
+
+    return _Chain(selected)
+
+
+def call_sync_hooked(
+    hooks: Hooks,
+    stack: contextlib.ExitStack | contextlib.AsyncExitStack | Teardown,
+    info: CallableInfo[typing.Any],
+    values: collections.abc.Mapping[str, typing.Any],
+) -> typing.Any:
+    """
+    Synchronously call dependency callable, calling hooks around its call and teardown.
+
+    :param hooks: hooks to call
+    :param stack: exit stack to properly handle generator dependencies
+    :param info: callable information
+    :param values: callable arguments
+    :return: callable result
+    """
+    hooks.on_call_start(info, values)
+
+    if not (info.generator or info.context):
+        value = call_sync(stack, info, values)
+        hooks.on_call_end(info, value)
+        return value
+
+    # Dependency's teardown is kept in its own registry to surround it with teardown hooks
+    lifespan = Teardown()
+    value = call_sync(lifespan, info, values)
+
+    stack.callback(hooks.on_teardown_end, info)
+    stack.push(lifespan)
+    stack.callback(hooks.on_teardown_start, info)
+
+    hooks.on_call_end(info, value)
+    return value
+
+
+async def call_hooked(
+    hooks: Hooks,
+    stack: contextlib.AsyncExitStack | Teardown,
+    info: CallableInfo[typing.Any],
+    values: collections.abc.Mapping[str, typing.Any],
+    executor: concurrent.futures.Executor | None = None,
+    offload: bool = False,
+) -> typing.Any:
+    """
+    Asynchronously call dependency callable, calling hooks around its call and teardown.
+
+    :param hooks: hooks to call
+    :param stack: exit stack to properly handle generator dependencies
+    :param info: callable information
+    :param values: callable arguments
+    :param executor: executor to run blocking synchronous dependencies in
+    :param offload: whether to run all synchronous dependencies in executor
+    :return: callable result
+    """
+    hooks.on_call_start(info, values)
+
+    lifespan: contextlib.AsyncExitStack | Teardown = stack
+    if info.generator or info.context:
+        # Dependency's teardown is kept in its own registry to surround it with teardown hooks
+        lifespan = Teardown(async_=True)
+
+    if info.async_:
+        value = await call_async(lifespan, info, values)
+    elif offload or info.blocking:
+        value = await call_in_executor(lifespan, info, values, executor)
+    else:
+        value = call_sync(lifespan, info, values)
+
+    if lifespan is not stack:
+        stack.callback(hooks.on_teardown_end, info)
+        stack.push_async_exit(lifespan)
+        stack.callback(hooks.on_teardown_start, info)
+
+    hooks.on_call_end(info, value)
+    return value
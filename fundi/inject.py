@@ -1,10 +1,33 @@
 import typing
 import contextlib
 import collections.abc
-
-from fundi.resolve import resolve
-from fundi.types import CacheKey, CallableInfo
-from fundi.util import call_sync, call_async, add_injection_trace
+import concurrent.futures
+
+from fundi.lazy import Lazy
+from fundi.compile import compile
+from fundi.scope import bind_parameter
+from fundi.concurrent import ainject_concurrently
+from fundi.overrides import Overrides, as_overrides
+from fundi.hooks import Hooks, active_hooks, call_hooked, call_sync_hooked
+from fundi.resolve import resolve, resolve_from_scope
+from fundi.teardown import as_teardown
+from fundi.util import call_sync, call_async, call_in_executor, add_injection_trace
+from fundi.types import CacheKey, CallableInfo, InjectionPlan, Parameter, PlanStep
+
+if typing.TYPE_CHECKING:
+    from fundi.container import Container
+
+# Dependant's state saved while its dependency is being resolved:
+# callable information, values resolved so far, parameter it is injected into, its scope,
+# its plan steps and position to continue from once dependency is resolved
+Frame: typing.TypeAlias = tuple[
+    CallableInfo[typing.Any],
+    dict[str, typing.Any],
+    Parameter | None,
+    collections.abc.Mapping[str, typing.Any],
+    list[PlanStep],
+    int,
+]
 
 
 def injection_impl(
@@ -43,7 +66,7 @@ def injection_impl(
                 dependency = result.dependency
                 assert dependency is not None
 
-                value = yield {**scope, "__fundi_parameter__": result.parameter}, dependency, True
+                value = yield bind_parameter(scope, result.parameter), dependency, True
 
                 if dependency.use_cache:
                     cache[dependency.key] = value
@@ -63,6 +86,8 @@ def inject(
     stack: contextlib.ExitStack,
     cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
     override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    container: "Container | None" = None,
+    hooks: Hooks | None = None,
 ) -> typing.Any:
     """
     Synchronously inject dependencies into callable.
@@ -72,6 +97,8 @@ def inject(
     :param stack: exit stack to properly handle generator dependencies
     :param cache: dependency cache
     :param override: override dependencies
+    :param container: application-level container of singleton dependencies
+    :param hooks: hooks to call in addition to registered ones
     :return: result of callable
     """
     if info.async_:
@@ -80,22 +107,110 @@ def inject(
     if cache is None:
         cache = {}
 
-    gen = injection_impl(scope, info, cache, override)
+    overrides = as_overrides(override)
+    steps = compile(info, overrides).steps
+
+    # Lifespan dependencies are registered in one teardown registry per injection
+    teardown = as_teardown(stack)
+
+    hooks = active_hooks(hooks, info)
+    if hooks is not None:
+        hooks.on_resolve_start(info)
+
+    # State of callable being resolved right now
+    values: dict[str, typing.Any] = {}
+    parameter: Parameter | None = None
+    node_scope = scope
 
-    value: typing.Any | None = None
+    # States of dependants waiting for their dependencies
+    frames: list[Frame] = []
 
+    index = 0
     try:
         while True:
-            inner_scope, inner_info, more = gen.send(value)
+            step = steps[index]
+            index += 1
+
+            if step.op == PlanStep.SCOPE:
+                param = typing.cast(Parameter, step.parameter)
+                values[param.name] = resolve_from_scope(node_scope, param, info)
+                continue
+
+            if step.op == PlanStep.ENTER:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+
+                if dependency.lifetime == "singleton" and container is not None:
+                    values[param.name] = container.resolve(
+                        bind_parameter(scope, param) if step.scoped else scope,
+                        dependency,
+                        overrides,
+                        hooks,
+                    )
+                    continue
+
+                if dependency.use_cache and dependency.key in cache:
+                    values[param.name] = cache[dependency.key]
+
+                    if hooks is not None:
+                        hooks.on_cache_hit(dependency)
+                    continue
+
+                if dependency.async_:
+                    raise RuntimeError("Cannot process async functions in synchronous injection")
+
+                frames.append((info, values, parameter, node_scope, steps, index))
+                info, values, parameter = dependency, {}, param
+                node_scope = bind_parameter(scope, param) if step.scoped else scope
+                steps = typing.cast(InjectionPlan, step.plan).steps
+                index = 0
+
+                if hooks is not None:
+                    hooks.on_resolve_start(info)
+                continue
 
-            if more:
-                value = inject(inner_scope, inner_info, stack, cache, override)
+            if step.op == PlanStep.VALUE:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+                values[param.name] = typing.cast(Overrides, overrides)[dependency.call]
                 continue
 
-            return call_sync(stack, inner_info, inner_scope)
+            if step.op == PlanStep.LAZY:
+                param = typing.cast(Parameter, step.parameter)
+                values[param.name] = Lazy(
+                    typing.cast(CallableInfo[typing.Any], step.dependency),
+                    bind_parameter(scope, param) if step.scoped else scope,
+                    teardown,
+                    cache,
+                    overrides,
+                    container,
+                    hooks,
+                )
+                continue
+
+            if hooks is None:
+                value = call_sync(teardown, info, values)
+            else:
+                value = call_sync_hooked(hooks, teardown, info, values)
+
+            if not frames:
+                return value
+
+            if info.use_cache:
+                cache[info.key] = value
+
+            name = typing.cast(Parameter, parameter).name
+            info, values, parameter, node_scope, steps, index = frames.pop()
+            values[name] = value
+
     except Exception as exc:
-        with contextlib.suppress(StopIteration):
-            gen.throw(type(exc), exc, exc.__traceback__)
+        if hooks is not None:
+            hooks.on_error(info, exc)
+
+        add_injection_trace(exc, info, values)
+
+        for frame in reversed(frames):
+            add_injection_trace(exc, frame[0], frame[1])
 
         raise
 
@@ -106,6 +221,11 @@ async def ainject(
     stack: contextlib.AsyncExitStack,
     cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
     override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+    offload: bool = False,
+    container: "Container | None" = None,
+    hooks: Hooks | None = None,
 ) -> typing.Any:
     """
     Asynchronously inject dependencies into callable.
@@ -115,29 +235,137 @@ async def ainject(
     :param stack: exit stack to properly handle generator dependencies
     :param cache: dependency cache
     :param override: override dependencies
+    :param concurrency: whether to run independent dependencies concurrently
+    :param executor: executor to run blocking synchronous dependencies in
+    :param offload: whether to run all synchronous dependencies in executor,
+        not only ones marked as blocking
+    :param container: application-level container of singleton dependencies
+    :param hooks: hooks to call in addition to registered ones
     :return: result of callable
     """
     if cache is None:
         cache = {}
 
-    gen = injection_impl(scope, info, cache, override)
+    overrides = as_overrides(override)
+    hooks = active_hooks(hooks, info)
+
+    if concurrency:
+        return await ainject_concurrently(
+            scope,
+            info,
+            stack,
+            cache,
+            overrides,
+            executor=executor,
+            offload=offload,
+            container=container,
+            hooks=hooks,
+        )
+
+    steps = compile(info, overrides).steps
+    teardown = as_teardown(stack)
+
+    if hooks is not None:
+        hooks.on_resolve_start(info)
+
+    # State of callable being resolved right now
+    values: dict[str, typing.Any] = {}
+    parameter: Parameter | None = None
+    node_scope = scope
 
-    value: typing.Any | None = None
+    # States of dependants waiting for their dependencies
+    frames: list[Frame] = []
 
+    index = 0
     try:
         while True:
-            inner_scope, inner_info, more = gen.send(value)
+            step = steps[index]
+            index += 1
+
+            if step.op == PlanStep.SCOPE:
+                param = typing.cast(Parameter, step.parameter)
+                values[param.name] = resolve_from_scope(node_scope, param, info)
+                continue
+
+            if step.op == PlanStep.ENTER:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+
+                if dependency.lifetime == "singleton" and container is not None:
+                    values[param.name] = await container.aresolve(
+                        bind_parameter(scope, param) if step.scoped else scope,
+                        dependency,
+                        overrides,
+                        executor,
+                        offload,
+                        hooks,
+                    )
+                    continue
+
+                if dependency.use_cache and dependency.key in cache:
+                    values[param.name] = cache[dependency.key]
+
+                    if hooks is not None:
+                        hooks.on_cache_hit(dependency)
+                    continue
+
+                frames.append((info, values, parameter, node_scope, steps, index))
+                info, values, parameter = dependency, {}, param
+                node_scope = bind_parameter(scope, param) if step.scoped else scope
+                steps = typing.cast(InjectionPlan, step.plan).steps
+                index = 0
+
+                if hooks is not None:
+                    hooks.on_resolve_start(info)
+                continue
+
+            if step.op == PlanStep.VALUE:
+                param = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+                values[param.name] = typing.cast(Overrides, overrides)[dependency.call]
+                continue
 
-            if more:
-                value = await ainject(inner_scope, inner_info, stack, cache, override)
+            if step.op == PlanStep.LAZY:
+                param = typing.cast(Parameter, step.parameter)
+                values[param.name] = Lazy(
+                    typing.cast(CallableInfo[typing.Any], step.dependency),
+                    bind_parameter(scope, param) if step.scoped else scope,
+                    teardown,
+                    cache,
+                    overrides,
+                    container,
+                    hooks,
+                    executor,
+                    offload,
+                )
                 continue
 
-            if info.async_:
-                return await call_async(stack, inner_info, inner_scope)
+            if hooks is not None:
+                value = await call_hooked(hooks, teardown, info, values, executor, offload)
+            elif info.async_:
+                value = await call_async(teardown, info, values)
+            elif offload or info.blocking:
+                value = await call_in_executor(teardown, info, values, executor)
+            else:
+                value = call_sync(teardown, info, values)
+
+            if not frames:
+                return value
+
+            if info.use_cache:
+                cache[info.key] = value
+
+            name = typing.cast(Parameter, parameter).name
+            info, values, parameter, node_scope, steps, index = frames.pop()
+            values[name] = value
 
-            return call_sync(stack, inner_info, inner_scope)
     except Exception as exc:
-        with contextlib.suppress(StopIteration):
-            gen.throw(type(exc), exc, exc.__traceback__)
+        if hooks is not None:
+            hooks.on_error(info, exc)
+
+        add_injection_trace(exc, info, values)
+
+        for frame in reversed(frames):
+            add_injection_trace(exc, frame[0], frame[1])
 
         raise
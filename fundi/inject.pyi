@@ -1,7 +1,10 @@
 import typing
 from typing import overload
+from concurrent.futures import Executor
 from collections.abc import Generator, AsyncGenerator, Mapping, MutableMapping, Awaitable
 
+from fundi.hooks import Hooks
+from fundi.container import Container
 from fundi.types import CacheKey, CallableInfo
 
 from contextlib import (
@@ -32,6 +35,8 @@ def inject(
     stack: ExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 def inject(
@@ -40,6 +45,8 @@ def inject(
     stack: ExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 def inject(
@@ -48,6 +55,8 @@ def inject(
     stack: ExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -56,6 +65,11 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -64,6 +78,11 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -72,6 +91,11 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -80,6 +104,11 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -88,6 +117,11 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
 @overload
 async def ainject(
@@ -96,4 +130,9 @@ async def ainject(
     stack: AsyncExitStack,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: bool = False,
+    executor: Executor | None = None,
+    offload: bool = False,
+    container: Container | None = None,
+    hooks: Hooks | None = None,
 ) -> R: ...
@@ -0,0 +1,191 @@
+import typing
+import contextlib
+import collections.abc
+import concurrent.futures
+
+from fundi.types import R, CacheKey, CallableInfo
+from fundi.teardown import Teardown, as_teardown
+
+if typing.TYPE_CHECKING:
+    from fundi.hooks import Hooks
+    from fundi.container import Container
+    from fundi.overrides import Overrides
+
+__all__ = ["Lazy"]
+
+_MISSING = object()
+
+
+class Lazy(typing.Generic[R]):
+    """
+    Handle of dependency that is resolved on first use.
+
+    Parameters annotated as ``Lazy[T]`` (or using ``from_(dependency, lazy=True)``) get
+    this handle instead of dependency value, so dependency that is needed only sometimes
+    is not resolved when it is not needed::
+
+        def handler(audit: Lazy[AuditLogger] = from_(require_audit_logger)):
+            if request.method == "POST":
+                audit.get().log(request)
+
+    Dependency is resolved the same way it would be resolved by injection that created handle:
+    using the same cache, overrides, container and exit stack. In asynchronous code await handle
+    (``await audit``) to resolve asynchronous dependencies, or to run blocking ones in executor.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "info",
+        "_scope",
+        "_stack",
+        "_cache",
+        "_overrides",
+        "_container",
+        "_hooks",
+        "_executor",
+        "_offload",
+        "_value",
+    )
+
+    def __init__(
+        self,
+        info: CallableInfo[R],
+        scope: collections.abc.Mapping[str, typing.Any],
+        stack: contextlib.ExitStack | contextlib.AsyncExitStack | Teardown,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+        overrides: "Overrides | None" = None,
+        container: "Container | None" = None,
+        hooks: "Hooks | None" = None,
+        executor: concurrent.futures.Executor | None = None,
+        offload: bool = False,
+    ):
+        self.info: CallableInfo[R] = info
+        self._scope: collections.abc.Mapping[str, typing.Any] = scope
+        # Teardown registry of injection that created handle
+        self._stack: Teardown = as_teardown(stack)
+        self._cache: collections.abc.MutableMapping[CacheKey, typing.Any] = cache
+        self._overrides: "Overrides | None" = overrides
+        self._container: "Container | None" = container
+        self._hooks: "Hooks | None" = hooks
+        self._executor: concurrent.futures.Executor | None = executor
+        self._offload: bool = offload
+        self._value: typing.Any = _MISSING
+
+    @property
+    def resolved(self) -> bool:
+        """Whether dependency was already resolved"""
+        return self._value is not _MISSING
+
+    def _prepare(self) -> CallableInfo[typing.Any] | None:
+        """
+        Find dependency value without calling anything.
+
+        :return: information of callable to inject if value is not known yet
+        """
+        if self._value is not _MISSING:
+            return None
+
+        info: CallableInfo[typing.Any] = self.info
+
+        if self._overrides is not None:
+            overriding = self._overrides.get(info.call, _MISSING)
+
+            if overriding is not _MISSING:
+                if not isinstance(overriding, CallableInfo):
+                    self._value = overriding
+                    return None
+
+                info = typing.cast(CallableInfo[typing.Any], overriding)
+
+        if info.use_cache and info.key in self._cache:
+            self._value = self._cache[info.key]
+
+            if self._hooks is not None:
+                self._hooks.on_cache_hit(info)
+            return None
+
+        return info
+
+    def _store(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        if info.use_cache:
+            self._cache[info.key] = value
+
+        self._value = value
+
+    def get(self) -> R:
+        """
+        Get dependency value, synchronously resolving it on first use.
+
+        :return: dependency value
+        """
+        # fundi.inject creates handles, so it can not be imported on module level
+        from fundi.inject import inject
+
+        info = self._prepare()
+
+        if info is not None:
+            if info.lifetime == "singleton" and self._container is not None:
+                value = self._container.resolve(self._scope, info, self._overrides, self._hooks)
+            else:
+                value = inject(
+                    self._scope,
+                    info,
+                    typing.cast(contextlib.ExitStack, self._stack),
+                    self._cache,
+                    self._overrides,
+                    self._container,
+                    self._hooks,
+                )
+
+            self._store(info, value)
+
+        return typing.cast(R, self._value)
+
+    async def aget(self) -> R:
+        """
+        Get dependency value, asynchronously resolving it on first use.
+
+        Handle created by synchronous injection is resolved synchronously.
+
+        :return: dependency value
+        """
+        # fundi.inject creates handles, so it can not be imported on module level
+        from fundi.inject import ainject
+
+        if not self._stack.async_:
+            return self.get()
+
+        info = self._prepare()
+
+        if info is not None:
+            if info.lifetime == "singleton" and self._container is not None:
+                value = await self._container.aresolve(
+                    self._scope,
+                    info,
+                    self._overrides,
+                    self._executor,
+                    self._offload,
+                    self._hooks,
+                )
+            else:
+                value = await ainject(
+                    self._scope,
+                    info,
+                    typing.cast(contextlib.AsyncExitStack, self._stack),
+                    self._cache,
+                    self._overrides,
+                    executor=self._executor,
+                    offload=self._offload,
+                    container=self._container,
+                    hooks=self._hooks,
+                )
+
+            self._store(info, value)
+
+        return typing.cast(R, self._value)
+
+    def __await__(self) -> collections.abc.Generator[typing.Any, None, R]:
+        return self.aget().__await__()
+
+    def __repr__(self) -> str:
+        state = repr(self._value) if self.resolved else "unresolved"
+        return f"Lazy({self.info.call!r}, {state})"
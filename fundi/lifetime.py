@@ -0,0 +1,34 @@
+import typing
+
+from fundi.scan import scan
+from fundi.types import Lifetime
+
+C = typing.TypeVar("C", bound=typing.Callable[..., typing.Any])
+
+
+def lifetime(value: Lifetime) -> typing.Callable[[C], C]:
+    """
+    Declare lifetime of dependency result.
+
+    - ``singleton`` - dependency runs once per ``Container``, its result is reused
+      by every injection that uses this container, and its teardown runs when container is closed;
+    - ``request`` - dependency runs once per injection (default);
+    - ``transient`` - dependency runs every time it is required.
+
+    Lifetime can also be set for single usage of dependency: ``from_(dependency, lifetime=...)``
+
+    :param value: lifetime of dependency result
+    :return: decorator that sets lifetime of dependency
+    """
+    if value not in typing.get_args(Lifetime):
+        raise ValueError(f"Unknown lifetime: {value!r}")
+
+    def decorator(call: C) -> C:
+        setattr(call, "__fundi_lifetime__", value)
+
+        if hasattr(call, "__fundi_info__"):
+            setattr(call, "__fundi_info__", scan(call).with_lifetime(value))
+
+        return call
+
+    return decorator
@@ -0,0 +1,217 @@
+import typing
+import asyncio
+import inspect
+import functools
+import threading
+import collections.abc
+import concurrent.futures
+
+from fundi.cache import BoundedCache
+
+C = typing.TypeVar("C", bound=typing.Callable[..., typing.Any])
+
+# Separates positional arguments from keyword ones in memoization key
+_KEYWORDS = object()
+
+
+def _make_key(
+    args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]
+) -> collections.abc.Hashable | None:
+    key = (*args, _KEYWORDS, *kwargs.items()) if kwargs else args
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+class _Flights:
+    """
+    Makes sure value for each key is computed by one caller at a time,
+    other callers wait for its result
+    """
+
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: dict[collections.abc.Hashable, concurrent.futures.Future[typing.Any]] = {}
+
+    def claim(
+        self, key: collections.abc.Hashable
+    ) -> tuple[bool, concurrent.futures.Future[typing.Any]]:
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return False, future
+
+            future = self._pending[key] = concurrent.futures.Future()
+            return True, future
+
+    def release(self, key: collections.abc.Hashable) -> None:
+        with self._lock:
+            del self._pending[key]
+
+
+@typing.overload
+def memoize(
+    call: C,
+    /,
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    max_cost: int | None = None,
+    cost: typing.Callable[[typing.Any], int] | None = None,
+) -> C: ...
+
+
+@typing.overload
+def memoize(
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    max_cost: int | None = None,
+    cost: typing.Callable[[typing.Any], int] | None = None,
+) -> typing.Callable[[C], C]: ...
+
+
+def memoize(
+    call: C | None = None,
+    /,
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    max_cost: int | None = None,
+    cost: typing.Callable[[typing.Any], int] | None = None,
+) -> C | typing.Callable[[C], C]:
+    """
+    Cache results of pure dependency across injections, by values of its arguments.
+
+    Can be used as ``@memoize`` or with cache options ``@memoize(max_size=1024, ttl=60)``.
+    Cache is unbounded by default.
+
+    Result for the same arguments is computed once at a time - concurrent calls
+    (from other threads or tasks) wait for the result instead of computing it again.
+    Calls with unhashable arguments are not memoized.
+
+    Memoized dependency gets ``cache_info()`` method, that returns cache statistics,
+    and ``cache_clear()`` method, that clears cache.
+
+    :param call: dependency to memoize, generators and context managers are not supported
+    :param max_size: maximal number of results to keep, least recently used ones are evicted first
+    :param ttl: number of seconds results are kept for, expired results are always recomputed
+    :param max_cost: maximal total cost of results to keep, least recently used ones are evicted first
+    :param cost: function that computes cost of result (``sys.getsizeof`` by default)
+    :return: memoized dependency
+    """
+    if call is None:
+        BoundedCache(max_size, ttl, max_cost=max_cost, cost=cost)  # Validate options early
+
+        def decorator(call: C) -> C:
+            return memoize(call, max_size=max_size, ttl=ttl, max_cost=max_cost, cost=cost)
+
+        return decorator
+
+    if (
+        inspect.isgeneratorfunction(call)
+        or inspect.isasyncgenfunction(call)
+        or hasattr(call, "__enter__")
+        or hasattr(call, "__aenter__")
+    ):
+        raise ValueError("Lifespan dependencies can not be memoized")
+
+    # Evicted results are recomputed, even if they are still referenced elsewhere
+    cache: BoundedCache[collections.abc.Hashable, typing.Any] = BoundedCache(
+        max_size, ttl, max_cost=max_cost, cost=cost, reuse_evicted=False
+    )
+    flights = _Flights()
+
+    memoized: typing.Callable[..., typing.Any]
+
+    if inspect.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def memoized_async(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            key = _make_key(args, kwargs)
+            if key is None:
+                return await call(*args, **kwargs)
+
+            while True:
+                found, value = cache.get(key)
+                if found:
+                    return value
+
+                owner, future = flights.claim(key)
+                if owner:
+                    break
+
+                try:
+                    # Shielded - cancelled waiter must not cancel result shared with others
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    # Owner was cancelled - waiters compete to compute value themselves
+                    if not future.cancelled():
+                        raise
+
+            try:
+                # Value could be stored while this call was claiming the key
+                found, value = cache.peek(key)
+                if not found:
+                    value = await call(*args, **kwargs)
+                    value = cache.get_or_set(key, value)
+            except asyncio.CancelledError:
+                # Cancellation belongs to the owner only - it is not forwarded to waiters
+                flights.release(key)
+                future.cancel()
+                raise
+            except BaseException as exc:
+                flights.release(key)
+                future.set_exception(exc)
+                raise
+
+            flights.release(key)
+            future.set_result(value)
+            return value
+
+        memoized = memoized_async
+
+    else:
+
+        @functools.wraps(call)
+        def memoized_sync(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            key = _make_key(args, kwargs)
+            if key is None:
+                return call(*args, **kwargs)
+
+            found, value = cache.get(key)
+            if found:
+                return value
+
+            owner, future = flights.claim(key)
+            if not owner:
+                return future.result()
+
+            try:
+                # Value could be stored while this call was claiming the key
+                found, value = cache.peek(key)
+                if not found:
+                    value = call(*args, **kwargs)
+                    value = cache.get_or_set(key, value)
+            except BaseException as exc:
+                flights.release(key)
+                future.set_exception(exc)
+                raise
+
+            flights.release(key)
+            future.set_result(value)
+            return value
+
+        memoized = memoized_sync
+
+    # functools.wraps copies callable information of original callable - it must not be reused
+    memoized.__dict__.pop("__fundi_info__", None)
+
+    setattr(memoized, "cache_info", cache.info)
+    setattr(memoized, "cache_clear", cache.clear)
+
+    return typing.cast(C, memoized)
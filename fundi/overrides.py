@@ -0,0 +1,93 @@
+import typing
+import collections.abc
+
+from fundi.types import CallableInfo, OverrideShape
+
+__all__ = ["Overrides", "as_overrides"]
+
+# Marks dependency overridden by value in override shape
+_VALUE = "value"
+
+
+class Overrides(collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any]):
+    """
+    Frozen set of dependency overrides.
+
+    Maps dependency callable to either ``CallableInfo`` of dependency to use instead,
+    or value to use as dependency result. Unlike plain mapping passed as ``override``,
+    ``None`` is an ordinary overriding value here.
+
+    Injection plans are compiled with overrides applied and cached by override "shape" -
+    which dependencies are overridden and which dependencies override them (overriding values
+    themselves do not matter), so repeated injections with the same overrides,
+    or overrides of the same shape, do not pay for override handling.
+    """
+
+    __slots__: tuple[str, ...] = ("_values", "shape", "_hash")
+
+    def __init__(
+        self,
+        values: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+        /,
+    ):
+        self._values: dict[typing.Callable[..., typing.Any], typing.Any] = dict(values or {})
+
+        self.shape: OverrideShape = frozenset(
+            (
+                call,
+                # Overriding dependency is compared by identity: it is baked into plan as is
+                id(value) if isinstance(value, CallableInfo) else _VALUE,
+            )
+            for call, value in self._values.items()
+        )
+        self._hash: int = hash(self.shape)
+
+    def __getitem__(self, call: typing.Callable[..., typing.Any]) -> typing.Any:
+        return self._values[call]
+
+    def __iter__(self) -> collections.abc.Iterator[typing.Callable[..., typing.Any]]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, call: object) -> bool:
+        return call in self._values
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
+        if not isinstance(value, Overrides):
+            return NotImplemented
+
+        return self.shape == value.shape and all(
+            value._values[call] is overriding for call, overriding in self._values.items()
+        )
+
+    def __repr__(self) -> str:
+        return f"Overrides({self._values!r})"
+
+
+def as_overrides(
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+) -> Overrides | None:
+    """
+    Convert mapping passed as ``override`` to ``Overrides``.
+
+    ``None`` values of plain mappings mean "not overridden" and are dropped.
+
+    :param override: override dependencies
+    :return: overrides or ``None`` if nothing is overridden
+    """
+    if not override:
+        return None
+
+    if isinstance(override, Overrides):
+        return override
+
+    overrides = Overrides({call: value for call, value in override.items() if value is not None})
+    return overrides or None
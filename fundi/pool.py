@@ -0,0 +1,209 @@
+"""
+Injection in process pool.
+
+Callable information can not be sent to another process: it holds callables,
+parameters and caches that are not picklable. Instead, callables are referenced
+by their import path (``CallableReference``), and worker process imports and
+scans them again - once per worker, restored callable information is reused.
+"""
+
+import typing
+import asyncio
+import importlib
+import contextlib
+import collections.abc
+import concurrent.futures
+
+from fundi.scan import scan
+from fundi.compile import compile
+from fundi.inject import inject, ainject
+from fundi.overrides import Overrides, as_overrides
+from fundi.types import CallableInfo, CallableReference, Parameter, PlanStep
+
+__all__ = ["reference", "restore", "inject_in_pool"]
+
+# Overrides sent to worker: import path of overridden callable,
+# and either overriding value or reference to overriding callable
+PortableOverrides: typing.TypeAlias = tuple[tuple[str, typing.Any], ...]
+
+
+def _import(path: str) -> typing.Any:
+    module_name, _, qualname = path.partition(":")
+
+    value: typing.Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+
+    return value
+
+
+def _path(call: typing.Callable[..., typing.Any]) -> str:
+    module = getattr(call, "__module__", None)
+    qualname = getattr(call, "__qualname__", None)
+
+    if module is None or qualname is None or "<locals>" in qualname:
+        raise ValueError(f"{call!r} can not be referenced by import path")
+
+    path = f"{module}:{qualname}"
+
+    try:
+        imported = _import(path)
+    except (ImportError, AttributeError):
+        imported = None
+
+    if imported is not call:
+        raise ValueError(f"Import path {path!r} does not refer to {call!r}")
+
+    return path
+
+
+def reference(info: CallableInfo[typing.Any]) -> CallableReference:
+    """
+    Get picklable reference to callable information.
+
+    :param info: callable information, its callable must be importable
+        (defined on module level)
+    :return: callable reference
+    """
+    return CallableReference(_path(info.call), info.use_cache, info.lifetime)
+
+
+# Callable information restored in this process
+_restored: dict[CallableReference, CallableInfo[typing.Any]] = {}
+
+
+def restore(reference: CallableReference) -> CallableInfo[typing.Any]:
+    """
+    Get callable information by its reference.
+
+    Callable is imported and scanned on first use, then restored information is reused.
+
+    :param reference: callable reference
+    :return: callable information
+    """
+    info = _restored.get(reference)
+    if info is None:
+        info = scan(_import(reference.path))
+        info = info.with_lifetime(reference.lifetime).with_caching(reference.use_cache)
+        _restored[reference] = info
+
+    return info
+
+
+def _portable_overrides(
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+) -> PortableOverrides:
+    overrides = as_overrides(override)
+    if overrides is None:
+        return ()
+
+    return tuple(
+        (
+            _path(call),
+            reference(value) if isinstance(value, CallableInfo) else value,
+        )
+        for call, value in overrides.items()
+    )
+
+
+def _portable_scope(
+    scope: collections.abc.Mapping[str, typing.Any],
+    info: CallableInfo[typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+) -> dict[str, typing.Any]:
+    """
+    Take values of scope injection of callable can use
+    """
+    names: set[str] = set()
+
+    plans = [compile(info, as_overrides(override))]
+    visited = {id(plans[0])}
+
+    while plans:
+        for step in plans.pop().steps:
+            # Values resolved by type and values used by lazy dependencies are not known in advance
+            if step.op == PlanStep.LAZY:
+                return dict(scope)
+
+            if step.op == PlanStep.SCOPE:
+                parameter = typing.cast(Parameter, step.parameter)
+                if parameter.resolve_by_type:
+                    return dict(scope)
+
+                names.add(parameter.name)
+
+            if step.plan is not None and id(step.plan) not in visited:
+                visited.add(id(step.plan))
+                plans.append(step.plan)
+
+    return {name: scope[name] for name in names if name in scope}
+
+
+def _inject(
+    reference: CallableReference,
+    scope: dict[str, typing.Any],
+    overrides: PortableOverrides,
+) -> typing.Any:
+    """
+    Inject dependencies into referenced callable in worker process
+    """
+    info = restore(reference)
+
+    override = Overrides(
+        {
+            _import(path): restore(value) if isinstance(value, CallableReference) else value
+            for path, value in overrides
+        }
+    )
+
+    try:
+        if info.async_:
+            return asyncio.run(_ainject(scope, info, override))
+
+        with contextlib.ExitStack() as stack:
+            return inject(scope, info, stack, override=override)
+    except Exception as exc:
+        # Injection trace references callable information, so exception could not be sent back
+        if hasattr(exc, "__fundi_injection_trace__"):
+            delattr(exc, "__fundi_injection_trace__")
+        raise
+
+
+async def _ainject(
+    scope: dict[str, typing.Any],
+    info: CallableInfo[typing.Any],
+    override: Overrides,
+) -> typing.Any:
+    async with contextlib.AsyncExitStack() as stack:
+        return await ainject(scope, info, stack, override=override)
+
+
+def inject_in_pool(
+    executor: concurrent.futures.Executor,
+    info: CallableInfo[typing.Any],
+    scope: collections.abc.Mapping[str, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> concurrent.futures.Future[typing.Any]:
+    """
+    Inject dependencies into callable in executor (usually ``ProcessPoolExecutor``).
+
+    Whole injection runs in worker, including teardown of lifespan dependencies,
+    asynchronous callables are injected in event loop of worker.
+    Only values of scope that injection can use are sent to worker, they must be picklable,
+    as well as callable result. Callable, as well as overridden and overriding dependencies,
+    must be importable - they are sent to worker by import path.
+
+    Use ``asyncio.wrap_future`` to await result in asynchronous code.
+
+    :param executor: executor to inject in
+    :param info: callable information
+    :param scope: container with contextual values
+    :param override: override dependencies
+    :return: future of callable result
+    """
+    return executor.submit(
+        _inject,
+        reference(info),
+        _portable_scope(scope, info, override),
+        _portable_overrides(override),
+    )
@@ -1,10 +1,21 @@
 import typing
 import collections.abc
 
+from fundi.scope import find_by_type
+from fundi.overrides import Overrides
 from fundi.util import normalize_annotation
+from fundi.exceptions import ScopeValueNotFoundError
 from fundi.types import CacheKey, CallableInfo, ParameterResult, Parameter
 
 
+def _type_options(param: Parameter) -> tuple[type, ...]:
+    type_options = param.type_options
+    if type_options is None:
+        type_options = param.type_options = normalize_annotation(param.annotation, param.namespace)
+
+    return type_options
+
+
 def resolve_by_dependency(
     param: Parameter,
     cache: collections.abc.Mapping[CacheKey, typing.Any],
@@ -15,7 +26,8 @@ def resolve_by_dependency(
     assert dependency is not None
 
     value = override.get(dependency.call)
-    if value is not None:
+    # Unlike plain mappings, Overrides can override dependency with None
+    if value is not None or (isinstance(override, Overrides) and dependency.call in override):
         if isinstance(value, CallableInfo):
             return ParameterResult(
                 param, None, typing.cast(CallableInfo[typing.Any], value), resolved=False
@@ -32,17 +44,42 @@ def resolve_by_dependency(
 def resolve_by_type(
     scope: collections.abc.Mapping[str, typing.Any], param: Parameter
 ) -> ParameterResult:
-    type_options = normalize_annotation(param.annotation)
-
-    for value in scope.values():
-        if not isinstance(value, type_options):
-            continue
+    found, value = find_by_type(scope, _type_options(param))
 
+    if found:
         return ParameterResult(param, value, None, resolved=True)
 
     return ParameterResult(param, None, None, resolved=False)
 
 
+def resolve_from_scope(
+    scope: collections.abc.Mapping[str, typing.Any],
+    param: Parameter,
+    info: CallableInfo[typing.Any],
+) -> typing.Any:
+    """
+    Resolve value of non-dependency parameter from scope or its default value
+
+    :param scope: container with contextual values
+    :param param: parameter to resolve value for
+    :param info: callable information parameter belongs to
+    :return: parameter value
+    """
+    if param.resolve_by_type:
+        found, value = find_by_type(scope, _type_options(param))
+
+        if found:
+            return value
+
+    elif param.name in scope:
+        return scope[param.name]
+
+    if param.has_default:
+        return param.default
+
+    raise ScopeValueNotFoundError(param.name, info)
+
+
 def resolve(
     scope: collections.abc.Mapping[str, typing.Any],
     info: CallableInfo[typing.Any],
@@ -73,8 +110,6 @@ def resolve(
     :param override: override dependencies
     :return: generator with solvation results
     """
-    from fundi.exceptions import ScopeValueNotFoundError
-
     if override is None:
         override = {}
 
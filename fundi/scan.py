@@ -1,32 +1,182 @@
-from dataclasses import replace
+import ast
+import sys
+import types
 import typing
+import weakref
 import inspect
 
-from fundi.util import is_configured, get_configuration
-from fundi.types import R, CallableInfo, Parameter, TypeResolver
+from fundi.lazy import Lazy
+from fundi.util import (
+    is_configured,
+    get_configuration,
+    normalize_annotation,
+    _evaluate_forward_reference,
+)
+from fundi.types import R, CallableInfo, Lifetime, Parameter, LazyResolver, TypeResolver
 
 
-def _transform_parameter(parameter: inspect.Parameter) -> Parameter:
-    positional_varying = parameter.kind == inspect.Parameter.VAR_POSITIONAL
-    positional_only = parameter.kind == inspect.Parameter.POSITIONAL_ONLY
-    keyword_varying = parameter.kind == inspect.Parameter.VAR_KEYWORD
-    keyword_only = parameter.kind == inspect.Parameter.KEYWORD_ONLY
+def _namespace(call: typing.Callable[..., typing.Any]) -> dict[str, typing.Any] | None:
+    """
+    Get global namespace of callable to evaluate forward references in
+    """
+    try:
+        namespace = getattr(inspect.unwrap(call), "__globals__", None)
+    except ValueError:  # Wrapping cycle
+        namespace = None
+
+    if namespace is not None:
+        return namespace
+
+    module = sys.modules.get(getattr(call, "__module__", None) or "")
+    return None if module is None else vars(module)
+
+
+# Parameter of signature: name, kind, default and annotation
+# (``inspect.Parameter.empty`` if parameter has no default or annotation)
+RawParameter: typing.TypeAlias = tuple[str, inspect._ParameterKind, typing.Any, typing.Any]
+
+_EMPTY = inspect.Parameter.empty
+
+# Function attributes that make ``inspect.signature`` or ``inspect.iscoroutinefunction``
+# report something else than function code does
+_SIGNATURE_ATTRIBUTES = ("__wrapped__", "__signature__", "_is_coroutine_marker")
+
+
+def _is_plain_function(call: typing.Callable[..., typing.Any]) -> bool:
+    if type(call) is not types.FunctionType:
+        return False
+
+    attributes = call.__dict__
+    return not any(name in attributes for name in _SIGNATURE_ATTRIBUTES)
+
+
+def _function_signature(
+    function: types.FunctionType,
+) -> tuple[list[RawParameter], typing.Any]:
+    """
+    Read signature of plain function from its code object, defaults and annotations.
+
+    Result is the same ``inspect.signature`` gives, but it is much cheaper to get:
+    code object is already loaded (from ``__pycache__``) when function is defined.
+
+    :param function: plain function, see ``_is_plain_function``
+    :return: parameters and return annotation
+    """
+    code = function.__code__
+    names = code.co_varnames
+    defaults = function.__defaults__ or ()
+    keyword_defaults = function.__kwdefaults__ or {}
+    annotations = function.__annotations__
+
+    positional = code.co_argcount
+    keyword = code.co_kwonlyargcount
+    first_default = positional - len(defaults)
+
+    parameters: list[RawParameter] = []
+
+    for index in range(positional):
+        name = names[index]
+        parameters.append(
+            (
+                name,
+                (
+                    inspect.Parameter.POSITIONAL_ONLY
+                    if index < code.co_posonlyargcount
+                    else inspect.Parameter.POSITIONAL_OR_KEYWORD
+                ),
+                defaults[index - first_default] if index >= first_default else _EMPTY,
+                annotations.get(name, _EMPTY),
+            )
+        )
+
+    # Varying parameters are stored after keyword-only ones
+    index = positional + keyword
+
+    if code.co_flags & inspect.CO_VARARGS:
+        name = names[index]
+        parameters.append(
+            (name, inspect.Parameter.VAR_POSITIONAL, _EMPTY, annotations.get(name, _EMPTY))
+        )
+        index += 1
+
+    for name in names[positional : positional + keyword]:
+        parameters.append(
+            (
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                keyword_defaults.get(name, _EMPTY),
+                annotations.get(name, _EMPTY),
+            )
+        )
+
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        name = names[index]
+        parameters.append(
+            (name, inspect.Parameter.VAR_KEYWORD, _EMPTY, annotations.get(name, _EMPTY))
+        )
+
+    return parameters, annotations.get("return", _EMPTY)
 
-    if isinstance(parameter.default, CallableInfo):
+
+def _is_lazy(annotation: typing.Any, namespace: dict[str, typing.Any] | None) -> bool:
+    if not isinstance(annotation, (str, typing.ForwardRef)):
+        return typing.get_origin(annotation) is Lazy
+
+    # Postponed annotation: only its origin is evaluated,
+    # type arguments may be not defined yet
+    if isinstance(annotation, typing.ForwardRef):
+        annotation = annotation.__forward_arg__
+
+    if namespace is None:
+        return False
+
+    try:
+        expression = ast.parse(annotation, mode="eval").body
+    except SyntaxError:
+        return False
+
+    if not isinstance(expression, ast.Subscript):
+        return False
+
+    try:
+        origin = _evaluate_forward_reference(ast.unparse(expression.value), namespace)
+    except Exception:
+        return False
+
+    return origin is Lazy
+
+
+def _transform_parameter(
+    parameter: RawParameter, namespace: dict[str, typing.Any] | None = None
+) -> Parameter:
+    name, kind, default, annotation = parameter
+
+    positional_varying = kind == inspect.Parameter.VAR_POSITIONAL
+    positional_only = kind == inspect.Parameter.POSITIONAL_ONLY
+    keyword_varying = kind == inspect.Parameter.VAR_KEYWORD
+    keyword_only = kind == inspect.Parameter.KEYWORD_ONLY
+
+    has_default = default is not _EMPTY
+    lazy = _is_lazy(annotation, namespace)
+
+    if isinstance(default, LazyResolver):
+        default = default.dependency
+        lazy = True
+
+    if isinstance(default, CallableInfo):
         return Parameter(
-            parameter.name,
-            parameter.annotation,
-            from_=typing.cast(CallableInfo[typing.Any], parameter.default),
+            name,
+            annotation,
+            from_=typing.cast(CallableInfo[typing.Any], default),
             positional_varying=positional_varying,
             positional_only=positional_only,
             keyword_varying=keyword_varying,
             keyword_only=keyword_only,
+            lazy=lazy,
         )
 
-    has_default = parameter.default is not inspect.Parameter.empty
     resolve_by_type = False
 
-    annotation = parameter.annotation
     if isinstance(annotation, TypeResolver):
         annotation = annotation.annotation
         resolve_by_type = True
@@ -37,20 +187,51 @@ def _transform_parameter(parameter: inspect.Parameter) -> Parameter:
         if args[1] is TypeResolver:
             resolve_by_type = True
 
+    type_options: tuple[type, ...] | None = None
+    if resolve_by_type:
+        type_options = normalize_annotation(annotation)
+
+        if any(isinstance(t, (str, typing.ForwardRef)) for t in type_options):
+            # Referenced types may be not defined yet - resolve them on first use
+            type_options = None
+
     return Parameter(
-        parameter.name,
+        name,
         annotation,
         from_=None,
-        default=parameter.default if has_default else None,
+        default=default if has_default else None,
         has_default=has_default,
         resolve_by_type=resolve_by_type,
         positional_varying=positional_varying,
         positional_only=positional_only,
         keyword_varying=keyword_varying,
         keyword_only=keyword_only,
+        type_options=type_options,
+        namespace=namespace if resolve_by_type and type_options is None else None,
     )
 
 
+# Information of callables that do not allow to set attributes on them
+# (builtins, bound methods, etc.). Information is kept while it is in use
+_registry: (
+    "weakref.WeakValueDictionary[typing.Callable[..., typing.Any], CallableInfo[typing.Any]]"
+) = weakref.WeakValueDictionary()
+
+
+def _lookup(call: typing.Callable[..., R]) -> CallableInfo[R] | None:
+    try:
+        return _registry.get(call)
+    except TypeError:  # Unhashable callable
+        return None
+
+
+def _remember(call: typing.Callable[..., R], info: CallableInfo[R]) -> None:
+    try:
+        _registry[call] = info
+    except TypeError:  # Unhashable callable
+        pass
+
+
 def scan(call: typing.Callable[..., R], caching: bool = True) -> CallableInfo[R]:
     """
     Get callable information
@@ -61,41 +242,65 @@ def scan(call: typing.Callable[..., R], caching: bool = True) -> CallableInfo[R]
     :return: callable information
     """
 
-    if hasattr(call, "__fundi_info__"):
-        info = typing.cast(CallableInfo[typing.Any], getattr(call, "__fundi_info__"))
-        return replace(info, use_cache=caching)
+    info = typing.cast(CallableInfo[R] | None, getattr(call, "__fundi_info__", None))
+    if info is None:
+        info = _lookup(call)
+
+    if info is not None:
+        return info.with_caching(caching)
 
-    signature = inspect.signature(call)
+    if _is_plain_function(call):
+        function = typing.cast(types.FunctionType, call)
+        raw_parameters, return_annotation = _function_signature(function)
 
-    generator = inspect.isgeneratorfunction(call)
-    async_generator = inspect.isasyncgenfunction(call)
+        flags = function.__code__.co_flags
+        generator = bool(flags & inspect.CO_GENERATOR)
+        async_generator = bool(flags & inspect.CO_ASYNC_GENERATOR)
+        coroutine = bool(flags & inspect.CO_COROUTINE)
+    else:
+        signature = inspect.signature(call)
+        raw_parameters = [
+            (parameter.name, parameter.kind, parameter.default, parameter.annotation)
+            for parameter in signature.parameters.values()
+        ]
+        return_annotation = signature.return_annotation
+
+        generator = inspect.isgeneratorfunction(call)
+        async_generator = inspect.isasyncgenfunction(call)
+        coroutine = inspect.iscoroutinefunction(call)
 
     context = hasattr(call, "__enter__") and hasattr(call, "__exit__")
     async_context = hasattr(call, "__aenter__") and hasattr(call, "__aexit__")
 
-    async_ = inspect.iscoroutinefunction(call) or async_generator or async_context
+    async_ = coroutine or async_generator or async_context
     generator = generator or async_generator
     context = context or async_context
 
-    parameters = [_transform_parameter(parameter) for parameter in signature.parameters.values()]
+    # Value is validated by ``fundi.lifetime`` decorator, that sets it
+    lifetime = typing.cast(Lifetime, getattr(call, "__fundi_lifetime__", "request"))
+
+    namespace = _namespace(call)
+    parameters = [_transform_parameter(parameter, namespace) for parameter in raw_parameters]
 
     info = typing.cast(
         CallableInfo[R],
         CallableInfo(
             call=call,
-            use_cache=caching,
+            use_cache=caching and lifetime != "transient",
             async_=async_,
             context=context,
             generator=generator,
             parameters=parameters,
-            return_annotation=signature.return_annotation,
+            return_annotation=return_annotation,
             configuration=get_configuration(call) if is_configured(call) else None,
+            blocking=getattr(call, "__fundi_blocking__", False),
+            lifetime=lifetime,
         ),
     )
 
     try:
         setattr(call, "__fundi_info__", info)
     except (AttributeError, TypeError):
-        pass
+        _remember(call, info)
 
     return info
@@ -0,0 +1,239 @@
+import typing
+import collections.abc
+
+__all__ = ["Scope", "ScopeLayer", "find_by_type", "bind_parameter"]
+
+# Position of value in scope and value itself
+_Hit: typing.TypeAlias = tuple[int, typing.Any]
+
+
+def _plain(type_: type) -> bool:
+    """
+    Whether ``isinstance`` checks against this type are plain MRO membership checks
+    """
+    return isinstance(type_, type) and type(type_).__instancecheck__ is type.__instancecheck__
+
+
+class Scope(collections.abc.Mapping[str, typing.Any]):
+    """
+    Read-only injection scope with type index.
+
+    Works as any other mapping used as scope, but values resolved
+    by type (``FromType`` / ``from_(type)``) are looked up in
+    type index, built once from MRO of each value, instead of
+    checking every value in scope.
+
+    Lookup result is the same as with plain mapping - first value
+    in scope that is instance of requested type.
+    """
+
+    __slots__: tuple[str, ...] = ("_values", "_index", "_lookups")
+
+    def __init__(
+        self,
+        values: collections.abc.Mapping[str, typing.Any] | None = None,
+        /,
+        **kwargs: typing.Any,
+    ):
+        self._values: dict[str, typing.Any] = {**(values or {}), **kwargs}
+        self._index: dict[type, _Hit] | None = None
+        self._lookups: dict[tuple[type, ...], _Hit | None] = {}
+
+    def __getitem__(self, key: str) -> typing.Any:
+        return self._values[key]
+
+    def __iter__(self) -> collections.abc.Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __repr__(self) -> str:
+        return f"Scope({self._values!r})"
+
+    def keys(self) -> collections.abc.KeysView[str]:
+        return self._values.keys()
+
+    def values(self) -> collections.abc.ValuesView[typing.Any]:
+        return self._values.values()
+
+    def items(self) -> collections.abc.ItemsView[str, typing.Any]:
+        return self._values.items()
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        return self._values.get(key, default)
+
+    def _build_index(self) -> dict[type, _Hit]:
+        index: dict[type, _Hit] = {}
+
+        for position, value in enumerate(self._values.values()):
+            hit = (position, value)
+
+            for type_ in type(value).__mro__:
+                index.setdefault(type_, hit)
+
+            # Objects may pretend to be instances of other classes
+            class_ = getattr(value, "__class__", type(value))
+            if class_ is not type(value):
+                for type_ in class_.__mro__:
+                    index.setdefault(type_, hit)
+
+        return index
+
+    def _find(self, type_options: tuple[type, ...]) -> _Hit | None:
+        index = self._index
+        if index is None:
+            index = self._index = self._build_index()
+
+        found: _Hit | None = None
+
+        for type_ in type_options:
+            if _plain(type_):
+                hit = index.get(type_)
+            else:
+                # Types with custom instance checks (ABCs, protocols, etc.)
+                hit = next(
+                    (
+                        (position, value)
+                        for position, value in enumerate(self._values.values())
+                        if isinstance(value, type_)
+                    ),
+                    None,
+                )
+
+            if hit is not None and (found is None or hit[0] < found[0]):
+                found = hit
+
+        return found
+
+    def find_by_type(self, type_options: tuple[type, ...]) -> tuple[bool, typing.Any]:
+        """
+        Find first value in scope that is instance of any of provided types
+
+        :param type_options: types to look for
+        :return: whether value was found and value itself
+        """
+        try:
+            hit = self._lookups[type_options]
+        except KeyError:
+            hit = self._lookups[type_options] = self._find(type_options)
+
+        if hit is None:
+            return False, None
+
+        return True, hit[1]
+
+
+class ScopeLayer(collections.abc.Mapping[str, typing.Any]):
+    """
+    Read-only view of scope with one extra value, that does not copy scope.
+
+    Works like ``{**scope, key: value}``, but takes constant time and memory to create.
+    Used to give dependencies their ``__fundi_parameter__``
+    """
+
+    __slots__: tuple[str, ...] = ("scope", "key", "value")
+
+    def __init__(
+        self, scope: collections.abc.Mapping[str, typing.Any], key: str, value: typing.Any
+    ):
+        self.scope: collections.abc.Mapping[str, typing.Any] = scope
+        self.key: str = key
+        self.value: typing.Any = value
+
+    def __getitem__(self, key: str) -> typing.Any:
+        if key == self.key:
+            return self.value
+
+        return self.scope[key]
+
+    def __iter__(self) -> collections.abc.Iterator[str]:
+        yield from self.scope
+
+        if self.key not in self.scope:
+            yield self.key
+
+    def __len__(self) -> int:
+        return len(self.scope) + (self.key not in self.scope)
+
+    def __contains__(self, key: object) -> bool:
+        return key == self.key or key in self.scope
+
+    def __repr__(self) -> str:
+        return f"ScopeLayer({self.scope!r}, {self.key!r}, {self.value!r})"
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        if key == self.key:
+            return self.value
+
+        return self.scope.get(key, default)
+
+    def find_by_type(self, type_options: tuple[type, ...]) -> tuple[bool, typing.Any]:
+        """
+        Find first value in scope that is instance of any of provided types
+
+        :param type_options: types to look for
+        :return: whether value was found and value itself
+        """
+        if self.key in self.scope:
+            # Extra value replaces one of scope values - order of values is not changed
+            return _find_by_type(self, type_options)
+
+        found, value = find_by_type(self.scope, type_options)
+        if found:
+            return found, value
+
+        if isinstance(self.value, type_options):
+            return True, self.value
+
+        return False, None
+
+
+def _find_by_type(
+    scope: collections.abc.Mapping[str, typing.Any], type_options: tuple[type, ...]
+) -> tuple[bool, typing.Any]:
+    for value in scope.values():
+        if isinstance(value, type_options):
+            return True, value
+
+    return False, None
+
+
+def find_by_type(
+    scope: collections.abc.Mapping[str, typing.Any], type_options: tuple[type, ...]
+) -> tuple[bool, typing.Any]:
+    """
+    Find first value in scope that is instance of any of provided types.
+
+    Uses type index if scope is ``Scope``, otherwise checks every value in scope.
+
+    :param scope: container with contextual values
+    :param type_options: types to look for
+    :return: whether value was found and value itself
+    """
+    if isinstance(scope, (Scope, ScopeLayer)):
+        return scope.find_by_type(type_options)
+
+    return _find_by_type(scope, type_options)
+
+
+def bind_parameter(
+    scope: collections.abc.Mapping[str, typing.Any], parameter: typing.Any
+) -> collections.abc.Mapping[str, typing.Any]:
+    """
+    Get scope for dependency injected into parameter.
+
+    Scope is not copied - read-only view on top of it is returned instead.
+
+    :param scope: container with contextual values
+    :param parameter: parameter dependency is injected into
+    :return: scope with ``__fundi_parameter__`` set to provided parameter
+    """
+    if isinstance(scope, ScopeLayer) and scope.key == "__fundi_parameter__":
+        # Replace parameter instead of stacking views on each dependency level
+        scope = scope.scope
+
+    return ScopeLayer(scope, "__fundi_parameter__", parameter)
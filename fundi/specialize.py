@@ -0,0 +1,558 @@
+"""
+Specialized injectors.
+
+``inject`` and ``ainject`` interpret injection plan step by step. ``specialize`` turns plan
+into source of Python function that resolves the whole dependency graph at once:
+intermediate values are kept in local variables, scope values are looked up inline
+and callables are called directly with their argument layout fixed in advance.
+"""
+
+import re
+import typing
+import builtins
+import itertools
+import linecache
+import contextlib
+import collections.abc
+import concurrent.futures
+
+from fundi import hooks
+from fundi.lazy import Lazy
+from fundi.compile import compile
+from fundi.scope import bind_parameter
+from fundi.inject import inject, ainject
+from fundi.resolve import resolve_from_scope
+from fundi.overrides import Overrides, as_overrides
+from fundi.exceptions import ScopeValueNotFoundError
+from fundi.types import CacheKey, CallableInfo, InjectionPlan, Parameter, PlanStep
+from fundi.util import call_in_executor, add_injection_trace
+from fundi.teardown import CONTEXT, GENERATOR, ASYNC_CONTEXT, ASYNC_GENERATOR, Teardown
+
+if typing.TYPE_CHECKING:
+    from fundi.container import Container
+
+__all__ = ["specialize", "Injector", "AsyncInjector"]
+
+
+class Injector(typing.Protocol):
+    """
+    Specialized synchronous injector, see ``specialize``
+    """
+
+    __fundi_source__: str
+
+    def __call__(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any],
+        stack: contextlib.ExitStack,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        container: "Container | None" = None,
+    ) -> typing.Any: ...
+
+
+class AsyncInjector(typing.Protocol):
+    """
+    Specialized asynchronous injector, see ``specialize``
+    """
+
+    __fundi_source__: str
+
+    def __call__(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any],
+        stack: contextlib.AsyncExitStack,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        container: "Container | None" = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> collections.abc.Awaitable[typing.Any]: ...
+
+
+# Nesting level after which dependencies are injected by ``inject``/``ainject``
+# instead of generated code - Python limits indentation of source
+_MAX_INDENT = 48
+
+_counter = itertools.count()
+
+
+class _Frame:
+    """
+    Callable whose call is being generated
+    """
+
+    __slots__: tuple[str, ...] = (
+        "info",
+        "arguments",
+        "scope",
+        "indent",
+        "variable",
+        "parameter",
+        "known",
+        "steps",
+        "index",
+    )
+
+    def __init__(
+        self,
+        info: CallableInfo[typing.Any],
+        steps: list[PlanStep],
+        scope: str,
+        indent: int,
+        variable: str | None,
+        parameter: Parameter | None,
+        known: dict[CacheKey, str],
+    ):
+        self.info: CallableInfo[typing.Any] = info
+        # Parameters and expressions of their values
+        self.arguments: list[tuple[Parameter, str]] = []
+        # Expression of scope callable's parameters are resolved from
+        self.scope: str = scope
+        # Indentation of callable's code
+        self.indent: int = indent
+        # Variable callable's result is stored in, None for injected callable
+        self.variable: str | None = variable
+        # Parameter of dependant callable is injected into
+        self.parameter: Parameter | None = parameter
+        # Variables holding values of cached dependencies known before callable's code
+        self.known: dict[CacheKey, str] = known
+        # Plan steps of callable and position of the next one
+        self.steps: list[PlanStep] = steps
+        self.index: int = 0
+
+
+class _Generator:
+    def __init__(
+        self, info: CallableInfo[typing.Any], async_: bool, overrides: Overrides | None
+    ) -> None:
+        self.info: CallableInfo[typing.Any] = info
+        self.async_: bool = async_
+        self.overrides: Overrides | None = overrides
+
+        self.name: str = "inject_" + re.sub(r"\W", "_", getattr(info.call, "__name__", "callable"))
+        if async_:
+            self.name = "a" + self.name
+
+        self.lines: list[str] = []
+        self.variables: int = 0
+        self.constants: dict[tuple[str, int], str] = {}
+        # Cached dependencies whose code is generated
+        self.generated: set[CacheKey] = set()
+        self.namespace: dict[str, typing.Any] = {
+            "hooks": hooks,
+            "Lazy": Lazy,
+            "inject": inject,
+            "ainject": ainject,
+            "bind_parameter": bind_parameter,
+            "call_in_executor": call_in_executor,
+            "resolve_from_scope": resolve_from_scope,
+            "add_injection_trace": add_injection_trace,
+            "ScopeValueNotFoundError": ScopeValueNotFoundError,
+            "Teardown": Teardown,
+            "CONTEXT": CONTEXT,
+            "GENERATOR": GENERATOR,
+            "ASYNC_CONTEXT": ASYNC_CONTEXT,
+            "ASYNC_GENERATOR": ASYNC_GENERATOR,
+            "info": info,
+            "overrides": overrides,
+        }
+
+    def constant(self, prefix: str, value: typing.Any) -> str:
+        key = (prefix, id(value))
+        name = self.constants.get(key)
+
+        if name is None:
+            name = self.constants[key] = f"{prefix}_{len(self.constants)}"
+            self.namespace[name] = value
+
+        return name
+
+    def variable(self, prefix: str = "v") -> str:
+        self.variables += 1
+        return f"{prefix}{self.variables}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def resolve_from_scope(self, frame: _Frame, parameter: Parameter) -> str:
+        variable = self.variable()
+        info = self.constant("info", frame.info)
+
+        if parameter.resolve_by_type:
+            self.emit(
+                frame.indent,
+                f"{variable} = resolve_from_scope("
+                f"{frame.scope}, {self.constant('param', parameter)}, {info})",
+            )
+            return variable
+
+        # Membership is checked like ``resolve_from_scope`` does - mappings may
+        # produce values for missing keys on lookup (e.g. ``defaultdict``)
+        self.emit(frame.indent, f"if {parameter.name!r} in {frame.scope}:")
+        self.emit(frame.indent + 1, f"{variable} = {frame.scope}[{parameter.name!r}]")
+        self.emit(frame.indent, "else:")
+
+        if parameter.has_default:
+            self.emit(
+                frame.indent + 1, f"{variable} = {self.constant('default', parameter.default)}"
+            )
+        else:
+            self.emit(
+                frame.indent + 1,
+                f"raise ScopeValueNotFoundError({parameter.name!r}, {info})",
+            )
+
+        return variable
+
+    def call(self, frame: _Frame) -> str:
+        """
+        Generate call of callable, return expression of its result
+        """
+        info = frame.info
+        call = self.constant("call", info.call)
+
+        positional: list[str] = []
+        keyword: list[str] = []
+        for parameter, value in frame.arguments:
+            if parameter.positional_varying:
+                positional.append(f"*{value}")
+            elif parameter.keyword_varying:
+                keyword.append(f"**{value}")
+            elif parameter.keyword_only:
+                keyword.append(f"{parameter.name}={value}")
+            else:
+                positional.append(value)
+
+        expression = f"{call}({', '.join(positional + keyword)})"
+        indent = frame.indent
+
+        if self.async_ and not info.async_ and info.blocking:
+            values = ", ".join(
+                f"{parameter.name!r}: {value}" for parameter, value in frame.arguments
+            )
+            return f"await call_in_executor(stack, {self.constant('info', info)}, {{{values}}}, executor)"
+
+        if not (info.context or info.generator):
+            return f"await {expression}" if info.async_ else expression
+
+        manager = self.variable("m")
+        variable = frame.variable or self.variable()
+        self.emit(indent, f"{manager} = {expression}")
+
+        if info.async_:
+            if info.context:
+                self.emit(indent, f"{variable} = await {manager}.__aenter__()")
+                self.emit(indent, f"stack.add(ASYNC_CONTEXT, {manager})")
+            else:
+                self.emit(indent, f"{variable} = await anext({manager})")
+                self.emit(indent, f"stack.add(ASYNC_GENERATOR, {manager})")
+
+            return variable
+
+        if info.context:
+            self.emit(indent, f"{variable} = {manager}.__enter__()")
+            self.emit(indent, f"stack.add(CONTEXT, {manager})")
+
+            if info.generator:
+                generator = self.variable("m")
+                self.emit(indent, f"{generator} = {variable}")
+                self.emit(indent, f"{variable} = next({generator})")
+                self.emit(indent, f"stack.add(GENERATOR, {generator})")
+        else:
+            self.emit(indent, f"{variable} = next({manager})")
+            self.emit(indent, f"stack.add(GENERATOR, {manager})")
+
+        return variable
+
+    def inject(self, dependency: CallableInfo[typing.Any], scope: str, nested: bool) -> str:
+        """
+        Generate injection of dependency by its own specialized injector (if ``nested``)
+        or by ``inject``/``ainject``
+        """
+        if nested:
+            injector = self.constant(
+                "injector", specialize(dependency, self.async_, self.overrides)
+            )
+
+            if self.async_:
+                return f"await {injector}({scope}, stack, cache, container, executor)"
+
+            return f"{injector}({scope}, stack, cache, container)"
+
+        info = self.constant("info", dependency)
+
+        if self.async_:
+            return (
+                f"await ainject({scope}, {info}, stack, cache, overrides, "
+                "executor=executor, container=container)"
+            )
+
+        return f"inject({scope}, {info}, stack, cache, overrides, container=container)"
+
+    def generate(self) -> str:
+        if self.async_:
+            self.emit(
+                0,
+                f"async def {self.name}(scope, stack, cache=None, container=None, executor=None):",
+            )
+        else:
+            self.emit(0, f"def {self.name}(scope, stack, cache=None, container=None):")
+
+        self.emit(1, "if cache is None:")
+        self.emit(2, "cache = {}")
+
+        # Generated code does not call hooks - leave injection to interpreter when they are used
+        self.emit(1, "if hooks._registered:")
+        if self.async_:
+            self.emit(
+                2,
+                "return await ainject(scope, info, stack, cache, overrides, "
+                "executor=executor, container=container)",
+            )
+        else:
+            self.emit(2, "return inject(scope, info, stack, cache, overrides, container=container)")
+
+        # Lifespan dependencies are registered in teardown registry of injection
+        self.emit(1, "if type(stack) is not Teardown:")
+        self.emit(2, "stack = Teardown(stack)")
+
+        self.emit(1, "try:")
+
+        steps = compile(self.info, self.overrides).steps
+        frames = [_Frame(self.info, steps, "scope", 2, None, None, {})]
+        known: dict[CacheKey, str] = {}
+
+        while frames:
+            frame = frames[-1]
+            step = frame.steps[frame.index]
+            frame.index += 1
+
+            if step.op == PlanStep.SCOPE:
+                parameter = typing.cast(Parameter, step.parameter)
+                frame.arguments.append((parameter, self.resolve_from_scope(frame, parameter)))
+                continue
+
+            if step.op == PlanStep.VALUE:
+                parameter = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+                value = typing.cast(Overrides, self.overrides)[dependency.call]
+                frame.arguments.append((parameter, self.constant("value", value)))
+                continue
+
+            if step.op == PlanStep.LAZY:
+                parameter = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+                scope = self.bind(frame.indent, step)
+                variable = self.variable()
+
+                self.emit(
+                    frame.indent,
+                    f"{variable} = Lazy({self.constant('info', dependency)}, {scope}, stack, "
+                    f"cache, overrides, container, None" + (", executor)" if self.async_ else ")"),
+                )
+                frame.arguments.append((parameter, variable))
+                continue
+
+            if step.op == PlanStep.ENTER:
+                parameter = typing.cast(Parameter, step.parameter)
+                dependency = typing.cast(CallableInfo[typing.Any], step.dependency)
+
+                if dependency.async_ and not self.async_:
+                    raise RuntimeError("Cannot process async functions in synchronous injection")
+
+                if dependency.use_cache and dependency.key in known:
+                    # Dependency is already resolved by preceding code
+                    frame.arguments.append((parameter, known[dependency.key]))
+                    continue
+
+                variable = self.variable()
+                indent = frame.indent
+                branched = dependency.use_cache or dependency.lifetime == "singleton"
+
+                # Escaped, so name can not break out of comment
+                name = str(getattr(dependency.call, "__qualname__", dependency.call))
+                self.emit(indent, f"# {repr(name)[1:-1]}")
+
+                if dependency.lifetime == "singleton":
+                    info = self.constant("info", dependency)
+                    self.emit(indent, "if container is not None:")
+                    scope = self.bind(indent + 1, step)
+
+                    if self.async_:
+                        self.emit(
+                            indent + 1,
+                            f"{variable} = await container.aresolve("
+                            f"{scope}, {info}, overrides, executor)",
+                        )
+                    else:
+                        self.emit(
+                            indent + 1,
+                            f"{variable} = container.resolve({scope}, {info}, overrides)",
+                        )
+
+                if dependency.use_cache:
+                    key = self.constant("key", dependency.key)
+                    keyword = "elif" if dependency.lifetime == "singleton" else "if"
+                    self.emit(indent, f"{keyword} {key} in cache:")
+                    self.emit(indent + 1, f"{variable} = cache[{key}]")
+
+                if branched:
+                    self.emit(indent, "else:")
+                    indent += 1
+
+                scope = self.bind(indent, step)
+
+                # Code of dependency is already generated in branch preceding code does not know
+                # result of - it is resolved there, unless that branch was skipped on cache hit
+                repeated = dependency.use_cache and dependency.key in self.generated
+
+                if repeated or indent >= _MAX_INDENT:
+                    self.emit(
+                        indent, f"{variable} = {self.inject(dependency, scope, not repeated)}"
+                    )
+                    if dependency.use_cache:
+                        self.emit(
+                            indent, f"cache[{self.constant('key', dependency.key)}] = {variable}"
+                        )
+                        known[dependency.key] = variable
+
+                    frame.arguments.append((parameter, variable))
+                    continue
+
+                frames.append(
+                    _Frame(
+                        dependency,
+                        typing.cast(InjectionPlan, step.plan).steps,
+                        scope,
+                        indent,
+                        variable,
+                        parameter,
+                        known,
+                    )
+                )
+
+                if dependency.use_cache:
+                    self.generated.add(dependency.key)
+
+                # Values resolved in branch are not known after it
+                if branched:
+                    known = dict(known)
+                continue
+
+            # CALL - callable's parameters are resolved
+            frames.pop()
+            expression = self.call(frame)
+
+            if frame.variable is None:
+                self.emit(frame.indent, f"return {expression}")
+                break
+
+            if expression != frame.variable:
+                self.emit(frame.indent, f"{frame.variable} = {expression}")
+
+            info = frame.info
+            if info.use_cache:
+                self.emit(
+                    frame.indent, f"cache[{self.constant('key', info.key)}] = {frame.variable}"
+                )
+
+            known = frame.known
+            if info.use_cache:
+                known[info.key] = frame.variable
+
+            frames[-1].arguments.append((typing.cast(Parameter, frame.parameter), frame.variable))
+
+        self.emit(1, "except Exception as exc:")
+        self.emit(2, "add_injection_trace(exc, info, {})")
+        self.emit(2, "raise")
+
+        return "\n".join(self.lines) + "\n"
+
+    def bind(self, indent: int, step: PlanStep) -> str:
+        """
+        Generate scope of dependency, return its expression
+        """
+        if not step.scoped:
+            return "scope"
+
+        variable = self.variable("s")
+        self.emit(
+            indent,
+            f"{variable} = bind_parameter(scope, {self.constant('param', step.parameter)})",
+        )
+        return variable
+
+
+@typing.overload
+def specialize(
+    info: CallableInfo[typing.Any],
+    async_: typing.Literal[False] = False,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> Injector: ...
+@typing.overload
+def specialize(
+    info: CallableInfo[typing.Any],
+    async_: typing.Literal[True],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> AsyncInjector: ...
+@typing.overload
+def specialize(
+    info: CallableInfo[typing.Any],
+    async_: bool,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> Injector | AsyncInjector: ...
+def specialize(
+    info: CallableInfo[typing.Any],
+    async_: bool = False,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> Injector | AsyncInjector:
+    """
+    Generate injector specialized for dependency graph of callable.
+
+    Injector is a function that does the same as ``inject`` (or ``ainject`` if ``async_`` is True)
+    with this callable information and overrides, without interpreting injection plan::
+
+        injector = specialize(scan(handler))
+
+        with ExitStack() as stack:
+            result = injector({"request": request}, stack)
+
+    Asynchronous injector also accepts executor to run blocking dependencies in.
+    Generated source is available as ``injector.__fundi_source__``
+    (and is shown in tracebacks and by ``inspect.getsource``).
+
+    While hooks are registered, injector leaves injection to ``inject``/``ainject``.
+    Exceptions get injection trace of injected callable only.
+    Injectors are generated once and reused for the same overrides (compared by identity
+    of overriding values), and are kept as long as callable information is,
+    so overrides that change per call should be passed to ``inject``/``ainject`` instead.
+
+    :param info: callable information
+    :param async_: whether to generate asynchronous injector
+    :param override: override dependencies, injector always uses them
+    :return: injector
+    """
+    overrides = as_overrides(override)
+
+    if info.async_ and not async_:
+        raise RuntimeError("Cannot process async functions in synchronous injection")
+
+    key = (async_, overrides or None)
+    injector = info.injectors.get(key)
+    if injector is not None:
+        return injector
+
+    generator = _Generator(info, async_, overrides)
+    source = generator.generate()
+
+    name = getattr(info.call, "__qualname__", "callable")
+    filename = f"<fundi injector {next(_counter)} for {name}>"
+    # Make source visible in tracebacks and to ``inspect``
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    # ``compile`` builtin is shadowed by ``fundi.compile.compile`` here
+    exec(builtins.compile(source, filename, "exec"), generator.namespace)
+    injector = typing.cast(Injector | AsyncInjector, generator.namespace[generator.name])
+    injector.__fundi_source__ = source
+
+    info.injectors[key] = injector
+
+    return injector
@@ -0,0 +1,378 @@
+"""
+Teardown of lifespan dependencies.
+
+Instead of pushing a closure per lifespan dependency onto exit stack, injection
+registers ``(kind, object)`` records in ``Teardown``, that pushes them onto exit stack
+in segments - a new segment is pushed only when anything else was pushed
+onto exit stack after the previous one. Records are unwound in reverse order,
+following the same exception propagation rules as exit stack.
+"""
+
+import sys
+import typing
+import asyncio
+import warnings
+import functools
+import contextlib
+import contextvars
+import concurrent.futures
+from types import TracebackType
+
+__all__ = [
+    "Teardown",
+    "as_teardown",
+    "CONTEXT",
+    "GENERATOR",
+    "ASYNC_CONTEXT",
+    "ASYNC_GENERATOR",
+    "EXECUTOR",
+    "EXIT",
+    "ASYNC_EXIT",
+    "CALLBACK",
+]
+
+# Record kinds, and objects they are recorded with
+CONTEXT = 0  # context manager
+GENERATOR = 1  # generator
+ASYNC_CONTEXT = 2  # asynchronous context manager
+ASYNC_GENERATOR = 3  # asynchronous generator
+EXECUTOR = 4  # (kind, object, executor, context) - synchronous record unwound in executor
+EXIT = 5  # exit callback, or object with ``__exit__`` method
+ASYNC_EXIT = 6  # asynchronous exit callback, or object with ``__aexit__`` method
+CALLBACK = 7  # (callback, args, kwargs) - callback that does not receive exception
+
+_ASYNC_KINDS = frozenset((ASYNC_CONTEXT, ASYNC_GENERATOR, EXECUTOR, ASYNC_EXIT))
+
+Record: typing.TypeAlias = tuple[int, typing.Any]
+# Synchronous record, executor and context it is unwound in
+ExecutorRecord: typing.TypeAlias = tuple[
+    int, typing.Any, concurrent.futures.Executor | None, contextvars.Context
+]
+
+
+def _exit(
+    kind: int,
+    target: typing.Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    tb: TracebackType | None,
+) -> bool:
+    """
+    Unwind synchronous record, return whether exception is suppressed
+    """
+    if kind == CONTEXT:
+        try:
+            target.__exit__(exc_type, exc_value, tb)
+        except Exception as e:
+            # Do not include re-raise of this exception in traceback to make it cleaner
+            if e is exc_value:
+                return False
+
+            raise
+
+        # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+        return exc_type is None
+
+    if kind == GENERATOR:
+        try:
+            if exc_type is not None:
+                target.throw(exc_type, exc_value, tb)
+            else:
+                next(target)
+        except StopIteration:
+            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+            return exc_type is None
+        except Exception as e:
+            # Do not include re-raise of this exception in traceback to make it cleaner
+            if e is exc_value:
+                return False
+
+            raise
+
+        warnings.warn("Generator not exited", UserWarning)
+
+        # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+        return exc_type is None
+
+    if kind == EXIT:
+        exit_ = getattr(type(target), "__exit__", None)
+        if exit_ is not None:
+            return bool(exit_(target, exc_type, exc_value, tb))
+
+        return bool(target(exc_type, exc_value, tb))
+
+    if kind == CALLBACK:
+        callback, args, kwargs = target
+        callback(*args, **kwargs)
+        return False
+
+    raise RuntimeError("Cannot tear down async dependencies synchronously")
+
+
+async def _aexit(
+    kind: int,
+    target: typing.Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    tb: TracebackType | None,
+) -> bool:
+    """
+    Unwind record, return whether exception is suppressed
+    """
+    if kind == ASYNC_CONTEXT:
+        try:
+            await target.__aexit__(exc_type, exc_value, tb)
+        except Exception as e:
+            # Do not include re-raise of this exception in traceback to make it cleaner
+            if e is exc_value:
+                return False
+
+            raise
+
+        # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+        return exc_type is None
+
+    if kind == ASYNC_GENERATOR:
+        try:
+            if exc_type is not None:
+                await target.athrow(exc_type, exc_value, tb)
+            else:
+                await anext(target)
+        except StopAsyncIteration:
+            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+            return exc_type is None
+        except Exception as e:
+            # Do not include re-raise of this exception in traceback to make it cleaner
+            if e is exc_value:
+                return False
+
+            raise
+
+        warnings.warn("Generator not exited", UserWarning)
+
+        # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
+        return exc_type is None
+
+    if kind == EXECUTOR:
+        record: ExecutorRecord = target
+        inner_kind, inner_target, executor, context = record
+        unwind = functools.partial(_exit, inner_kind, inner_target, exc_type, exc_value, tb)
+        return bool(await asyncio.get_running_loop().run_in_executor(executor, context.run, unwind))
+
+    if kind == ASYNC_EXIT:
+        exit_ = getattr(type(target), "__aexit__", None)
+        if exit_ is not None:
+            return bool(await exit_(target, exc_type, exc_value, tb))
+
+        return bool(await target(exc_type, exc_value, tb))
+
+    return _exit(kind, target, exc_type, exc_value, tb)
+
+
+def _on_top(stack: contextlib.ExitStack | contextlib.AsyncExitStack, segment: "Teardown") -> bool:
+    """
+    Check whether segment is the last entry pushed onto exit stack
+
+    Exit stack provides no public way to inspect its entries, so its private
+    ``_exit_callbacks`` are used (``test_teardown_exit_stack_layout`` pins their layout).
+    If they can not be inspected, segment is never considered on top: every record
+    gets its own segment, which keeps unwinding order correct, only slower.
+    """
+    # Exit stack keeps pushed entries as (is_sync, callback) pairs,
+    # context managers are pushed as their exit methods bound to them
+    try:
+        callback = getattr(stack, "_exit_callbacks")[-1][1]
+    except (AttributeError, TypeError, LookupError):
+        return False
+
+    return getattr(callback, "__self__", None) is segment
+
+
+def _fix_context(
+    new: BaseException, old: BaseException | None, frame: BaseException | None
+) -> None:
+    # Context of exception raised while unwinding is the exception unwinding started with
+    # (see ``contextlib.ExitStack.__exit__``)
+    while True:
+        context = new.__context__
+        if context is None or context is old:
+            return
+
+        if context is frame:
+            break
+
+        new = context
+
+    new.__context__ = old
+
+
+class Teardown:
+    """
+    Compact registry of teardown of lifespan dependencies.
+
+    Records are ``(kind, object)`` pairs, unwound in reverse order.
+    Lifespan dependencies can not suppress exceptions, exception raised
+    while unwinding record is passed to the next records, just like in exit stack.
+
+    Registry created for exit stack pushes records onto it in segments (registries themselves):
+    records are added to the last pushed segment while it is the last entry of exit stack,
+    so they are unwound in the same order relative to other entries of exit stack,
+    as if every record was pushed separately. Registry created without exit stack
+    is unwound by its owner.
+
+    Registry also provides ``push``, ``push_async_exit`` and ``callback`` methods of exit stack,
+    so it can be used everywhere exit stack is expected by FunDI.
+    """
+
+    __slots__: tuple[str, ...] = ("stack", "async_", "records", "segment")
+
+    def __init__(
+        self,
+        stack: contextlib.ExitStack | contextlib.AsyncExitStack | None = None,
+        async_: bool | None = None,
+    ):
+        self.stack: contextlib.ExitStack | contextlib.AsyncExitStack | None = stack
+        # Whether registry can hold asynchronous records
+        self.async_: bool = (
+            isinstance(stack, contextlib.AsyncExitStack) if async_ is None else async_
+        )
+        self.records: list[Record] = []
+        # Segment records are added to, last pushed onto exit stack
+        self.segment: Teardown | None = None
+
+    def add(self, kind: int, target: typing.Any) -> None:
+        """
+        Add record.
+
+        :param kind: record kind
+        :param target: object to tear down
+        """
+        if kind in _ASYNC_KINDS and not self.async_:
+            raise RuntimeError("Cannot register async teardown in synchronous injection")
+
+        stack = self.stack
+        if stack is None:
+            self.records.append((kind, target))
+            return
+
+        segment = self.segment
+        if segment is None or not _on_top(stack, segment):
+            segment = self.segment = Teardown(async_=self.async_)
+
+            if self.async_:
+                typing.cast(contextlib.AsyncExitStack, stack).push_async_exit(segment)
+            else:
+                stack.push(segment)
+
+        segment.records.append((kind, target))
+
+    def push(self, exit: typing.Any) -> None:
+        self.add(EXIT, exit)
+
+    def push_async_exit(self, exit: typing.Any) -> None:
+        self.add(ASYNC_EXIT, exit)
+
+    def callback(
+        self, callback: typing.Callable[..., typing.Any], /, *args: typing.Any, **kwargs: typing.Any
+    ) -> None:
+        self.add(CALLBACK, (callback, args, kwargs))
+
+    def _take(self) -> list[Record]:
+        records = self.records
+        self.records = []
+        return records
+
+    def __enter__(self) -> "Teardown":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        records = self._take()
+
+        received = exc_type is not None
+        frame = sys.exc_info()[1]
+        suppressed = False
+        pending = False
+
+        while records:
+            kind, target = records.pop()
+
+            try:
+                if _exit(kind, target, exc_type, exc_value, tb):
+                    suppressed = True
+                    pending = False
+                    exc_type = exc_value = tb = None
+            except BaseException as e:
+                _fix_context(e, exc_value, frame)
+                pending = True
+                exc_type, exc_value, tb = type(e), e, e.__traceback__
+
+        if pending:
+            exception = typing.cast(BaseException, exc_value)
+            context = exception.__context__
+            try:
+                raise exception
+            except BaseException:
+                exception.__context__ = context
+                raise
+
+        return received and suppressed
+
+    async def __aenter__(self) -> "Teardown":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        records = self._take()
+
+        received = exc_type is not None
+        frame = sys.exc_info()[1]
+        suppressed = False
+        pending = False
+
+        while records:
+            kind, target = records.pop()
+
+            try:
+                if await _aexit(kind, target, exc_type, exc_value, tb):
+                    suppressed = True
+                    pending = False
+                    exc_type = exc_value = tb = None
+            except BaseException as e:
+                _fix_context(e, exc_value, frame)
+                pending = True
+                exc_type, exc_value, tb = type(e), e, e.__traceback__
+
+        if pending:
+            exception = typing.cast(BaseException, exc_value)
+            context = exception.__context__
+            try:
+                raise exception
+            except BaseException:
+                exception.__context__ = context
+                raise
+
+        return received and suppressed
+
+
+def as_teardown(
+    stack: contextlib.ExitStack | contextlib.AsyncExitStack | Teardown,
+) -> Teardown:
+    """
+    Get teardown registry injection registers lifespan dependencies in.
+
+    :param stack: exit stack provided to injection, or registry of injection it is part of
+    :return: teardown registry
+    """
+    if isinstance(stack, Teardown):
+        return stack
+
+    return Teardown(stack)
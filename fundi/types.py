@@ -1,21 +1,45 @@
 import typing
+import weakref
+import operator
 import collections
 import collections.abc
 from typing_extensions import override
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+if typing.TYPE_CHECKING:
+    from fundi.overrides import Overrides
 
 __all__ = [
     "R",
+    "Lifetime",
     "Parameter",
     "TypeResolver",
+    "LazyResolver",
     "CallableInfo",
+    "PlanStep",
+    "InjectionPlan",
     "InjectionTrace",
     "ParameterResult",
     "DependencyConfiguration",
+    "CacheInfo",
+    "DependencyStats",
+    "CallableReference",
 ]
 
 R = typing.TypeVar("R")
 
+# Dependencies that are overridden, and identities of overriding dependencies (see ``Overrides``)
+OverrideShape: typing.TypeAlias = frozenset[tuple[typing.Callable[..., typing.Any], typing.Any]]
+
+Lifetime: typing.TypeAlias = typing.Literal["singleton", "request", "transient"]
+"""
+How long dependency result lives:
+
+- ``singleton`` - for the whole application lifetime, in ``Container``;
+- ``request`` - for one injection (default);
+- ``transient`` - result is never reused.
+"""
+
 
 @dataclass
 class TypeResolver:
@@ -29,6 +53,17 @@ class TypeResolver:
     annotation: type
 
 
+@dataclass
+class LazyResolver:
+    """
+    Mark that tells ``fundi.scan.scan`` to set ``Parameter.lazy`` to True.
+
+    Parameter gets ``fundi.lazy.Lazy`` handle of ``dependency`` instead of its value
+    """
+
+    dependency: "CallableInfo[typing.Any]"
+
+
 @dataclass
 class Parameter:
     name: str
@@ -41,6 +76,15 @@ class Parameter:
     keyword_only: bool = False
     positional_varying: bool = False
     keyword_varying: bool = False
+    # Parameter gets handle that resolves dependency on first use
+    lazy: bool = False
+    # Normalized annotation of parameter resolved by type.
+    # Computed on scan, or on first resolution if annotation contains forward references
+    type_options: "tuple[type, ...] | None" = field(default=None, compare=False, repr=False)
+    # Namespace to evaluate forward references in
+    namespace: "collections.abc.Mapping[str, typing.Any] | None" = field(
+        default=None, compare=False, repr=False
+    )
 
 
 @dataclass
@@ -53,12 +97,70 @@ class CallableInfo(typing.Generic[R]):
     parameters: list[Parameter]
     return_annotation: typing.Any
     configuration: "DependencyConfiguration | None"
+    blocking: bool = False
+    lifetime: "Lifetime" = "request"
     named_parameters: dict[str, Parameter] = field(init=False)
     key: "CacheKey" = field(init=False)
+    plan: "InjectionPlan | None" = field(init=False, default=None, repr=False)
+    # Plans with overrides applied, by override shape (limited, see ``fundi.compile``)
+    plans: "dict[OverrideShape, InjectionPlan]" = field(
+        init=False, default_factory=dict, repr=False
+    )
+    variants: "dict[tuple[bool, Lifetime], CallableInfo[R]]" = field(
+        init=False, default_factory=dict, repr=False
+    )
+    # Specialized injectors, by whether they are asynchronous and their overrides
+    # (see ``fundi.specialize``)
+    injectors: "dict[tuple[bool, Overrides | None], typing.Any]" = field(
+        init=False, default_factory=dict, repr=False
+    )
+    argument_builder: "ArgumentBuilder" = field(init=False, repr=False)
 
     def __post_init__(self):
         self.named_parameters = {p.name: p for p in self.parameters}
         self.key = CacheKey(self.call)
+        self.argument_builder = _make_argument_builder(self.parameters)
+
+    def _variant(self, use_cache: bool, lifetime: "Lifetime") -> "CallableInfo[R]":
+        # Transient dependencies are never cached
+        use_cache = use_cache and lifetime != "transient"
+
+        if self.use_cache is use_cache and self.lifetime == lifetime:
+            return self
+
+        variant = self.variants.get((use_cache, lifetime))
+        if variant is None:
+            if not self.variants:
+                self.variants[(self.use_cache, self.lifetime)] = self
+
+            variant = replace(self, use_cache=use_cache, lifetime=lifetime)
+            # Variants share the same table, so every variant can find others
+            variant.variants = self.variants
+            self.variants[(use_cache, lifetime)] = variant
+
+        return variant
+
+    def with_caching(self, use_cache: bool) -> "CallableInfo[R]":
+        """
+        Get variant of this callable information with different ``use_cache`` value.
+
+        Variants are created once and reused on subsequent calls.
+
+        :param use_cache: whether to use cached result of this callable or not
+        :return: callable information
+        """
+        return self._variant(use_cache, self.lifetime)
+
+    def with_lifetime(self, lifetime: "Lifetime") -> "CallableInfo[R]":
+        """
+        Get variant of this callable information with different lifetime.
+
+        Variants are created once and reused on subsequent calls.
+
+        :param lifetime: lifetime of callable result
+        :return: callable information
+        """
+        return self._variant(lifetime != "transient", lifetime)
 
     @override
     def __hash__(self) -> int:
@@ -66,7 +168,13 @@ class CallableInfo(typing.Generic[R]):
 
     @override
     def __eq__(self, value: object) -> bool:
-        return hash(self.key) == hash(value)
+        if isinstance(value, CallableInfo):
+            return self.key == value.key
+
+        if isinstance(value, CacheKey):
+            return self.key == value
+
+        return NotImplemented
 
     def _build_values(
         self,
@@ -122,58 +230,169 @@ class CallableInfo(typing.Generic[R]):
     def build_arguments(
         self, values: collections.abc.Mapping[str, typing.Any]
     ) -> tuple[tuple[typing.Any, ...], dict[str, typing.Any]]:
-        positional: tuple[typing.Any, ...] = ()
-        keyword: dict[str, typing.Any] = {}
+        return self.argument_builder(values)
 
-        for parameter in self.parameters:
-            name = parameter.name
 
-            if name not in values:
-                raise ValueError(f'Value for "{name}" parameter not found')
+ArgumentBuilder: typing.TypeAlias = typing.Callable[
+    [collections.abc.Mapping[str, typing.Any]],
+    tuple[tuple[typing.Any, ...], dict[str, typing.Any]],
+]
+
+
+def _make_argument_builder(parameters: list[Parameter]) -> ArgumentBuilder:
+    """
+    Create function that builds call arguments from parameter values.
+
+    Parameters are split into positional and keyword ones once,
+    so building arguments does not need to inspect parameters
+    """
+    positional: list[str] = []
+    keyword: list[str] = []
+    positional_varying: str | None = None
+    keyword_varying: str | None = None
+
+    for parameter in parameters:
+        if parameter.positional_varying:
+            positional_varying = parameter.name
+        elif parameter.keyword_varying:
+            keyword_varying = parameter.name
+        elif parameter.keyword_only:
+            keyword.append(parameter.name)
+        else:
+            positional.append(parameter.name)
+
+    positional_names = tuple(positional)
+    keyword_names = tuple(keyword)
+
+    def get_single(values: collections.abc.Mapping[str, typing.Any]) -> tuple[typing.Any, ...]:
+        return (values[positional_names[0]],)
+
+    def get_nothing(values: collections.abc.Mapping[str, typing.Any]) -> tuple[typing.Any, ...]:
+        return ()
+
+    get_positional: typing.Callable[
+        [collections.abc.Mapping[str, typing.Any]], tuple[typing.Any, ...]
+    ] = get_nothing
+
+    if len(positional_names) > 1:
+        get_positional = operator.itemgetter(*positional_names)
+    elif positional_names:
+        get_positional = get_single
 
-            value = values[name]
+    def build_arguments(
+        values: collections.abc.Mapping[str, typing.Any],
+    ) -> tuple[tuple[typing.Any, ...], dict[str, typing.Any]]:
+        try:
+            return get_positional(values), {name: values[name] for name in keyword_names}
+        except KeyError as exc:
+            raise ValueError(f'Value for "{exc.args[0]}" parameter not found') from None
 
-            if parameter.positional_only:
-                positional += (value,)
-            elif parameter.positional_varying:
-                positional += value
-            elif parameter.keyword_only:
-                keyword[name] = value
-            elif parameter.keyword_varying:
-                keyword.update(value)
-            else:
-                positional += (value,)
+    if positional_varying is None and keyword_varying is None:
+        return build_arguments
 
-        return positional, keyword
+    def build_varying_arguments(
+        values: collections.abc.Mapping[str, typing.Any],
+    ) -> tuple[tuple[typing.Any, ...], dict[str, typing.Any]]:
+        try:
+            args = get_positional(values)
+            if positional_varying is not None:
+                args += tuple(values[positional_varying])
 
+            kwargs = {name: values[name] for name in keyword_names}
+            if keyword_varying is not None:
+                kwargs.update(values[keyword_varying])
+        except KeyError as exc:
+            raise ValueError(f'Value for "{exc.args[0]}" parameter not found') from None
 
-class CacheKey:
-    __slots__: tuple[str, ...] = ("_hash", "_items")
+        return args, kwargs
 
-    def __init__(self, *initial_items: collections.abc.Hashable):
-        self._hash: int | None = None
-        self._items: list[collections.abc.Hashable] = list(initial_items)
+    return build_varying_arguments
 
-    def add(self, *items: collections.abc.Hashable):
-        self._items.extend(items)
-        self._hash = None
+
+class _Identity:
+    """
+    Unhashable cache key item, compared by identity
+    """
+
+    __slots__: tuple[str, ...] = ("item",)
+
+    def __init__(self, item: typing.Any):
+        self.item: typing.Any = item
 
     @override
     def __hash__(self) -> int:
-        if self._hash is not None:
-            return self._hash
+        return id(self.item)
+
+    @override
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, _Identity) and value.item is self.item
+
+
+def _hashable(item: typing.Any) -> collections.abc.Hashable:
+    try:
+        hash(item)
+    except TypeError:
+        return _Identity(item)
+
+    return item
 
-        self._hash = hash(tuple(self._items))
 
+class CacheKey:
+    """
+    Immutable dependency cache key.
+
+    Keys are interned - creating key from equal items returns already existing key,
+    so cache lookups mostly succeed on identity check. Hash is computed once,
+    equality compares items, so keys with colliding hashes never match.
+    Unhashable items are compared by identity.
+    """
+
+    __slots__: tuple[str, ...] = ("items", "_hash", "__weakref__")
+
+    _interned: typing.ClassVar[
+        "weakref.WeakValueDictionary[tuple[collections.abc.Hashable, ...], CacheKey]"
+    ] = weakref.WeakValueDictionary()
+
+    items: tuple[collections.abc.Hashable, ...]
+    _hash: int
+
+    def __new__(cls, *items: typing.Any) -> "CacheKey":
+        try:
+            hash_ = hash(items)
+        except TypeError:
+            items = tuple(_hashable(item) for item in items)
+            hash_ = hash(items)
+
+        key = cls._interned.get(items)
+        if key is None:
+            key = super().__new__(cls)
+            object.__setattr__(key, "items", items)
+            object.__setattr__(key, "_hash", hash_)
+            cls._interned[items] = key
+
+        return key
+
+    @override
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError("CacheKey is immutable")
+
+    @override
+    def __hash__(self) -> int:
         return self._hash
 
     @override
-    def __eq__(self, value: typing.Hashable) -> bool:
-        return self._hash == hash(value)
+    def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
+        if not isinstance(value, CacheKey):
+            return NotImplemented
+
+        return self._hash == value._hash and self.items == value.items
 
     @override
     def __repr__(self) -> str:
-        return f"#{hash(self)}"
+        return f"#{self._hash}"
 
 
 @dataclass
@@ -184,6 +403,43 @@ class ParameterResult:
     resolved: bool
 
 
+@dataclass(slots=True)
+class PlanStep:
+    """
+    Single step of ``InjectionPlan``.
+
+    - ``SCOPE`` - resolve ``parameter`` value from scope
+    - ``ENTER`` - start resolution of ``dependency`` for ``parameter``
+      by its own ``plan``, that is not run if its value is already known (from cache)
+    - ``CALL`` - call the callable whose parameters were resolved by preceding steps
+    - ``VALUE`` - use overriding value of ``dependency`` for ``parameter``
+    - ``LAZY`` - use handle that resolves ``dependency`` on first use for ``parameter``
+    """
+
+    SCOPE: typing.ClassVar[int] = 0
+    ENTER: typing.ClassVar[int] = 1
+    CALL: typing.ClassVar[int] = 2
+    VALUE: typing.ClassVar[int] = 3
+    LAZY: typing.ClassVar[int] = 4
+
+    op: int
+    parameter: Parameter | None = None
+    dependency: "CallableInfo[typing.Any] | None" = None
+    plan: "InjectionPlan | None" = None
+    scoped: bool = False
+
+
+@dataclass(slots=True)
+class InjectionPlan:
+    """
+    Topologically ordered list of steps needed to inject callable.
+    Dependencies are entered by their own plans
+    """
+
+    info: CallableInfo[typing.Any]
+    steps: list[PlanStep]
+
+
 @dataclass
 class InjectionTrace:
     info: CallableInfo[typing.Any]
@@ -195,3 +451,52 @@ class InjectionTrace:
 class DependencyConfiguration:
     configurator: CallableInfo[typing.Any]
     values: collections.abc.Mapping[str, typing.Any]
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int | None
+    cost: int = 0
+    max_cost: int | None = None
+
+
+@dataclass
+class DependencyStats:
+    """
+    Profiling statistics of dependency callable (see ``fundi.debug.profile``).
+
+    Times are in seconds. ``cumulative_time`` covers resolving callable's dependencies
+    and calling it, ``self_time`` - only calling it (for lifespan dependencies it is their setup),
+    ``teardown_time`` - running teardown of lifespan dependency.
+    """
+
+    call: typing.Callable[..., typing.Any]
+    calls: int = 0
+    hits: int = 0
+    cumulative_time: float = 0.0
+    self_time: float = 0.0
+    teardown_time: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of dependency usages served from cache"""
+        total = self.calls + self.hits
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class CallableReference:
+    """
+    Picklable reference to callable information (see ``fundi.pool``).
+
+    Callable is referenced by its import path (``module:qualname``), its dependency graph
+    is scanned again from its signature when reference is restored
+    """
+
+    path: str
+    use_cache: bool = True
+    lifetime: Lifetime = "request"
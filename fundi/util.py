@@ -1,17 +1,29 @@
 import types
 import typing
+import asyncio
 import inspect
-import warnings
+import functools
 import contextlib
+import contextvars
 import collections.abc
-from types import TracebackType
+import concurrent.futures
 
-from fundi.types import CallableInfo, InjectionTrace, DependencyConfiguration
+from fundi.types import R, CallableInfo, InjectionTrace, DependencyConfiguration
+from fundi.teardown import (
+    EXECUTOR,
+    CONTEXT,
+    GENERATOR,
+    ASYNC_CONTEXT,
+    ASYNC_GENERATOR,
+    Teardown,
+    as_teardown,
+)
 
 
 __all__ = [
     "call_sync",
     "call_async",
+    "call_in_executor",
     "callable_str",
     "is_configured",
     "injection_trace",
@@ -20,7 +32,6 @@ __all__ = [
     "normalize_annotation",
 ]
 
-
 def callable_str(call: typing.Callable[..., typing.Any]) -> str:
     if hasattr(call, "__qualname__"):
         name = call.__qualname__
@@ -49,7 +60,7 @@ def add_injection_trace(
 
 
 def call_sync(
-    stack: contextlib.ExitStack | contextlib.AsyncExitStack,
+    stack: contextlib.ExitStack | contextlib.AsyncExitStack | Teardown,
     info: CallableInfo[typing.Any],
     values: collections.abc.Mapping[str, typing.Any],
 ) -> typing.Any:
@@ -61,68 +72,71 @@ def call_sync(
     :param values: callable arguments
     :return: callable result
     """
-    args, kwargs = info.build_arguments(values)
+    args, kwargs = info.argument_builder(values)
     value = info.call(*args, **kwargs)
 
     if info.context:
         manager: contextlib.AbstractContextManager[typing.Any] = value
         value = manager.__enter__()
 
-        def exit_context(
-            exc_type: type[BaseException] | None,
-            exc_value: BaseException | None,
-            tb: TracebackType | None,
-        ) -> bool:
-            try:
-                manager.__exit__(exc_type, exc_value, tb)
-            except Exception as e:
-                # Do not include re-raise of this exception in traceback to make it cleaner
-                if e is exc_value:
-                    return False
+        as_teardown(stack).add(CONTEXT, manager)
+
+    if info.generator:
+        generator: collections.abc.Generator[typing.Any, None, None] = value
+        value = next(generator)
+
+        as_teardown(stack).add(GENERATOR, generator)
+
+    return value
 
-                raise
 
-            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-            return exc_type is None
+async def call_in_executor(
+    stack: contextlib.AsyncExitStack | Teardown,
+    info: CallableInfo[typing.Any],
+    values: collections.abc.Mapping[str, typing.Any],
+    executor: concurrent.futures.Executor | None = None,
+) -> typing.Any:
+    """
+    Asynchronously call synchronous dependency callable in executor.
 
-        stack.push(exit_context)
+    Callable itself, as well as entering and exiting of its context
+    (for generators and context managers), runs in executor,
+    so blocking code does not block event loop.
+
+    :param stack: exit stack to properly handle generator dependencies
+    :param info: callable information
+    :param values: callable arguments
+    :param executor: executor to run callable in, event loop's default executor is used if None
+    :return: callable result
+    """
+    loop = asyncio.get_running_loop()
+    # Call, setup and teardown share one context, so context variables set by dependency
+    # are available (and can be reset) on teardown
+    context = contextvars.copy_context()
+
+    def run(function: typing.Callable[[], R]) -> asyncio.Future[R]:
+        return loop.run_in_executor(executor, context.run, function)
+
+    args, kwargs = info.argument_builder(values)
+    value = await run(functools.partial(info.call, *args, **kwargs))
+
+    if info.context:
+        manager: contextlib.AbstractContextManager[typing.Any] = value
+        value = await run(manager.__enter__)
+
+        as_teardown(stack).add(EXECUTOR, (CONTEXT, manager, executor, context))
 
     if info.generator:
         generator: collections.abc.Generator[typing.Any, None, None] = value
-        value = next(generator)
+        value = await run(functools.partial(next, generator))
 
-        def close_generator(
-            exc_type: type[BaseException] | None,
-            exc_value: BaseException | None,
-            tb: TracebackType | None,
-        ) -> bool:
-            try:
-                if exc_type is not None:
-                    generator.throw(exc_type, exc_value, tb)
-                else:
-                    next(generator)
-            except StopIteration:
-                # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-                return exc_type is None
-            except Exception as e:
-                # Do not include re-raise of this exception in traceback to make it cleaner
-                if e is exc_value:
-                    return False
-
-                raise
-
-            warnings.warn("Generator not exited", UserWarning)
-
-            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-            return exc_type is None
-
-        stack.push(close_generator)
+        as_teardown(stack).add(EXECUTOR, (GENERATOR, generator, executor, context))
 
     return value
 
 
 async def call_async(
-    stack: contextlib.AsyncExitStack,
+    stack: contextlib.AsyncExitStack | Teardown,
     info: CallableInfo[typing.Any],
     values: collections.abc.Mapping[str, typing.Any],
 ) -> typing.Any:
@@ -134,7 +148,7 @@ async def call_async(
     :param values: callable arguments
     :return: callable result
     """
-    args, kwargs = info.build_arguments(values)
+    args, kwargs = info.argument_builder(values)
 
     value = info.call(*args, **kwargs)
 
@@ -142,55 +156,13 @@ async def call_async(
         manager: contextlib.AbstractAsyncContextManager[typing.Any] = value
         value = await manager.__aenter__()
 
-        async def exit_context(
-            exc_type: type[BaseException] | None,
-            exc_value: BaseException | None,
-            tb: TracebackType | None,
-        ) -> bool:
-            try:
-                await manager.__aexit__(exc_type, exc_value, tb)
-            except Exception as e:
-                # Do not include re-raise of this exception in traceback to make it cleaner
-                if e is exc_value:
-                    return False
-
-                raise
-
-            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-            return exc_type is None
-
-        stack.push_async_exit(exit_context)
+        as_teardown(stack).add(ASYNC_CONTEXT, manager)
 
     elif info.generator:
         generator: collections.abc.AsyncGenerator[typing.Any] = value
         value = await anext(generator)
 
-        async def close_generator(
-            exc_type: type[BaseException] | None,
-            exc_value: BaseException | None,
-            tb: TracebackType | None,
-        ) -> bool:
-            try:
-                if exc_type is not None:
-                    await generator.athrow(exc_type, exc_value, tb)
-                else:
-                    await anext(generator)
-            except StopAsyncIteration:
-                # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-                return exc_type is None
-            except Exception as e:
-                # Do not include re-raise of this exception in traceback to make it cleaner
-                if e is exc_value:
-                    return False
-
-                raise
-
-            warnings.warn("Generator not exited", UserWarning)
-
-            # DO NOT ALLOW LIFESPAN DEPENDENCIES TO IGNORE EXCEPTIONS
-            return exc_type is None
-
-        stack.push_async_exit(close_generator)
+        as_teardown(stack).add(ASYNC_GENERATOR, generator)
 
     else:
         value = await value
@@ -235,10 +207,46 @@ def get_configuration(call: typing.Callable[..., typing.Any]) -> DependencyConfi
     return configuration
 
 
-def normalize_annotation(annotation: typing.Any) -> tuple[type[typing.Any], ...]:
+# Normalized annotations that do not contain forward references
+_normalized_annotations: dict[typing.Any, tuple[type[typing.Any], ...]] = {}
+
+
+def _is_forward_reference(annotation: typing.Any) -> typing.TypeGuard[str | typing.ForwardRef]:
+    return isinstance(annotation, (str, typing.ForwardRef))
+
+
+def _evaluate_forward_reference(
+    annotation: str | typing.ForwardRef, namespace: collections.abc.Mapping[str, typing.Any]
+) -> typing.Any:
+    if isinstance(annotation, str):
+        annotation = typing.ForwardRef(annotation)
+
+    if not isinstance(namespace, dict):
+        namespace = dict(namespace)
+
+    return eval(annotation.__forward_code__, namespace)
+
+
+def normalize_annotation(
+    annotation: typing.Any, namespace: collections.abc.Mapping[str, typing.Any] | None = None
+) -> tuple[type[typing.Any], ...]:
     """
     Normalize type annotation to make it easily work with
+
+    Results are cached for annotations that do not contain forward references.
+    Forward references are evaluated in provided namespace, if any.
+
+    :param annotation: type annotation
+    :param namespace: namespace to evaluate forward references in
+    :return: types value should be instance of
     """
+    key = annotation
+
+    try:
+        return _normalized_annotations[key]
+    except (KeyError, TypeError):  # TypeError - annotation is not hashable
+        pass
+
     type_options: tuple[type, ...] = (annotation,)
 
     origin = typing.get_origin(annotation)
@@ -250,9 +258,27 @@ def normalize_annotation(annotation: typing.Any) -> tuple[type[typing.Any], ...]
         origin = typing.get_origin(annotation)
         args = typing.get_args(annotation)
 
-    if origin is types.UnionType:
+    if origin is types.UnionType or origin is typing.Union:
         type_options = tuple(t for t in args if t is not types.NoneType)
     elif origin is not None:
         type_options = (origin,)
 
+    if any(_is_forward_reference(t) for t in type_options):
+        if namespace is None:
+            return type_options
+
+        normalized: list[type[typing.Any]] = []
+        for type_ in type_options:
+            if _is_forward_reference(type_):
+                normalized.extend(
+                    normalize_annotation(_evaluate_forward_reference(type_, namespace), namespace)
+                )
+            else:
+                normalized.append(type_)
+
+        return tuple(normalized)
+
+    with contextlib.suppress(TypeError):
+        type_options = _normalized_annotations.setdefault(key, type_options)
+
     return type_options
@@ -0,0 +1,194 @@
+import typing
+import collections.abc
+
+from fundi.scan import scan
+from fundi.compile import compile
+from fundi.util import normalize_annotation
+from fundi.overrides import Overrides, as_overrides
+from fundi.types import CallableInfo, Parameter, PlanStep
+from fundi.exceptions import (
+    AsyncDependencyError,
+    GraphValidationError,
+    CyclicDependencyError,
+    ScopeValueNotFoundError,
+)
+
+__all__ = ["validate", "warmup"]
+
+_MISSING = object()
+
+# Scope value every dependency gets (see ``fundi.scope.bind_parameter``)
+_PARAMETER_KEY = "__fundi_parameter__"
+
+
+def _info(
+    call: typing.Callable[..., typing.Any] | CallableInfo[typing.Any],
+) -> CallableInfo[typing.Any]:
+    if isinstance(call, CallableInfo):
+        return typing.cast(CallableInfo[typing.Any], call)
+
+    return scan(call)
+
+
+def _check_scope(
+    parameter: Parameter,
+    info: CallableInfo[typing.Any],
+    scope: collections.abc.Mapping[str, typing.Any],
+    problems: list[Exception],
+) -> None:
+    """
+    Check whether scope with provided schema has value for parameter
+    """
+    if parameter.resolve_by_type:
+        type_options = parameter.type_options
+        if type_options is None:
+            try:
+                type_options = normalize_annotation(parameter.annotation, parameter.namespace)
+            except Exception as exc:  # Forward reference can not be evaluated
+                problems.append(exc)
+                return
+
+            parameter.type_options = type_options
+
+        found = any(
+            isinstance(type_, type) and issubclass(type_, type_options) for type_ in scope.values()
+        )
+    else:
+        found = parameter.name in scope or parameter.name == _PARAMETER_KEY
+
+    if not found and not parameter.has_default:
+        problems.append(ScopeValueNotFoundError(parameter.name, info))
+
+
+def validate(
+    *calls: typing.Callable[..., typing.Any] | CallableInfo[typing.Any],
+    scope: collections.abc.Mapping[str, typing.Any] | None = None,
+    async_: bool = True,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> list[Exception]:
+    """
+    Check dependency graphs of callables without calling anything.
+
+    All problems found are returned at once:
+
+    - ``CyclicDependencyError`` - dependencies depend on each other
+    - ``AsyncDependencyError`` - asynchronous callable in graph injected synchronously
+    - ``ScopeValueNotFoundError`` - scope schema has no value for parameter that has no default
+    - exceptions raised while evaluating forward references of parameters resolved by type
+
+    :param calls: callables or their information to check
+    :param scope: scope schema - names of values every scope will have, mapped to their types.
+        Parameters resolved from scope are not checked if it is not provided
+    :param async_: whether callables are injected asynchronously,
+        if not - asynchronous callables are reported
+    :param override: override dependencies, that will be used on injection
+    :return: found problems
+    """
+    overrides = as_overrides(override)
+    problems: list[Exception] = []
+
+    # Whether callable is being checked (it is on path) or is already checked, by callable id
+    on_path: dict[int, bool] = {}
+    # Callables being checked and their remaining parameters
+    path: list[tuple[CallableInfo[typing.Any], collections.abc.Iterator[Parameter]]] = []
+
+    def enter(info: CallableInfo[typing.Any]) -> None:
+        on_path[id(info.call)] = True
+        path.append((info, iter(info.parameters)))
+
+        if info.async_ and not async_:
+            problems.append(AsyncDependencyError(info))
+
+    for call in calls:
+        root = _info(call)
+        if id(root.call) not in on_path:
+            enter(root)
+
+        while path:
+            current, parameters = path[-1]
+
+            for parameter in parameters:
+                dependency = parameter.from_
+
+                if dependency is None:
+                    if scope is not None:
+                        _check_scope(parameter, current, scope, problems)
+                    continue
+
+                if overrides is not None:
+                    overriding = overrides.get(dependency.call, _MISSING)
+
+                    if overriding is not _MISSING:
+                        if not isinstance(overriding, CallableInfo):
+                            continue
+
+                        dependency = typing.cast(CallableInfo[typing.Any], overriding)
+
+                state = on_path.get(id(dependency.call))
+
+                if state is True:
+                    # Lazy dependency is not resolved before its dependant is called
+                    if parameter.lazy:
+                        continue
+
+                    infos = [entry[0] for entry in path]
+                    start = next(i for i, info in enumerate(infos) if info.call is dependency.call)
+                    problems.append(CyclicDependencyError(infos[start:] + [dependency]))
+                    continue
+
+                if state is None:
+                    enter(dependency)
+                    break
+
+            else:
+                path.pop()
+                on_path[id(current.call)] = False
+
+    return problems
+
+
+def warmup(
+    *calls: typing.Callable[..., typing.Any] | CallableInfo[typing.Any],
+    scope: collections.abc.Mapping[str, typing.Any] | None = None,
+    async_: bool = True,
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+) -> list[CallableInfo[typing.Any]]:
+    """
+    Prepare callables for injection at startup.
+
+    Dependency graphs are validated (see ``validate``), then callables are scanned
+    and injection plans are compiled for them, as well as for dependencies
+    that are injected separately (lazy and singleton dependencies),
+    so first injection does not pay for it.
+
+    :param calls: callables or their information to prepare
+    :param scope: scope schema - names of values every scope will have, mapped to their types
+    :param async_: whether callables are injected asynchronously
+    :param override: override dependencies, that will be used on injection
+    :return: information of callables, in the same order
+    :raises GraphValidationError: if any problem was found
+    """
+    infos = [_info(call) for call in calls]
+
+    problems = validate(*infos, scope=scope, async_=async_, override=override)
+    if problems:
+        raise GraphValidationError(problems)
+
+    overrides: Overrides | None = as_overrides(override)
+
+    pending = list(infos)
+    compiled: set[int] = set()
+
+    while pending:
+        info = pending.pop()
+        if id(info) in compiled:
+            continue
+
+        compiled.add(id(info))
+
+        for step in compile(info, overrides).steps:
+            # Plans of lazy dependencies are not compiled with plans of their dependants
+            if step.op == PlanStep.LAZY or step.op == PlanStep.ENTER:
+                pending.append(typing.cast(CallableInfo[typing.Any], step.dependency))
+
+    return infos
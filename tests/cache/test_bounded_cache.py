@@ -0,0 +1,70 @@
+from fundi.cache import BoundedCache
+
+
+class Timer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Value: ...
+
+
+def test_lru():
+    cache: BoundedCache[str, int] = BoundedCache(max_size=2)
+
+    cache.get_or_set("a", 1)
+    cache.get_or_set("b", 2)
+    assert cache.get("a") == (True, 1)
+
+    cache.get_or_set("c", 3)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.info().evictions == 1
+
+
+def test_ttl():
+    timer = Timer()
+    cache: BoundedCache[str, int] = BoundedCache(ttl=10, timer=timer)
+
+    cache.get_or_set("a", 1)
+
+    timer.now = 9
+    assert cache.get("a") == (True, 1)
+
+    timer.now = 10
+    assert cache.get("a") == (False, None)
+    assert cache.info().evictions == 1
+
+
+def test_expired_value_in_use():
+    timer = Timer()
+    cache: BoundedCache[str, Value] = BoundedCache(ttl=10, timer=timer)
+
+    value = cache.get_or_set("a", Value())
+
+    timer.now = 10
+    assert cache.get("a") == (True, value)
+
+
+def test_expired_value_unreferenced():
+    timer = Timer()
+    cache: BoundedCache[str, Value] = BoundedCache(ttl=10, timer=timer)
+
+    cache.get_or_set("a", Value())
+
+    timer.now = 10
+    assert cache.get("a") == (False, None)
+    assert cache.info().evictions == 1
+    assert cache.info().size == 0
+
+
+def test_get_or_set_keeps_existing():
+    cache: BoundedCache[str, int] = BoundedCache()
+
+    assert cache.get_or_set("a", 1) == 1
+    assert cache.get_or_set("a", 2) == 1
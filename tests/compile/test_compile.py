@@ -0,0 +1,271 @@
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, compile, injection_trace, Overrides, PlanStep
+
+
+def test_compile_steps():
+    def dep(name: str) -> str:
+        return name
+
+    def func(arg: int, value: str = from_(dep)): ...
+
+    plan = compile(scan(func))
+
+    assert plan.info.call is func
+    assert [step.op for step in plan.steps] == [PlanStep.SCOPE, PlanStep.ENTER, PlanStep.CALL]
+
+    enter = plan.steps[1]
+    assert enter.dependency is not None
+    assert enter.dependency.call is dep
+    assert enter.plan is compile(scan(dep))
+    assert [step.op for step in enter.plan.steps] == [PlanStep.SCOPE, PlanStep.CALL]
+    assert enter.scoped is True
+
+
+def test_compile_cached():
+    def dep(): ...
+
+    def func(value: None = from_(dep)): ...
+
+    info = scan(func)
+
+    assert compile(info) is compile(info)
+    assert info.plan is compile(info)
+
+
+def test_plan_diamond_depth():
+    calls: list[int] = []
+
+    def level_0():
+        calls.append(0)
+        return 1
+
+    level = level_0
+    for depth in range(1, 31):
+        # Every level depends on the previous one twice
+        def next_level(
+            left: int = from_(level),
+            right: int = from_(level),
+            depth: int = depth,
+        ) -> int:
+            calls.append(depth)
+            return left + right
+
+        level = next_level
+
+    info = scan(level)
+    plan = compile(info)
+
+    # Every callable in graph is compiled once, plans of dependencies are not copied
+    steps = 0
+    while True:
+        steps += len(plan.steps)
+        assert len(plan.steps) <= 4
+
+        if plan.steps[0].op != PlanStep.ENTER:
+            break
+
+        assert plan.steps[0].plan is plan.steps[1].plan
+        plan = plan.steps[0].plan
+
+    assert steps == 4 * 30 + 1
+
+    with ExitStack() as stack:
+        assert inject({}, info, stack) == 2**30
+
+    assert calls == list(range(31))
+
+
+def test_plan_skips_cached_subtree():
+    calls: list[str] = []
+
+    def root():
+        calls.append("root")
+        return "root"
+
+    def left(value: str = from_(root)):
+        calls.append("left")
+        return value
+
+    def right(value: str = from_(root)):
+        calls.append("right")
+        return value
+
+    def application(a: str = from_(left), b: str = from_(right)):
+        return a, b
+
+    with ExitStack() as stack:
+        assert inject({}, scan(application), stack) == ("root", "root")
+
+    assert calls == ["root", "left", "right"]
+
+
+def test_plan_override_skips_subtree():
+    calls: list[str] = []
+
+    def root():
+        calls.append("root")
+
+    def dep(value: None = from_(root)):
+        calls.append("dep")
+
+    def test_dep():
+        calls.append("test_dep")
+        return "test"
+
+    def application(value: str = from_(dep)):
+        return value
+
+    with ExitStack() as stack:
+        assert inject({}, scan(application), stack, override={dep: "value"}) == "value"
+        assert inject({}, scan(application), stack, override={dep: scan(test_dep)}) == "test"
+
+    assert calls == ["test_dep"]
+
+
+def test_plan_trace():
+    def failing(arg: str):
+        raise RuntimeError()
+
+    def dep(value: None = from_(failing)): ...
+
+    def application(name: str, value: None = from_(dep)): ...
+
+    try:
+        with ExitStack() as stack:
+            inject({"arg": "value", "name": "app"}, scan(application), stack)
+    except RuntimeError as exc:
+        trace = injection_trace(exc)
+
+        assert trace.info.call is application
+        assert trace.values == {"name": "app"}
+
+        assert trace.origin is not None
+        assert trace.origin.info.call is dep
+        assert trace.origin.values == {}
+
+        assert trace.origin.origin is not None
+        assert trace.origin.origin.info.call is failing
+        assert trace.origin.origin.values == {"arg": "value"}
+        assert trace.origin.origin.origin is None
+    else:
+        assert False
+
+
+def test_plan_with_overrides():
+    def dep(): ...
+
+    def test_dep(): ...
+
+    def application(value: None = from_(dep)): ...
+
+    info = scan(application)
+
+    by_value = compile(info, Overrides({dep: "value"}))
+    assert [step.op for step in by_value.steps] == [PlanStep.VALUE, PlanStep.CALL]
+    assert by_value is not compile(info)
+
+    by_dependency = compile(info, Overrides({dep: scan(test_dep)}))
+    assert by_dependency.steps[0].op == PlanStep.ENTER
+    assert by_dependency.steps[0].dependency is scan(test_dep)
+
+
+def test_plan_cached_by_override_shape():
+    def dep(): ...
+
+    def application(value: None = from_(dep)): ...
+
+    info = scan(application)
+
+    plan = compile(info, Overrides({dep: "first"}))
+    assert compile(info, Overrides({dep: "second"})) is plan
+    assert compile(info, Overrides({dep: scan(dep)})) is not plan
+
+
+def test_override_plans_limited():
+    def dep(): ...
+
+    def service(value: None = from_(dep)): ...
+
+    def application(value: None = from_(service)): ...
+
+    info = scan(application)
+
+    # Dependency overridden by freshly scanned one on every injection
+    for _ in range(200):
+
+        def fake(): ...
+
+        compile(info, Overrides({dep: scan(fake)}))
+
+    assert 0 < len(info.plans) <= 64
+    assert 0 < len(scan(service).plans) <= 64
+
+
+def test_overrides_hashable():
+    def dep(): ...
+
+    value = object()
+
+    assert Overrides({dep: value}) == Overrides({dep: value})
+    assert hash(Overrides({dep: value})) == hash(Overrides({dep: value}))
+    assert Overrides({dep: value}) != Overrides({dep: object()})
+
+    with pytest.raises(TypeError):
+        Overrides({dep: value})[dep] = None  # pyright: ignore[reportIndexIssue]
+
+
+def test_override_with_none():
+    calls: list[str] = []
+
+    def dep():
+        calls.append("dep")
+        return "dep"
+
+    def application(value: str | None = from_(dep)):
+        return value
+
+    with ExitStack() as stack:
+        assert inject({}, scan(application), stack, override=Overrides({dep: None})) is None
+        # None in plain mapping means "not overridden"
+        assert inject({}, scan(application), stack, override={dep: None}) == "dep"
+
+    assert calls == ["dep"]
+
+
+async def test_override_with_none_async():
+    def dep():
+        return "dep"
+
+    async def application(value: str | None = from_(dep)):
+        return value
+
+    async with AsyncExitStack() as stack:
+        overrides = Overrides({dep: None})
+
+        assert await ainject({}, scan(application), stack, override=overrides) is None
+        assert (
+            await ainject({}, scan(application), stack, override=overrides, concurrency=True)
+            is None
+        )
+
+
+def test_overriding_dependency_cached():
+    calls: list[str] = []
+
+    def dep(): ...
+
+    def test_dep():
+        calls.append("test_dep")
+        return "test"
+
+    def application(a: str = from_(dep), b: str = from_(dep)):
+        return a, b
+
+    with ExitStack() as stack:
+        result = inject({}, scan(application), stack, override={dep: scan(test_dep)})
+
+    assert result == ("test", "test")
+    assert calls == ["test_dep"]
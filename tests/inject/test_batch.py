@@ -0,0 +1,162 @@
+import asyncio
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject_many, ainject_many
+
+
+def test_inject_many():
+    events: list[str] = []
+
+    def settings():
+        events.append("settings")
+        yield {"prefix": ">"}
+        events.append("settings closed")
+
+    def message(body: str):
+        events.append(f"message {body}")
+        yield body
+        events.append(f"message {body} closed")
+
+    def handler(config: dict = from_(settings), body: str = from_(message)):
+        return config["prefix"] + body
+
+    with ExitStack() as stack:
+        results = inject_many(
+            [{"body": "a"}, {"body": "b"}], scan(handler), stack, share_lifespan=True
+        )
+
+        assert next(results) == ">a"
+        assert events == ["settings", "message a"]
+
+        assert next(results) == ">b"
+        assert events == ["settings", "message a", "message a closed", "message b"]
+
+        assert list(results) == []
+
+    assert events == [
+        "settings",
+        "message a",
+        "message a closed",
+        "message b",
+        "message b closed",
+        "settings closed",
+    ]
+
+
+def test_inject_many_lifespan_per_item():
+    events: list[str] = []
+
+    def session():
+        events.append("begin")
+        yield "session"
+        events.append("commit")
+
+    def settings():
+        events.append("settings")
+        return "settings"
+
+    def repository(session_: str = from_(session), config: str = from_(settings)):
+        return session_
+
+    def handler(body: str, repository_: str = from_(repository)):
+        return body + " " + repository_
+
+    with ExitStack() as stack:
+        results = list(inject_many([{"body": "a"}, {"body": "b"}], scan(handler), stack))
+
+    assert results == ["a session", "b session"]
+    # Settings are shared, every item gets its own session
+    assert events == ["settings", "begin", "commit", "begin", "commit"]
+
+
+def test_inject_many_scope_dependent():
+    calls: list[str] = []
+
+    def tenant(tenant_id: int):
+        calls.append("tenant")
+        return tenant_id
+
+    def repository(tenant_: int = from_(tenant)):
+        calls.append("repository")
+        return tenant_
+
+    def handler(repository_: int = from_(repository)):
+        return repository_
+
+    with ExitStack() as stack:
+        results = list(inject_many([{"tenant_id": 1}, {"tenant_id": 2}], scan(handler), stack))
+
+    assert results == [1, 2]
+    assert calls == ["tenant", "repository"] * 2
+
+
+def test_inject_many_empty():
+    calls: list[str] = []
+
+    def settings():
+        calls.append("settings")
+
+    def handler(config: None = from_(settings)): ...
+
+    with ExitStack() as stack:
+        assert list(inject_many([], scan(handler), stack)) == []
+
+    assert calls == []
+
+
+async def test_ainject_many():
+    calls: list[str] = []
+    running = 0
+    peak = 0
+
+    async def client():
+        calls.append("client")
+        return "client"
+
+    async def handler(body: int, client_: str = from_(client)):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - body))
+        running -= 1
+        return body
+
+    async def scopes():
+        for body in range(5):
+            yield {"body": body}
+
+    async with AsyncExitStack() as stack:
+        results = [result async for result in ainject_many(scopes(), scan(handler), stack, limit=3)]
+
+    assert results == [0, 1, 2, 3, 4]
+    assert calls == ["client"]
+    assert peak == 3
+
+
+async def test_ainject_many_stops_early():
+    events: list[str] = []
+
+    async def message(body: int):
+        events.append(f"open {body}")
+        yield body
+        events.append(f"close {body}")
+
+    async def handler(body: int = from_(message)):
+        return body
+
+    async with AsyncExitStack() as stack:
+        results = ainject_many([{"body": body} for body in range(4)], scan(handler), stack, limit=2)
+
+        async for result in results:
+            assert result == 0
+            break
+
+        await results.aclose()
+
+    assert sorted(events) == ["close 0", "close 1", "open 0", "open 1"]
+
+    with pytest.raises(ValueError):
+        async for _ in ainject_many([], scan(handler), stack, limit=0):
+            pass
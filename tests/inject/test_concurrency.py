@@ -0,0 +1,158 @@
+import sys
+import asyncio
+import contextvars
+from contextlib import AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, ainject, injection_trace
+
+
+async def test_concurrent_dependencies():
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    async def first():
+        first_started.set()
+        await second_started.wait()
+        return 1
+
+    async def second():
+        second_started.set()
+        await first_started.wait()
+        return 2
+
+    async def application(a: int = from_(first), b: int = from_(second)):
+        return a + b
+
+    async with AsyncExitStack() as stack:
+        # Would never finish if dependencies were awaited one after another
+        result = await asyncio.wait_for(
+            ainject({}, scan(application), stack, concurrency=True), timeout=1
+        )
+
+    assert result == 3
+
+
+async def test_concurrent_shared_dependency_runs_once():
+    calls: list[str] = []
+
+    async def database():
+        calls.append("database")
+        await asyncio.sleep(0)
+        return "session"
+
+    async def users(session: str = from_(database)):
+        return f"users from {session}"
+
+    async def posts(session: str = from_(database)):
+        return f"posts from {session}"
+
+    async def application(
+        users_: str = from_(users), posts_: str = from_(posts), session: str = from_(database)
+    ):
+        return users_, posts_, session
+
+    async with AsyncExitStack() as stack:
+        result = await ainject({}, scan(application), stack, concurrency=True)
+
+    assert result == ("users from session", "posts from session", "session")
+    assert calls == ["database"]
+
+
+async def test_concurrent_teardown_order():
+    events: list[str] = []
+
+    def lifespan(name: str, delay: float):
+        async def dependency():
+            await asyncio.sleep(delay)
+            events.append(f"enter {name}")
+            yield name
+            events.append(f"exit {name}")
+
+        return dependency
+
+    slow = lifespan("slow", 0.02)
+    fast = lifespan("fast", 0)
+
+    async def application(a: str = from_(slow), b: str = from_(fast)):
+        return a, b
+
+    async with AsyncExitStack() as stack:
+        assert await ainject({}, scan(application), stack, concurrency=True) == ("slow", "fast")
+
+    assert events == ["enter fast", "enter slow", "exit fast", "exit slow"]
+
+
+async def test_concurrent_injection_trace():
+    async def failing(name: str):
+        raise RuntimeError()
+
+    async def dep(value: None = from_(failing)): ...
+
+    async def other():
+        return "other"
+
+    async def application(other_: str = from_(other), value: None = from_(dep)): ...
+
+    try:
+        async with AsyncExitStack() as stack:
+            await ainject({"name": "value"}, scan(application), stack, concurrency=True)
+    except RuntimeError as exc:
+        trace = injection_trace(exc)
+
+        assert trace.info.call is application
+
+        assert trace.origin is not None
+        assert trace.origin.info.call is dep
+
+        assert trace.origin.origin is not None
+        assert trace.origin.origin.info.call is failing
+        assert trace.origin.origin.values == {"name": "value"}
+    else:
+        assert False
+
+
+async def test_concurrent_override():
+    async def dep():
+        return "dep"
+
+    async def test_dep():
+        return "test"
+
+    async def application(a: str = from_(dep)):
+        return a
+
+    async with AsyncExitStack() as stack:
+        result = await ainject(
+            {}, scan(application), stack, override={dep: scan(test_dep)}, concurrency=True
+        )
+
+    assert result == "test"
+
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="none")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Tasks accept context since Python 3.11")
+async def test_concurrent_lifespan_context():
+    events: list[str] = []
+
+    async def dep():
+        token = request_id.set("request")
+        yield "dep"
+        events.append(request_id.get())
+        request_id.reset(token)
+
+    async def other():
+        # Context variables set by concurrently running dependencies are not visible
+        return request_id.get()
+
+    async def application(value: str = from_(dep), other_: str = from_(other)):
+        return value, other_
+
+    async with AsyncExitStack() as stack:
+        assert await ainject({}, scan(application), stack, concurrency=True) == ("dep", "none")
+
+    assert events == ["request"]
+    assert request_id.get() == "none"
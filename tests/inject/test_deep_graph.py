@@ -0,0 +1,83 @@
+import sys
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, tree, order, compile, injection_trace
+from fundi.exceptions import CyclicDependencyError
+
+DEPTH = sys.getrecursionlimit() + 500
+
+
+def chain(depth: int, fail: bool = False):
+    def first(start: int) -> int:
+        if fail:
+            raise RuntimeError()
+
+        return start
+
+    dependency = first
+    for _ in range(depth):
+
+        def next_(value: int = from_(dependency)) -> int:
+            return value + 1
+
+        dependency = next_
+
+    return dependency
+
+
+def test_deep_inject():
+    with ExitStack() as stack:
+        assert inject({"start": 0}, scan(chain(DEPTH)), stack) == DEPTH
+
+
+async def test_deep_ainject():
+    async with AsyncExitStack() as stack:
+        assert await ainject({"start": 0}, scan(chain(DEPTH)), stack) == DEPTH
+        assert await ainject({"start": 0}, scan(chain(DEPTH)), stack, concurrency=True) == DEPTH
+
+
+def test_deep_debug():
+    info = scan(chain(DEPTH))
+
+    assert len(order({"start": 0}, info)) == DEPTH
+
+    node = tree({"start": 0}, info)
+    depth = 0
+    while "value" in node["values"]:
+        node = node["values"]["value"]
+        depth += 1
+
+    assert depth == DEPTH
+
+
+def test_deep_injection_trace():
+    try:
+        with ExitStack() as stack:
+            inject({"start": 0}, scan(chain(DEPTH, fail=True)), stack)
+    except RuntimeError as exc:
+        trace = injection_trace(exc)
+        depth = 0
+        while trace.origin is not None:
+            trace = trace.origin
+            depth += 1
+
+        assert depth == DEPTH
+        assert trace.values == {"start": 0}
+    else:
+        assert False
+
+
+def test_cycle():
+    def first(value: int = 0): ...
+
+    def second(value: int = from_(first)): ...
+
+    # Make first depend on second
+    scan(first).parameters[0].from_ = scan(second)
+
+    with pytest.raises(CyclicDependencyError) as info:
+        compile(scan(second))
+
+    assert [item.call for item in info.value.cycle] == [second, first, second]
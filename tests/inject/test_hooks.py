@@ -0,0 +1,170 @@
+import typing
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import (
+    scan,
+    from_,
+    Hooks,
+    inject,
+    ainject,
+    lifetime,
+    Container,
+    CallableInfo,
+    register_hooks,
+    unregister_hooks,
+)
+from fundi.hooks import active_hooks
+
+
+class Recorder(Hooks):
+    def __init__(self):
+        self.events: list[tuple[str, str]] = []
+
+    def record(self, event: str, info: CallableInfo[typing.Any]) -> None:
+        self.events.append((event, info.call.__name__))
+
+    def on_resolve_start(self, info: CallableInfo[typing.Any]) -> None:
+        self.record("resolve", info)
+
+    def on_call_start(self, info: CallableInfo[typing.Any], values: typing.Any) -> None:
+        self.record("call", info)
+
+    def on_call_end(self, info: CallableInfo[typing.Any], value: typing.Any) -> None:
+        self.record("return", info)
+
+    def on_cache_hit(self, info: CallableInfo[typing.Any]) -> None:
+        self.record("hit", info)
+
+    def on_teardown_start(self, info: CallableInfo[typing.Any]) -> None:
+        self.record("teardown", info)
+
+    def on_teardown_end(self, info: CallableInfo[typing.Any]) -> None:
+        self.record("closed", info)
+
+    def on_error(self, info: CallableInfo[typing.Any], exception: Exception) -> None:
+        self.record("error", info)
+
+
+def session():
+    yield "session"
+
+
+def user(value: str = from_(session)):
+    return value
+
+
+def application(a: str = from_(user), b: str = from_(session)):
+    return a + b
+
+
+EVENTS = [
+    ("resolve", "application"),
+    ("resolve", "user"),
+    ("resolve", "session"),
+    ("call", "session"),
+    ("return", "session"),
+    ("call", "user"),
+    ("return", "user"),
+    ("hit", "session"),
+    ("call", "application"),
+    ("return", "application"),
+    ("teardown", "session"),
+    ("closed", "session"),
+]
+
+
+def test_hooks():
+    hooks = Recorder()
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack, hooks=hooks)
+
+    assert hooks.events == EVENTS
+
+
+@pytest.mark.parametrize("concurrency", [False, True])
+async def test_hooks_async(concurrency: bool):
+    hooks = Recorder()
+
+    async with AsyncExitStack() as stack:
+        await ainject({}, scan(application), stack, hooks=hooks, concurrency=concurrency)
+
+    if concurrency:
+        # Graph is walked before anything is called
+        assert hooks.events[:4] == [
+            ("resolve", "application"),
+            ("resolve", "user"),
+            ("resolve", "session"),
+            ("hit", "session"),
+        ]
+        assert sorted(hooks.events) == sorted(EVENTS)
+    else:
+        assert hooks.events == EVENTS
+
+
+def test_registered_hooks():
+    registered = Recorder()
+    passed = Recorder()
+
+    register_hooks(registered)
+    try:
+        with ExitStack() as stack:
+            inject({}, scan(application), stack, hooks=passed)
+    finally:
+        unregister_hooks(registered)
+
+    assert registered.events == EVENTS
+    assert passed.events == EVENTS
+
+    assert active_hooks(None, scan(application)) is None
+
+
+def test_hooks_error():
+    hooks = Recorder()
+
+    def failing(value: str = from_(session)):
+        raise ValueError()
+
+    def dependant(value: None = from_(failing)): ...
+
+    with pytest.raises(ValueError), ExitStack() as stack:
+        inject({}, scan(dependant), stack, hooks=hooks)
+
+    assert hooks.events[-4:] == [
+        ("call", "failing"),
+        ("error", "failing"),
+        ("teardown", "session"),
+        ("closed", "session"),
+    ]
+
+
+def test_hooks_singleton():
+    hooks = Recorder()
+
+    @lifetime("singleton")
+    def engine():
+        return "engine"
+
+    def dependant(value: str = from_(engine)):
+        return value
+
+    with Container() as container, ExitStack() as stack:
+        inject({}, scan(dependant), stack, container=container, hooks=hooks)
+
+    assert ("call", "engine") in hooks.events
+
+
+def test_hooks_injection_start():
+    class Skipping(Recorder):
+        def on_injection_start(self, info: CallableInfo[typing.Any]) -> Hooks | None:
+            self.record("start", info)
+            return None
+
+    hooks = Skipping()
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack, hooks=hooks)
+
+    assert hooks.events == [("start", "application")]
@@ -0,0 +1,156 @@
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, lifetime, Container, Lazy, Overrides, PlanStep
+from fundi.compile import compile
+
+
+def test_lazy_not_used():
+    calls: list[str] = []
+
+    def audit_logger():
+        calls.append("audit_logger")
+        return "logger"
+
+    def handler(write: bool, audit: Lazy[str] = from_(audit_logger)):
+        if write:
+            return audit.get()
+
+        return audit
+
+    with ExitStack() as stack:
+        handle = inject({"write": False}, scan(handler), stack)
+
+    assert isinstance(handle, Lazy)
+    assert not handle.resolved
+    assert calls == []
+
+    with ExitStack() as stack:
+        assert inject({"write": True}, scan(handler), stack) == "logger"
+
+    assert calls == ["audit_logger"]
+
+
+def test_lazy_from():
+    def dependency():
+        return "value"
+
+    def handler(value=from_(dependency, lazy=True)):
+        return value
+
+    info = scan(handler)
+    assert info.parameters[0].lazy
+    assert [step.op for step in compile(info).steps] == [PlanStep.LAZY, PlanStep.CALL]
+
+    with ExitStack() as stack:
+        handle = inject({}, info, stack)
+
+    assert handle.get() == "value"
+    assert handle.resolved
+
+
+def test_lazy_shares_cache_and_stack():
+    events: list[str] = []
+
+    def session(name: str):
+        events.append(f"open {name}")
+        yield "session"
+        events.append("close")
+
+    def users(value: str = from_(session)):
+        return value
+
+    def handler(users_: str = from_(users), lazy: Lazy[str] = from_(session)):
+        events.append("handler")
+        return lazy.get(), lazy.get()
+
+    with ExitStack() as stack:
+        assert inject({"name": "db"}, scan(handler), stack) == ("session", "session")
+
+    assert events == ["open db", "handler", "close"]
+
+
+def test_lazy_resolved_once():
+    calls: list[str] = []
+
+    def dependency():
+        calls.append("dependency")
+        return object()
+
+    def handler(lazy: Lazy[object] = from_(dependency, caching=False)):
+        return lazy
+
+    with ExitStack() as stack:
+        handle = inject({}, scan(handler), stack)
+        assert handle.get() is handle.get()
+
+    assert calls == ["dependency"]
+
+
+def test_lazy_override():
+    def dependency():
+        return "real"
+
+    def replacement():
+        return "replacement"
+
+    def handler(lazy: Lazy[str] = from_(dependency)):
+        return lazy.get()
+
+    for override, expected in [
+        ({dependency: "value"}, "value"),
+        ({dependency: scan(replacement)}, "replacement"),
+        (Overrides({dependency: None}), None),
+    ]:
+        with ExitStack() as stack:
+            assert inject({}, scan(handler), stack, override=override) == expected
+
+
+def test_lazy_singleton():
+    calls: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        calls.append("engine")
+        return "engine"
+
+    def handler(lazy: Lazy[str] = from_(engine)):
+        return lazy.get()
+
+    with Container() as container:
+        for _ in range(2):
+            with ExitStack() as stack:
+                assert inject({}, scan(handler), stack, container=container) == "engine"
+
+    assert calls == ["engine"]
+
+
+@pytest.mark.parametrize("concurrency", [False, True])
+async def test_lazy_async(concurrency: bool):
+    events: list[str] = []
+
+    async def client():
+        events.append("open")
+        yield "client"
+        events.append("close")
+
+    async def handler(lazy: Lazy[str] = from_(client)):
+        events.append("handler")
+        return await lazy
+
+    async with AsyncExitStack() as stack:
+        assert await ainject({}, scan(handler), stack, concurrency=concurrency) == "client"
+
+    assert events == ["handler", "open", "close"]
+
+
+def test_lazy_async_in_sync_injection():
+    async def client():
+        return "client"
+
+    def handler(lazy: Lazy[str] = from_(client)):
+        return lazy.get()
+
+    with pytest.raises(RuntimeError), ExitStack() as stack:
+        inject({}, scan(handler), stack)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from contextlib import ExitStack
+
+import fundi
+from fundi import from_, scan, inject, Lazy
+
+
+def connection() -> Connection:
+    return Connection()
+
+
+def handler(lazy: Lazy[Connection] = from_(connection)):
+    return lazy
+
+
+def qualified(lazy: fundi.Lazy[Connection] = from_(connection)):
+    return lazy
+
+
+def eager(value: list[Lazy[Connection]] = from_(connection)):
+    return value
+
+
+# Defined after handlers, so annotations referencing it can not be evaluated on scan
+class Connection: ...
+
+
+def test_lazy_postponed_annotation():
+    assert scan(handler).named_parameters["lazy"].lazy
+    assert scan(qualified).named_parameters["lazy"].lazy
+    assert not scan(eager).named_parameters["value"].lazy
+
+    with ExitStack() as stack:
+        handle = inject({}, scan(handler), stack)
+        assert isinstance(handle, Lazy)
+        assert isinstance(handle.get(), Connection)
+
+        assert isinstance(inject({}, scan(eager), stack), Connection)
@@ -0,0 +1,180 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, lifetime, Container
+
+
+def test_singleton():
+    events: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        events.append("setup")
+        yield "engine"
+        events.append("teardown")
+
+    def application(value: str = from_(engine)):
+        return value
+
+    with Container() as container:
+        for _ in range(3):
+            with ExitStack() as stack:
+                assert inject({}, scan(application), stack, container=container) == "engine"
+
+        assert engine in container
+        assert events == ["setup"]
+
+    assert events == ["setup", "teardown"]
+    assert engine not in container
+
+
+def test_singleton_without_container():
+    calls: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        calls.append("engine")
+
+    def application(value: None = from_(engine)): ...
+
+    for _ in range(2):
+        with ExitStack() as stack:
+            inject({}, scan(application), stack)
+
+    assert calls == ["engine", "engine"]
+
+
+def test_singleton_in_from():
+    calls: list[str] = []
+
+    def engine():
+        calls.append("engine")
+
+    def application(value: None = from_(engine, lifetime="singleton")): ...
+
+    with Container() as container:
+        for _ in range(2):
+            with ExitStack() as stack:
+                inject({}, scan(application), stack, container=container)
+
+    assert calls == ["engine"]
+    assert scan(engine).lifetime == "request"
+
+
+def test_transient():
+    calls: list[str] = []
+
+    @lifetime("transient")
+    def dep():
+        calls.append("dep")
+
+    def application(a: None = from_(dep), b: None = from_(dep)): ...
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack)
+
+    assert calls == ["dep", "dep"]
+    assert scan(dep).use_cache is False
+
+
+def test_singleton_threads():
+    calls: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        calls.append("engine")
+        time.sleep(0.01)
+        return "engine"
+
+    def application(value: str = from_(engine)):
+        return value
+
+    barrier = threading.Barrier(8)
+
+    def run(container: Container) -> str:
+        barrier.wait()
+        with ExitStack() as stack:
+            return inject({}, scan(application), stack, container=container)
+
+    with Container() as container, ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(run, [container] * 8))
+
+    assert results == ["engine"] * 8
+    assert calls == ["engine"]
+
+
+def test_singleton_failure_retried():
+    calls: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        calls.append("engine")
+        if len(calls) == 1:
+            raise RuntimeError()
+
+        return "engine"
+
+    def application(value: str = from_(engine)):
+        return value
+
+    with Container() as container:
+        with pytest.raises(RuntimeError), ExitStack() as stack:
+            inject({}, scan(application), stack, container=container)
+
+        with ExitStack() as stack:
+            assert inject({}, scan(application), stack, container=container) == "engine"
+
+    assert calls == ["engine", "engine"]
+
+
+@pytest.mark.parametrize("concurrency", [False, True])
+async def test_async_singleton(concurrency: bool):
+    events: list[str] = []
+
+    @lifetime("singleton")
+    async def client():
+        events.append("setup")
+        await asyncio.sleep(0.01)
+        yield "client"
+        events.append("teardown")
+
+    async def application(value: str = from_(client)):
+        return value
+
+    async def run(container: Container) -> str:
+        async with AsyncExitStack() as stack:
+            return await ainject(
+                {}, scan(application), stack, container=container, concurrency=concurrency
+            )
+
+    async with Container() as container:
+        results = await asyncio.gather(*(run(container) for _ in range(8)))
+
+        assert results == ["client"] * 8
+        assert events == ["setup"]
+
+    assert events == ["setup", "teardown"]
+
+
+async def test_async_container_sync_close():
+    @lifetime("singleton")
+    async def client():
+        return "client"
+
+    async def application(value: str = from_(client)):
+        return value
+
+    container = Container()
+
+    async with AsyncExitStack() as stack:
+        await ainject({}, scan(application), stack, container=container)
+
+    with pytest.raises(RuntimeError):
+        container.close()
+
+    await container.aclose()
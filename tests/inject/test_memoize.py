@@ -0,0 +1,223 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, memoize
+
+
+def test_memoize_across_injections():
+    calls: list[str] = []
+
+    @memoize
+    def claims(token: str) -> dict[str, str]:
+        calls.append(token)
+        return {"sub": token}
+
+    def application(value: dict[str, str] = from_(claims)):
+        return value
+
+    for token in ("a", "b", "a", "a"):
+        with ExitStack() as stack:
+            assert inject({"token": token}, scan(application), stack) == {"sub": token}
+
+    assert calls == ["a", "b"]
+
+    info = claims.cache_info()  # pyright: ignore[reportFunctionMemberAccess]
+    assert info.hits == 2
+    assert info.misses == 2
+    assert info.size == 2
+
+
+def test_memoize_signature():
+    @memoize(max_size=1)
+    def claims(token: str, *, strict: bool = False): ...
+
+    info = scan(claims)
+
+    assert info.call is claims
+    assert [parameter.name for parameter in info.parameters] == ["token", "strict"]
+
+
+def test_memoize_ttl():
+    calls: list[str] = []
+
+    class Claims:
+        def __init__(self, sub: str):
+            self.sub = sub
+
+    @memoize(ttl=0.05)
+    def claims(token: str) -> Claims:
+        calls.append(token)
+        return Claims(token)
+
+    first = claims("a")
+    assert claims("a") is first
+
+    time.sleep(0.06)
+
+    # Expired result is recomputed even though it is still referenced
+    assert claims("a") is not first
+    assert calls == ["a", "a"]
+
+
+def test_memoize_max_size():
+    calls: list[int] = []
+
+    @memoize(max_size=1)
+    def square(value: int) -> int:
+        calls.append(value)
+        return value**2
+
+    assert [square(1), square(2), square(1)] == [1, 4, 1]
+    assert calls == [1, 2, 1]
+    assert square.cache_info().evictions == 2  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def test_memoize_max_cost():
+    @memoize(max_cost=10, cost=len)
+    def make(size: int) -> str:
+        return "x" * size
+
+    make(4)
+    make(5)
+    make(6)
+    make(11)  # Too costly to be stored
+
+    info = make.cache_info()  # pyright: ignore[reportFunctionMemberAccess]
+    assert info.size == 1
+    assert info.cost == 6
+    assert info.max_cost == 10
+
+
+def test_memoize_unhashable_arguments():
+    calls: list[list[str]] = []
+
+    @memoize
+    def permissions(roles: list[str]) -> int:
+        calls.append(roles)
+        return len(roles)
+
+    assert permissions(["admin"]) == permissions(["admin"]) == 1
+    assert len(calls) == 2
+
+
+def test_memoize_lifespan():
+    def dep():
+        yield
+
+    with pytest.raises(ValueError):
+        memoize(dep)
+
+
+def test_memoize_threads():
+    calls: list[str] = []
+    barrier = threading.Barrier(8)
+
+    @memoize
+    def compute(token: str) -> str:
+        calls.append(token)
+        time.sleep(0.01)
+        return token.upper()
+
+    def run(token: str) -> str:
+        barrier.wait()
+        return compute(token)
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(run, ["token"] * 8)) == ["TOKEN"] * 8
+
+    assert calls == ["token"]
+
+
+async def test_memoize_async_single_flight():
+    calls: list[str] = []
+
+    @memoize
+    async def claims(token: str) -> str:
+        calls.append(token)
+        await asyncio.sleep(0.01)
+        return token.upper()
+
+    async def application(value: str = from_(claims)):
+        return value
+
+    async def run() -> str:
+        async with AsyncExitStack() as stack:
+            return await ainject({"token": "token"}, scan(application), stack)
+
+    assert await asyncio.gather(*(run() for _ in range(8))) == ["TOKEN"] * 8
+    assert calls == ["token"]
+
+
+async def test_memoize_async_failure():
+    calls: list[str] = []
+
+    @memoize
+    async def claims(token: str) -> str:
+        calls.append(token)
+        await asyncio.sleep(0.01)
+        raise ValueError(token)
+
+    results = await asyncio.gather(claims("a"), claims("a"), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == ["a"]
+
+    with pytest.raises(ValueError):
+        await claims("a")
+
+    assert calls == ["a", "a"]
+
+
+async def test_memoize_async_owner_cancelled():
+    calls: list[str] = []
+    started = asyncio.Event()
+
+    @memoize
+    async def claims(token: str) -> str:
+        calls.append(token)
+        started.set()
+        await asyncio.sleep(0.01)
+        return token.upper()
+
+    owner = asyncio.create_task(claims("a"))
+    await started.wait()
+    waiter = asyncio.create_task(claims("a"))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    # Waiter is not cancelled with the owner - it computes value itself
+    assert await waiter == "A"
+    assert calls == ["a", "a"]
+    assert await claims("a") == "A"
+
+
+async def test_memoize_async_waiter_cancelled():
+    calls: list[str] = []
+    started = asyncio.Event()
+
+    @memoize
+    async def claims(token: str) -> str:
+        calls.append(token)
+        started.set()
+        await asyncio.sleep(0.01)
+        return token.upper()
+
+    owner = asyncio.create_task(claims("a"))
+    await started.wait()
+    waiter = asyncio.create_task(claims("a"))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert await owner == "A"
+    assert calls == ["a"]
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import contextvars
+from contextlib import AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor
+
+from fundi import from_, scan, ainject, blocking
+
+
+async def test_blocking_dependency():
+    loop_thread = threading.get_ident()
+
+    @blocking
+    def dep() -> int:
+        return threading.get_ident()
+
+    async def application(thread: int = from_(dep)):
+        return thread
+
+    info = scan(application)
+    assert info.parameters[0].from_ is not None
+    assert info.parameters[0].from_.blocking is True
+
+    async with AsyncExitStack() as stack:
+        assert await ainject({}, info, stack) != loop_thread
+
+
+async def test_offload_generator():
+    events: list[tuple[str, int]] = []
+
+    def dep():
+        events.append(("enter", threading.get_ident()))
+        yield "value"
+        events.append(("exit", threading.get_ident()))
+
+    async def application(value: str = from_(dep)):
+        events.append(("call", threading.get_ident()))
+        return value
+
+    with ThreadPoolExecutor(1) as executor:
+        async with AsyncExitStack() as stack:
+            result = await ainject({}, scan(application), stack, executor=executor, offload=True)
+
+            assert result == "value"
+
+    loop_thread = threading.get_ident()
+
+    assert [event for event, _ in events] == ["enter", "call", "exit"]
+    assert events[0][1] != loop_thread
+    assert events[1][1] == loop_thread
+    assert events[2][1] != loop_thread
+
+
+async def test_offload_generator_exception_awareness():
+    state = None
+
+    @blocking
+    def dep():
+        nonlocal state
+        try:
+            yield
+            state = "finished"
+        except RuntimeError:
+            state = "failed"
+
+    async def application(value: None = from_(dep)):
+        raise RuntimeError()
+
+    try:
+        async with AsyncExitStack() as stack:
+            await ainject({}, scan(application), stack)
+    except RuntimeError:
+        pass
+    else:
+        assert False
+
+    assert state == "failed"
+
+
+async def test_offload_does_not_block_loop():
+    release = threading.Event()
+
+    @blocking
+    def slow() -> bool:
+        # Released only if event loop kept running fast() meanwhile
+        return release.wait(1)
+
+    async def fast() -> str:
+        release.set()
+        return "fast"
+
+    async def application(a: bool = from_(slow), b: str = from_(fast)):
+        return a, b
+
+    async with AsyncExitStack() as stack:
+        result = await asyncio.wait_for(
+            ainject({}, scan(application), stack, concurrency=True), timeout=2
+        )
+
+    assert result == (True, "fast")
+
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="none")
+
+
+async def test_blocking_generator_context():
+    events: list[str] = []
+
+    @blocking
+    def dep():
+        token = request_id.set("request")
+        yield "dep"
+        # Teardown runs in the same context dependency was set up in
+        events.append(request_id.get())
+        request_id.reset(token)
+        events.append(request_id.get())
+
+    async def application(value: str = from_(dep)):
+        return value
+
+    with ThreadPoolExecutor(2) as executor:
+        async with AsyncExitStack() as stack:
+            assert await ainject({}, scan(application), stack, executor=executor) == "dep"
+
+    assert events == ["request", "none"]
+    assert request_id.get() == "none"
@@ -0,0 +1,80 @@
+import os
+import pickle
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from fundi import from_, scan, inject_in_pool, Overrides, CallableReference
+from fundi.pool import reference, restore
+
+
+def pid():
+    return os.getpid()
+
+
+def factor(multiplier: int):
+    return multiplier
+
+
+def report(rows: list[int], factor_: int = from_(factor), worker: int = from_(pid)):
+    return [row * factor_ for row in rows], worker
+
+
+async def areport(rows: list[int], factor_: int = from_(factor)):
+    await asyncio.sleep(0)
+    return sum(rows) * factor_
+
+
+def ten():
+    return 10
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(1) as executor:
+        yield executor
+
+
+def test_inject_in_pool(executor: ProcessPoolExecutor):
+    scope = {"rows": [1, 2], "multiplier": 3, "connection": lambda: None}
+
+    # Unused unpicklable scope value is not sent to worker
+    rows, worker = inject_in_pool(executor, scan(report), scope).result()
+
+    assert rows == [3, 6]
+    assert worker != os.getpid()
+
+
+def test_inject_in_pool_async(executor: ProcessPoolExecutor):
+    future = inject_in_pool(executor, scan(areport), {"rows": [1, 2], "multiplier": 2})
+    assert future.result() == 6
+
+
+def test_inject_in_pool_override(executor: ProcessPoolExecutor):
+    scope = {"rows": [1]}
+
+    rows, _ = inject_in_pool(executor, scan(report), scope, override={factor: 5}).result()
+    assert rows == [5]
+
+    rows, _ = inject_in_pool(executor, scan(report), scope, {factor: scan(ten)}).result()
+    assert rows == [10]
+
+    with pytest.raises(TypeError):
+        inject_in_pool(executor, scan(report), scope, Overrides({factor: None})).result()
+
+
+def test_reference():
+    ref = reference(scan(factor, caching=False))
+
+    assert ref == CallableReference(f"{__name__}:factor", use_cache=False)
+    assert pickle.loads(pickle.dumps(ref)) == ref
+    assert restore(ref) is scan(factor, caching=False)
+
+
+def test_reference_not_importable():
+    def local():
+        pass
+
+    with pytest.raises(ValueError):
+        reference(scan(local))
@@ -0,0 +1,319 @@
+import inspect
+import linecache
+import collections
+import concurrent.futures
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import (
+    from_,
+    scan,
+    inject,
+    Lazy,
+    Hooks,
+    blocking,
+    lifetime,
+    Container,
+    Overrides,
+    specialize,
+    register_hooks,
+    unregister_hooks,
+)
+from fundi.exceptions import ScopeValueNotFoundError
+
+
+def test_specialize():
+    events: list[str] = []
+
+    def settings():
+        events.append("settings")
+        return {"prefix": ">"}
+
+    def session(name: str, config: dict = from_(settings)):
+        events.append("open")
+        yield config["prefix"] + name
+        events.append("close")
+
+    class Transaction:
+        def __init__(self, session_: str = from_(session)):
+            self.session = session_
+
+        def __enter__(self):
+            events.append("begin")
+            return self.session
+
+        def __exit__(self, *exc_info):
+            events.append("commit")
+
+    def handler(
+        *args: int,
+        session_: str = from_(session),
+        transaction_: str = from_(Transaction),
+        flag: bool = False,
+        **kwargs: str,
+    ):
+        return args, session_, transaction_, flag, kwargs
+
+    info = scan(handler)
+    injector = specialize(info)
+
+    assert specialize(info) is injector
+    assert injector.__name__ in injector.__fundi_source__
+    assert inspect.getsource(injector) == injector.__fundi_source__
+
+    scope = {"name": "db", "args": (1, 2), "kwargs": {"extra": "x"}}
+
+    with ExitStack() as stack:
+        assert injector(scope, stack) == ((1, 2), ">db", ">db", False, {"extra": "x"})
+
+    assert events == ["settings", "open", "begin", "commit", "close"]
+
+    with ExitStack() as stack:
+        assert injector(scope, stack) == inject(scope, info, stack)
+
+
+def test_specialize_cache():
+    calls: list[str] = []
+
+    def settings():
+        calls.append("settings")
+        return "settings"
+
+    def uncached(config: str = from_(settings)):
+        calls.append("uncached")
+        return config
+
+    def handler(
+        config: str = from_(settings),
+        first: str = from_(uncached, caching=False),
+        second: str = from_(uncached, caching=False),
+    ):
+        return config, first, second
+
+    injector = specialize(scan(handler))
+
+    with ExitStack() as stack:
+        assert injector({}, stack) == ("settings", "settings", "settings")
+
+    assert calls == ["settings", "uncached", "uncached"]
+
+    calls.clear()
+    cache = {scan(settings).key: "cached"}
+
+    with ExitStack() as stack:
+        assert injector({}, stack, cache) == ("cached", "cached", "cached")
+
+    assert calls == ["uncached", "uncached"]
+
+
+def test_specialize_repeated():
+    calls: list[str] = []
+
+    def settings():
+        calls.append("settings")
+        return "settings"
+
+    def repository(config: str = from_(settings)):
+        calls.append("repository")
+        return "repository"
+
+    def service(repository_: str = from_(repository)):
+        calls.append("service")
+        return "service"
+
+    def handler(service_: str = from_(service), repository_: str = from_(repository)):
+        return service_, repository_
+
+    injector = specialize(scan(handler))
+
+    with ExitStack() as stack:
+        assert injector({}, stack) == ("service", "repository")
+
+    assert calls == ["settings", "repository", "service"]
+
+    # Service is known - repository is resolved after it
+    calls.clear()
+    with ExitStack() as stack:
+        assert injector({}, stack, {scan(service).key: "known"}) == ("known", "repository")
+
+    assert calls == ["settings", "repository"]
+
+
+def test_specialize_scope_errors():
+    def dependency(value: int): ...
+
+    def handler(dependency_: None = from_(dependency)): ...
+
+    with pytest.raises(ScopeValueNotFoundError), ExitStack() as stack:
+        specialize(scan(handler))({}, stack)
+
+    async def async_dependency(): ...
+
+    def async_handler(dependency_: None = from_(async_dependency)): ...
+
+    with pytest.raises(RuntimeError):
+        specialize(scan(async_handler))
+
+
+def test_specialize_scope_mapping():
+    def handler(value: str = "default"):
+        return value
+
+    scope = collections.defaultdict(lambda: "missing")
+
+    # Missing value is not taken from mapping that produces values for missing keys
+    with ExitStack() as stack:
+        assert specialize(scan(handler))(scope, stack) == "default"
+        assert inject(scope, scan(handler), stack) == "default"
+
+
+def test_specialize_dependency_name():
+    class Dependency:
+        def __call__(self) -> str:
+            return "value"
+
+        def __repr__(self) -> str:
+            return "Dependency(\n    broken\n)"
+
+    def handler(value: str = from_(Dependency())):
+        return value
+
+    with ExitStack() as stack:
+        assert specialize(scan(handler))({}, stack) == "value"
+
+
+def test_specialize_override_and_container():
+    calls: list[str] = []
+
+    @lifetime("singleton")
+    def engine():
+        calls.append("engine")
+        return "engine"
+
+    def database():
+        return "database"
+
+    def replacement():
+        return "replacement"
+
+    def handler(
+        engine_: str = from_(engine),
+        database_: str = from_(database),
+        lazy: Lazy[str] = from_(database),
+    ):
+        return engine_, database_, lazy.get()
+
+    info = scan(handler)
+
+    with ExitStack() as stack:
+        assert specialize(info, override={engine: "value"})({}, stack) == (
+            "value",
+            "database",
+            "database",
+        )
+
+    injector = specialize(info, override={database: scan(replacement)})
+    assert injector is not specialize(info)
+
+    # Injectors with overrides are cached too, by overriding values
+    sources = len(linecache.cache)
+    assert specialize(info, override={database: scan(replacement)}) is injector
+    assert specialize(info, override=Overrides({database: scan(replacement)})) is injector
+    assert len(linecache.cache) == sources
+
+    with Container() as container:
+        for _ in range(2):
+            with ExitStack() as stack:
+                assert injector({}, stack, container=container) == (
+                    "engine",
+                    "replacement",
+                    "replacement",
+                )
+
+    assert calls == ["engine"]
+
+
+def test_specialize_deep_graph():
+    def dependency_0(value: int):
+        return value
+
+    dependencies = [dependency_0]
+    for level in range(1, 120):
+
+        def dependency(previous: int = from_(dependencies[-1])):
+            return previous + 1
+
+        dependencies.append(dependency)
+
+    with ExitStack() as stack:
+        assert specialize(scan(dependencies[-1]))({"value": 0}, stack) == 119
+
+
+def test_specialize_hooks():
+    started: list[str] = []
+
+    class Recorder(Hooks):
+        def on_call_start(self, info, values):
+            started.append(info.call.__name__)
+
+    def dependency():
+        return 1
+
+    def handler(value: int = from_(dependency)):
+        return value
+
+    injector = specialize(scan(handler))
+    recorder = Recorder()
+
+    register_hooks(recorder)
+    try:
+        with ExitStack() as stack:
+            assert injector({}, stack) == 1
+    finally:
+        unregister_hooks(recorder)
+
+    assert started == ["dependency", "handler"]
+
+
+async def test_specialize_async():
+    events: list[str] = []
+
+    async def client():
+        events.append("open")
+        yield "client"
+        events.append("close")
+
+    class Connection:
+        def __init__(self, client_: str = from_(client)):
+            self.client = client_
+
+        async def __aenter__(self):
+            return self.client + " connection"
+
+        async def __aexit__(self, *exc_info):
+            events.append("disconnect")
+
+    @blocking
+    def read_file(path: str):
+        return f"read {path}"
+
+    async def handler(
+        connection_: str = from_(Connection),
+        content: str = from_(read_file),
+        lazy: Lazy[str] = from_(client),
+    ):
+        return connection_, content, await lazy
+
+    info = scan(handler)
+    injector = specialize(info, async_=True)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        async with AsyncExitStack() as stack:
+            assert await injector({"path": "file"}, stack, executor=executor) == (
+                "client connection",
+                "read file",
+                "client",
+            )
+
+    assert events == ["open", "disconnect", "close"]
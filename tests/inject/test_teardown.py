@@ -0,0 +1,261 @@
+import asyncio
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, blocking, Lazy
+from fundi.teardown import Teardown, GENERATOR, CALLBACK, _on_top
+
+
+class CountingStack(ExitStack):
+    def __init__(self):
+        super().__init__()
+        self.pushes = 0
+
+    def push(self, exit):
+        self.pushes += 1
+        return super().push(exit)
+
+
+def test_teardown_pushed_once():
+    events: list[str] = []
+
+    def make(name: str):
+        def dependency():
+            events.append(f"open {name}")
+            yield name
+            events.append(f"close {name}")
+
+        return dependency
+
+    first, second, third = make("first"), make("second"), make("third")
+
+    def handler(
+        first_: str = from_(first),
+        second_: str = from_(second),
+        third_: str = from_(third),
+    ):
+        return first_, second_, third_
+
+    with CountingStack() as stack:
+        assert inject({}, scan(handler), stack) == ("first", "second", "third")
+        assert stack.pushes == 1
+
+        stack.callback(events.append, "callback")
+
+        # The next injection is torn down before everything pushed earlier
+        assert inject({}, scan(first), stack) == "first"
+        assert stack.pushes == 2
+
+    assert events == [
+        "open first",
+        "open second",
+        "open third",
+        "open first",
+        "close first",
+        "callback",
+        "close third",
+        "close second",
+        "close first",
+    ]
+
+
+@pytest.mark.parametrize("stack", [ExitStack(), AsyncExitStack()])
+def test_teardown_exit_stack_layout(stack: ExitStack | AsyncExitStack):
+    # Segments are found on top of exit stack by its private entries,
+    # this fails loudly if their layout changes
+    assert hasattr(stack, "_exit_callbacks")
+
+    teardown = Teardown(stack)
+    teardown.add(CALLBACK, (print, (), {}))
+    segment = teardown.segment
+
+    assert segment is not None
+    assert _on_top(stack, segment)
+
+    teardown.add(CALLBACK, (print, (), {}))
+    assert teardown.segment is segment
+
+    stack.callback(print)
+    assert not _on_top(stack, segment)
+
+    teardown.add(CALLBACK, (print, (), {}))
+    assert teardown.segment is not segment
+
+    stack.pop_all()
+
+
+def test_teardown_interleaved_with_stack():
+    events: list[str] = []
+
+    with ExitStack() as stack:
+
+        def a():
+            yield "a"
+            events.append("exit a")
+
+        def b(a_: str = from_(a)):
+            stack.callback(events.append, "cb b")
+            return "b"
+
+        def c(b_: str = from_(b)):
+            yield "c"
+            events.append("exit c")
+
+        assert inject({}, scan(c), stack) == "c"
+
+    # Records are unwound as if every one of them was pushed onto exit stack separately
+    assert events == ["exit c", "cb b", "exit a"]
+
+
+async def test_teardown_interleaved_with_async_stack():
+    events: list[str] = []
+
+    async with AsyncExitStack() as stack:
+
+        async def a():
+            yield "a"
+            events.append("exit a")
+
+        async def b(a_: str = from_(a)):
+            stack.push_async_callback(asyncio.sleep, 0)
+            stack.callback(events.append, "cb b")
+            return "b"
+
+        def c(b_: str = from_(b)):
+            yield "c"
+            events.append("exit c")
+
+        assert await ainject({}, scan(c), stack) == "c"
+
+    assert events == ["exit c", "cb b", "exit a"]
+
+
+def test_teardown_no_lifespan():
+    def handler():
+        return 1
+
+    with CountingStack() as stack:
+        assert inject({}, scan(handler), stack) == 1
+        assert stack.pushes == 0
+
+
+def test_teardown_exception_rules():
+    events: list[str] = []
+
+    def swallowing():
+        try:
+            yield "swallowing"
+        except ValueError:
+            events.append("swallowed")
+
+    def failing():
+        try:
+            yield "failing"
+        finally:
+            raise KeyError("teardown")
+
+    def handler(swallowing_: str = from_(swallowing), failing_: str = from_(failing)):
+        raise ValueError("handler")
+
+    # Lifespan dependencies can not suppress exceptions
+    with pytest.raises(ValueError), ExitStack() as stack:
+        inject({}, scan(swallowing), stack)
+        raise ValueError("body")
+
+    # Exception raised on teardown replaces the one teardown started with
+    with pytest.raises(KeyError) as info, ExitStack() as stack:
+        inject({}, scan(handler), stack)
+
+    assert isinstance(info.value.__context__, ValueError)
+    assert events == ["swallowed"]
+
+
+def test_teardown_lazy_order():
+    events: list[str] = []
+
+    def connection():
+        events.append("connect")
+        yield "connection"
+        events.append("disconnect")
+
+    def client(lazy: Lazy[str] = from_(connection)):
+        events.append("client")
+        yield lazy.get()
+        events.append("close client")
+
+    def transaction(client_: str = from_(client)):
+        events.append("begin")
+        yield client_
+        events.append("commit")
+
+    def handler(transaction_: str = from_(transaction)):
+        return transaction_
+
+    # Lazy dependency resolved while client is set up outlives it
+    with ExitStack() as stack:
+        assert inject({}, scan(handler), stack) == "connection"
+
+    assert events == [
+        "client",
+        "connect",
+        "begin",
+        "commit",
+        "close client",
+        "disconnect",
+    ]
+
+
+def test_teardown_standalone():
+    events: list[str] = []
+
+    def generator():
+        yield
+        events.append("closed")
+
+    teardown = Teardown()
+    teardown.callback(events.append, "callback")
+
+    value = generator()
+    next(value)
+    teardown.add(GENERATOR, value)
+
+    with teardown:
+        pass
+
+    assert events == ["closed", "callback"]
+    assert teardown.records == []
+
+
+@pytest.mark.parametrize("concurrency", [False, True])
+async def test_teardown_async(concurrency: bool):
+    events: list[str] = []
+
+    async def session():
+        events.append("open session")
+        yield "session"
+        events.append("close session")
+
+    @blocking
+    def file():
+        events.append("open file")
+        yield "file"
+        events.append("close file")
+
+    def settings():
+        events.append("open settings")
+        yield "settings"
+        events.append("close settings")
+
+    async def handler(
+        session_: str = from_(session),
+        file_: str = from_(file),
+        settings_: str = from_(settings),
+    ):
+        return session_, file_, settings_
+
+    async with AsyncExitStack() as stack:
+        result = await ainject({}, scan(handler), stack, concurrency=concurrency)
+        assert result == ("session", "file", "settings")
+
+    assert events[3:] == ["close settings", "close file", "close session"]
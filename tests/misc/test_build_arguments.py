@@ -54,3 +54,29 @@ def test_varkw():
 
     assert args == ()
     assert kwargs == {"arg": 1, "arg2": "1"}
+
+
+def test_mixed():
+    def dep(a: int, /, b: int, *args: int, c: int, **kwargs: int): ...
+
+    info = scan(dep)
+
+    args, kwargs = info.build_arguments(
+        {"a": 1, "b": 2, "args": (3, 4), "c": 5, "kwargs": {"d": 6}}
+    )
+
+    assert args == (1, 2, 3, 4)
+    assert kwargs == {"c": 5, "d": 6}
+
+
+def test_missing_value():
+    def dep(arg: int, *, arg2: str): ...
+
+    info = scan(dep)
+
+    try:
+        info.build_arguments({"arg": 1})
+    except ValueError as exc:
+        assert str(exc) == 'Value for "arg2" parameter not found'
+    else:
+        assert False
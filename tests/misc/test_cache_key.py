@@ -0,0 +1,71 @@
+from contextlib import ExitStack
+
+import pytest
+
+from fundi import from_, scan, inject
+from fundi.types import CacheKey
+
+
+class Colliding:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __hash__(self) -> int:
+        return 1
+
+    def __call__(self) -> str:
+        return self.name
+
+
+def test_interned():
+    def dep(): ...
+
+    assert CacheKey(dep) is CacheKey(dep)
+    assert scan(dep).key is scan(dep, caching=False).key
+
+
+def test_immutable():
+    def dep(): ...
+
+    key = CacheKey(dep)
+
+    with pytest.raises(AttributeError):
+        key.items = ()
+
+
+def test_colliding_hashes():
+    first, second = Colliding("first"), Colliding("second")
+
+    assert hash(CacheKey(first)) == hash(CacheKey(second))
+    assert CacheKey(first) != CacheKey(second)
+    assert scan(first) != scan(second)
+
+    def application(a: str = from_(first), b: str = from_(second)):
+        return a, b
+
+    with ExitStack() as stack:
+        assert inject({}, scan(application), stack) == ("first", "second")
+
+
+def test_unhashable_dependency():
+    calls: list[str] = []
+
+    class Unhashable:
+        __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+        def __call__(self) -> str:
+            calls.append("dep")
+            return "value"
+
+    dep = Unhashable()
+
+    assert CacheKey(dep) == CacheKey(dep)
+    assert CacheKey(dep) != CacheKey(Unhashable())
+
+    def application(a: str = from_(dep), b: str = from_(dep)):
+        return a, b
+
+    with ExitStack() as stack:
+        assert inject({}, scan(application), stack) == ("value", "value")
+
+    assert calls == ["dep"]
@@ -268,3 +268,48 @@ def test_scan_varkw():
     info = scan(dep)
 
     assert info.parameters == [Parameter("kwargs", int, None, keyword_varying=True)]
+
+
+def test_scan_signature_from_code():
+    def dep(): ...
+
+    def func(
+        a: int,
+        b,
+        /,
+        c: str = "c",
+        *args: int,
+        d: "Undefined",  # noqa: F821
+        e=from_(dep),
+        **kwargs: float,
+    ) -> bool: ...
+
+    info = scan(func)
+    signature = inspect.signature(func)
+
+    assert [parameter.name for parameter in info.parameters] == list(signature.parameters)
+    assert [parameter.annotation for parameter in info.parameters] == [
+        parameter.annotation for parameter in signature.parameters.values()
+    ]
+    assert info.return_annotation is bool
+
+    a, b, c, args, d, e, kwargs = info.parameters
+    assert a.positional_only and b.positional_only and not c.positional_only
+    assert c.has_default and c.default == "c"
+    assert not a.has_default and not d.has_default
+    assert args.positional_varying and kwargs.keyword_varying
+    assert d.keyword_only and e.keyword_only
+    assert e.from_ is scan(dep)
+
+
+def test_scan_signature_of_wrapped():
+    def func(a: int, b: str): ...
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    info = scan(wrapper)
+
+    assert [parameter.name for parameter in info.parameters] == ["a", "b"]
+    assert not info.parameters[0].positional_varying
@@ -0,0 +1,72 @@
+import gc
+import inspect
+
+from fundi import scan, from_
+from fundi.scan import _registry
+
+
+def test_scan_reuses_info():
+    def dep(arg: int): ...
+
+    assert scan(dep) is scan(dep)
+    assert scan(dep, caching=False) is scan(dep, caching=False)
+
+    assert scan(dep).use_cache is True
+    assert scan(dep, caching=False).use_cache is False
+    assert scan(dep, caching=False) is not scan(dep)
+
+
+def test_from_reuses_info():
+    def dep(): ...
+
+    assert from_(dep) is from_(dep)
+    assert from_(dep, caching=False) is from_(dep, caching=False)
+
+
+def test_scan_variants_share_identity():
+    def dep(): ...
+
+    uncached = scan(dep, caching=False)
+
+    assert uncached == scan(dep)
+    assert uncached.with_caching(True) is scan(dep)
+    assert scan(dep).with_caching(False) is uncached
+
+
+def test_scan_registry(monkeypatch):
+    class Service:
+        def method(self, arg: int) -> int:
+            return arg
+
+    service = Service()
+
+    calls = 0
+    signature = inspect.signature
+
+    def counting_signature(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return signature(*args, **kwargs)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+
+    # Bound methods do not allow setting attributes
+    info = scan(service.method)
+
+    assert scan(service.method) is info
+    assert scan(service.method, caching=False) is info.with_caching(False)
+    assert calls == 1
+
+    assert scan(len) is scan(len)
+
+
+def test_scan_registry_releases_info():
+    class Service:
+        def method(self): ...
+
+    service = Service()
+
+    scan(service.method)
+    gc.collect()
+
+    assert service.method not in _registry
@@ -0,0 +1,48 @@
+import typing
+from contextlib import ExitStack
+
+from fundi import scan, inject, FromType, normalize_annotation
+
+
+class Session:
+    pass
+
+
+def test_type_options_computed_on_scan():
+    def func(session: FromType[Session], name: str): ...
+
+    session, name = scan(func).parameters
+
+    assert session.type_options == (Session,)
+    assert name.type_options is None
+
+
+def test_normalize_annotation_interned():
+    assert normalize_annotation(int | str) is normalize_annotation(int | str)
+    assert normalize_annotation(typing.Optional[Session]) == (Session,)
+
+
+def test_forward_reference_resolved_lazily():
+    def func(client: FromType["Client"]):
+        return client
+
+    info = scan(func)
+    (parameter,) = info.parameters
+
+    assert parameter.type_options is None
+
+    # Defined after dependant, so it can be resolved only on injection
+    global Client
+
+    class Client:
+        pass
+
+    try:
+        client = Client()
+
+        with ExitStack() as stack:
+            assert inject({"_": client}, info, stack) is client
+
+        assert parameter.type_options == (Client,)
+    finally:
+        del Client
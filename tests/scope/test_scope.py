@@ -0,0 +1,81 @@
+import abc
+import collections.abc
+from contextlib import ExitStack
+
+from fundi import Scope, FromType, Parameter, from_, scan, inject, resolve
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class Interface(abc.ABC):
+    pass
+
+
+class Implementation:
+    pass
+
+
+Interface.register(Implementation)
+
+
+def test_scope_mapping():
+    scope = Scope({"a": 1}, b=2)
+
+    assert isinstance(scope, collections.abc.Mapping)
+    assert dict(scope) == {"a": 1, "b": 2}
+    assert scope["a"] == 1
+    assert "b" in scope
+    assert len(scope) == 2
+
+
+def test_find_by_type_first_match():
+    child = Child()
+    base = Base()
+
+    scope = Scope({"base": base, "child": child})
+
+    assert scope.find_by_type((Child,)) == (True, child)
+    assert scope.find_by_type((Base,)) == (True, base)
+    assert scope.find_by_type((Child, Base)) == (True, base)
+    assert scope.find_by_type((int,)) == (False, None)
+
+
+def test_find_by_type_virtual_subclass():
+    implementation = Implementation()
+
+    scope = Scope({"number": 1, "implementation": implementation})
+
+    assert scope.find_by_type((Interface,)) == (True, implementation)
+    assert scope.find_by_type((collections.abc.Hashable,)) == (True, 1)
+
+
+def test_resolve_with_scope():
+    child = Child()
+
+    def func(value: FromType[Base], number: int): ...
+
+    for result in resolve(Scope({"number": 1, "child": child}), scan(func), {}):
+        if result.parameter.name == "value":
+            assert result.value is child
+
+        if result.parameter.name == "number":
+            assert result.value == 1
+
+
+def test_inject_with_scope():
+    child = Child()
+
+    def dep(value: FromType[Base], parameter: FromType[Parameter]):
+        return value, parameter.name
+
+    def application(arg: tuple[Child, str] = from_(dep)):
+        return arg
+
+    with ExitStack() as stack:
+        assert inject(Scope(child=child), scan(application), stack) == (child, "arg")
@@ -0,0 +1,64 @@
+import collections.abc
+from contextlib import ExitStack
+
+from fundi import from_, scan, inject, tree, FromType, Parameter
+from fundi.scope import ScopeLayer, bind_parameter
+
+
+def test_layer_mapping():
+    scope = {"a": 1, "b": 2}
+    layer = ScopeLayer(scope, "c", 3)
+
+    assert isinstance(layer, collections.abc.Mapping)
+    assert dict(layer) == {"a": 1, "b": 2, "c": 3}
+    assert list(layer) == ["a", "b", "c"]
+    assert len(layer) == 3
+    assert layer["c"] == 3
+    assert layer.get("a") == 1
+    assert layer.get("missing", "default") == "default"
+
+
+def test_layer_replaces_value_in_place():
+    layer = ScopeLayer({"a": 1, "b": 2}, "a", 3)
+
+    assert dict(layer) == {"a": 3, "b": 2}
+    assert list(layer.values()) == [3, 2]
+    assert len(layer) == 2
+
+    assert layer.find_by_type((int,)) == (True, 3)
+
+
+def test_bind_parameter_does_not_stack():
+    scope = {"a": 1}
+
+    layer = bind_parameter(bind_parameter(scope, "first"), "second")
+
+    assert isinstance(layer, ScopeLayer)
+    assert layer.scope is scope
+    assert layer["__fundi_parameter__"] == "second"
+
+
+def test_dependency_parameter_awareness():
+    def dep(value: int, parameter: FromType[Parameter]):
+        return value, parameter.name
+
+    def application(arg: tuple[int, str] = from_(dep)):
+        return arg
+
+    scope = {"value": 1}
+
+    with ExitStack() as stack:
+        assert inject(scope, scan(application), stack) == (1, "arg")
+
+    assert scope == {"value": 1}
+
+
+def test_tree_with_layers():
+    def dep(value: int):
+        return value
+
+    def application(arg: int = from_(dep)): ...
+
+    result = tree({"value": 1}, scan(application))
+
+    assert result["values"]["arg"] == {"call": dep, "values": {"value": 1}}
@@ -1,8 +1,12 @@
+import gc
+import time
 import functools
 import inspect
 import warnings
 
-from fundi import configurable_dependency, MutableConfigurationWarning
+import pytest
+
+from fundi import configurable_dependency, CacheInfo, MutableConfigurationWarning
 from fundi.util import get_configuration, is_configured
 
 
@@ -55,3 +59,102 @@ def test_configurable_dependency_mutable_argument():
     assert config.configurator.call is origin
 
     assert config.values == {"permissions": ("permission",)}
+
+
+def test_configurable_dependency_max_size():
+    @configurable_dependency(max_size=2)
+    def factory(value: int):
+        def checker(): ...
+
+        return checker
+
+    first = factory(1)
+    factory(2)
+    factory(3)
+
+    info = factory.cache_info()  # pyright: ignore[reportFunctionMemberAccess]
+    assert info.size == 2
+    assert info.max_size == 2
+    assert info.misses == 3
+    assert info.evictions == 1
+
+    # Evicted dependency is still in use - it keeps its identity
+    assert factory(1) is first
+    assert factory.cache_info().hits == 1  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def test_configurable_dependency_evicted_unused():
+    calls: list[int] = []
+
+    @configurable_dependency(max_size=1)
+    def factory(value: int):
+        calls.append(value)
+
+        def checker(): ...
+
+        return checker
+
+    factory(1)
+    factory(2)
+    gc.collect()
+    factory(1)
+
+    assert calls == [1, 2, 1]
+
+
+def test_configurable_dependency_ttl():
+    calls: list[int] = []
+
+    @configurable_dependency(ttl=0.01)
+    def factory(value: int):
+        calls.append(value)
+
+        def checker(): ...
+
+        return checker
+
+    factory(1)
+    time.sleep(0.02)
+    factory(1)
+
+    assert calls == [1, 1]
+    assert factory.cache_info().evictions == 1  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def test_configurable_dependency_weak():
+    @configurable_dependency(weak=True)
+    def factory(value: int):
+        def checker(): ...
+
+        return checker
+
+    dependency = factory(1)
+    assert factory(1) is dependency
+    assert factory.cache_info().size == 1  # pyright: ignore[reportFunctionMemberAccess]
+
+    del dependency
+    gc.collect()
+
+    assert factory.cache_info().size == 0  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def test_configurable_dependency_cache_clear():
+    @configurable_dependency
+    def factory(value: int):
+        def checker(): ...
+
+        return checker
+
+    factory(1)
+    factory(1)
+    assert factory.cache_info().hits == 1  # pyright: ignore[reportFunctionMemberAccess]
+
+    factory.cache_clear()  # pyright: ignore[reportFunctionMemberAccess]
+    assert factory.cache_info() == CacheInfo(  # pyright: ignore[reportFunctionMemberAccess]
+        hits=0, misses=0, evictions=0, size=0, max_size=None
+    )
+
+
+def test_configurable_dependency_invalid_options():
+    with pytest.raises(ValueError):
+        configurable_dependency(weak=True, max_size=1)
@@ -0,0 +1,109 @@
+import time
+import asyncio
+import functools
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, profile, Profile
+from fundi.util import callable_str
+
+
+def session():
+    yield "session"
+    time.sleep(0.01)
+
+
+def user(value: str = from_(session)):
+    time.sleep(0.01)
+    return "user"
+
+
+def application(a: str = from_(user), b: str = from_(session)):
+    return a + b
+
+
+def test_profile():
+    with profile() as profiler:
+        for _ in range(3):
+            with ExitStack() as stack:
+                inject({}, scan(application), stack)
+
+    assert profiler.injections == 3
+
+    stats = {stats.call: stats for stats in profiler.stats()}
+    assert stats.keys() == {application, user, session}
+
+    assert stats[session].calls == 3
+    assert stats[session].hits == 3
+    assert stats[session].hit_ratio == 0.5
+    assert stats[session].teardown_time >= 0.03
+
+    assert stats[user].calls == 3
+    assert stats[user].hit_ratio == 0
+    assert stats[user].self_time >= 0.03
+    assert stats[user].cumulative_time >= stats[user].self_time
+
+    assert stats[application].cumulative_time >= stats[user].cumulative_time
+
+    assert profiler.stats()[0].call is application
+    assert profiler.stats("teardown_time")[0].call is session
+
+    report = profiler.report().splitlines()
+    assert report[0] == "3 profiled injections"
+    assert report[2].endswith(callable_str(application))
+    assert len(profiler.report(limit=1).splitlines()) == 3
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack)
+
+    assert profiler.injections == 3
+
+
+@pytest.mark.parametrize("concurrency", [False, True])
+async def test_profile_async(concurrency: bool):
+    async def client():
+        await asyncio.sleep(0.01)
+        return "client"
+
+    async def handler(value: str = from_(client)):
+        return value
+
+    profiler = Profile()
+
+    async with AsyncExitStack() as stack:
+        await ainject({}, scan(handler), stack, hooks=profiler, concurrency=concurrency)
+
+    stats = {stats.call: stats for stats in profiler.stats()}
+
+    assert stats[client].calls == 1
+    assert stats[client].self_time >= 0.01
+    assert stats[handler].cumulative_time >= 0.01
+
+
+def test_profile_report_partial():
+    def dependency(value: int):
+        return value
+
+    def handler(value: int = from_(functools.partial(dependency, 1))):
+        return value
+
+    profiler = Profile()
+
+    with ExitStack() as stack:
+        assert inject({}, scan(handler), stack, hooks=profiler) == 1
+
+    assert "functools.partial" in profiler.report()
+
+
+def test_profile_sample_rate():
+    profiler = Profile(sample_rate=0)
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack, hooks=profiler)
+
+    assert profiler.injections == 0
+    assert profiler.stats() == []
+
+    with pytest.raises(ValueError):
+        Profile(sample_rate=2)
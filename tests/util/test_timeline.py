@@ -0,0 +1,128 @@
+import json
+import asyncio
+import functools
+from contextlib import ExitStack, AsyncExitStack
+
+import pytest
+
+from fundi import from_, scan, inject, ainject, Timeline
+
+
+def session():
+    yield "session"
+
+
+def user(value: str = from_(session)):
+    return "user"
+
+
+def application(a: str = from_(user), b: str = from_(session)):
+    return a + b
+
+
+def spans(trace: dict) -> dict[str, dict]:
+    return {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+
+
+def test_timeline(tmp_path):
+    timeline = Timeline()
+
+    with ExitStack() as stack:
+        inject({}, scan(application), stack, hooks=timeline)
+
+    trace = timeline.chrome_trace()
+    events = spans(trace)
+
+    assert events.keys() == {
+        "application",
+        "call application",
+        "user",
+        "call user",
+        "session",
+        "call session",
+        "teardown session",
+    }
+
+    # Sequential injection nests on single track
+    assert {event["tid"] for event in events.values()} == {0}
+
+    application_span, user_span = events["application"], events["user"]
+    assert application_span["ts"] <= user_span["ts"]
+    assert user_span["ts"] + user_span["dur"] <= application_span["ts"] + application_span["dur"]
+    assert events["teardown session"]["ts"] >= application_span["ts"] + application_span["dur"]
+
+    hits = [event["name"] for event in trace["traceEvents"] if event["ph"] == "i"]
+    assert hits == ["cache hit session"]
+
+    path = tmp_path / "trace.json"
+    timeline.dump(path)
+    assert json.loads(path.read_text()) == trace
+
+
+def test_timeline_unnamed_callables():
+    class Greeting:
+        def __call__(self, name: str) -> str:
+            return "hello " + name
+
+    def lookup(key: str) -> str:
+        return key
+
+    greeting = Greeting()
+    name = functools.partial(lookup, "name")
+
+    def handler(text: str = from_(greeting), first: str = from_(name), second: str = from_(name)):
+        return text, first, second
+
+    timeline = Timeline()
+
+    with ExitStack() as stack:
+        result = inject({"name": "world"}, scan(handler), stack, hooks=timeline)
+
+    assert result == ("hello world", "name", "name")
+
+    trace = timeline.chrome_trace()
+    assert {repr(greeting), repr(name)} < spans(trace).keys()
+
+    hits = [event["name"] for event in trace["traceEvents"] if event["ph"] == "i"]
+    assert hits == [f"cache hit {name!r}"]
+
+
+async def first():
+    await asyncio.sleep(0.01)
+
+
+async def second():
+    await asyncio.sleep(0.01)
+
+
+async def handler(a: None = from_(first), b: None = from_(second)): ...
+
+
+async def test_timeline_concurrent():
+    timeline = Timeline()
+
+    async with AsyncExitStack() as stack:
+        await ainject({}, scan(handler), stack, hooks=timeline, concurrency=True)
+
+    events = spans(timeline.chrome_trace())
+
+    # Overlapping calls are put on separate tracks
+    assert events["call first"]["tid"] != events["call second"]["tid"]
+
+
+def failing():
+    raise ValueError("failed")
+
+
+def dependant(value: None = from_(failing)): ...
+
+
+def test_timeline_error():
+    timeline = Timeline()
+
+    with pytest.raises(ValueError), ExitStack() as stack:
+        inject({}, scan(dependant), stack, hooks=timeline)
+
+    events = spans(timeline.chrome_trace())
+    assert events["call failing"]["args"] == {"error": "ValueError('failed')"}
+    assert "dependant" not in events
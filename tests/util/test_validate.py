@@ -0,0 +1,94 @@
+import pytest
+
+from fundi import FromType, from_, scan, validate, warmup, lifetime, Lazy
+from fundi.exceptions import (
+    AsyncDependencyError,
+    GraphValidationError,
+    CyclicDependencyError,
+    ScopeValueNotFoundError,
+)
+
+
+class Request:
+    pass
+
+
+class Settings:
+    pass
+
+
+def test_validate():
+    def first(value: int = 0): ...
+
+    def second(value: int = from_(first)): ...
+
+    # Make first depend on second
+    scan(first).parameters[0].from_ = scan(second)
+
+    async def client(settings: FromType[Settings]): ...
+
+    def user(request: FromType[Request], user_id: int, page: int = 1): ...
+
+    def handler(
+        cycle: None = from_(second),
+        client_: None = from_(client),
+        user_: None = from_(user),
+        request_: Request = from_(Request),
+    ): ...
+
+    problems = validate(handler, scope={"request": Request}, async_=False)
+
+    assert [type(problem) for problem in problems] == [
+        CyclicDependencyError,
+        AsyncDependencyError,
+        ScopeValueNotFoundError,
+        ScopeValueNotFoundError,
+    ]
+    assert [item.call for item in problems[0].cycle] == [second, first, second]
+    assert problems[1].info.call is client
+    assert (problems[2].parameter, problems[2].info.call) == ("settings", client)
+    assert (problems[3].parameter, problems[3].info.call) == ("user_id", user)
+
+    assert validate(user, scope={"request": Request, "user_id": int}) == []
+    assert validate(client) == []
+
+
+def test_validate_override():
+    def dependency(value: int): ...
+
+    def replacement(other: int): ...
+
+    def handler(value: None = from_(dependency)): ...
+
+    assert validate(handler, scope={}, override={dependency: 1}) == []
+
+    problems = validate(handler, scope={"value": int}, override={dependency: scan(replacement)})
+    assert [problem.parameter for problem in problems] == ["other"]
+
+
+def test_warmup():
+    @lifetime("singleton")
+    def engine(): ...
+
+    def session(engine_: None = from_(engine)): ...
+
+    def handler(session_: Lazy[None] = from_(session)): ...
+
+    info = scan(handler)
+    assert warmup(handler) == [info]
+
+    assert info.plan is not None
+    assert scan(session).plan is not None
+    assert scan(engine).plan is not None
+
+
+def test_warmup_invalid():
+    async def dependency(): ...
+
+    def handler(value: None = from_(dependency), other: int = from_(dependency)): ...
+
+    with pytest.raises(GraphValidationError) as info:
+        warmup(handler, async_=False)
+
+    assert len(info.value.problems) == 1
+    assert scan(handler).plan is None